@@ -1,8 +1,9 @@
 """FastAPI dependencies."""
 from typing import Annotated
-from fastapi import HTTPException, status, Depends
+from fastapi import HTTPException, Header, status, Depends
 
 from app.core.exceptions import SessionNotFoundError
+from app.core.profiler import request_profiler
 from app.core.session_manager import session_manager
 from app.types.session import Session
 
@@ -38,3 +39,18 @@ def get_session_from_request_body(request) -> Session:
         )
     return session
 
+
+def require_profiling_token(
+    x_profile_token: Annotated[str | None, Header()] = None,
+) -> None:
+    """Dependency guarding admin profiling endpoints with the profiling token."""
+    if not request_profiler.enabled:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="Profiling is disabled",
+        )
+    if not request_profiler.authorized(x_profile_token):
+        raise HTTPException(
+            status_code=status.HTTP_403_FORBIDDEN,
+            detail="Invalid profiling token",
+        )
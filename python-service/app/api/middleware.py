@@ -0,0 +1,164 @@
+"""ASGI middleware."""
+import math
+import time
+
+from fastapi.responses import ORJSONResponse
+from starlette.datastructures import Headers, MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.admission import AdmissionController, admission_controller
+from app.core.exceptions import AdmissionRejectedError
+from app.core.metrics import http_request_seconds
+from app.core.profiler import RequestProfiler, request_profiler
+from app.utils.logger import new_request_id, request_id_var
+
+PROFILE_TOKEN_HEADER = "x-profile-token"
+REQUEST_ID_HEADER = "x-request-id"
+# Longer client-supplied IDs are replaced rather than logged
+MAX_REQUEST_ID_LENGTH = 128
+
+
+class RequestIdMiddleware:
+    """
+    Tags each request with an ID, taken from the `X-Request-ID` header or
+    generated, so every log record written while serving it can be
+    correlated. The ID is echoed back in the response headers.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        request_id = Headers(scope=scope).get(REQUEST_ID_HEADER)
+        if not request_id or len(request_id) > MAX_REQUEST_ID_LENGTH:
+            request_id = new_request_id()
+
+        async def send_with_request_id(message: Message) -> None:
+            if message["type"] == "http.response.start":
+                MutableHeaders(scope=message)[REQUEST_ID_HEADER] = request_id
+            await send(message)
+
+        token = request_id_var.set(request_id)
+        try:
+            await self.app(scope, receive, send_with_request_id)
+        finally:
+            request_id_var.reset(token)
+
+
+class MetricsMiddleware:
+    """
+    Records request latency per route template. Written as plain ASGI
+    rather than BaseHTTPMiddleware so it adds no extra task or response
+    buffering per request.
+    """
+
+    def __init__(self, app: ASGIApp):
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            # The router stores the matched route; label by its template so
+            # session IDs in paths don't explode label cardinality
+            route = scope.get("route")
+            http_request_seconds.labels(
+                scope["method"],
+                route.path if route is not None else "unmatched",
+                str(status_code),
+            ).observe(time.perf_counter() - started)
+
+
+class AdmissionMiddleware:
+    """
+    Applies the admission limits of the request's route class. Requests are
+    admitted or rejected before their body is read, so a rejection costs
+    next to nothing; the slot is held until the response has been sent.
+    """
+
+    def __init__(self, app: ASGIApp, controller: AdmissionController | None = None):
+        self.app = app
+        self.controller = controller or admission_controller
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        limiter = (
+            self.controller.limiter_for(scope["path"])
+            if scope["type"] == "http"
+            else None
+        )
+        if limiter is None:
+            await self.app(scope, receive, send)
+            return
+
+        try:
+            async with limiter.admit():
+                await self.app(scope, receive, send)
+        except AdmissionRejectedError as e:
+            response = ORJSONResponse(
+                {"detail": str(e)},
+                status_code=503,
+                headers={"Retry-After": str(math.ceil(e.retry_after))},
+            )
+            await response(scope, receive, send)
+
+
+class ProfilingMiddleware:
+    """
+    Profiles requests that carry a valid `X-Profile-Token` header, returning
+    the profile's ID in `X-Profile-Id`, and samples every Nth request into
+    the rolling profile. Inert unless a profiling token is configured.
+    """
+
+    def __init__(self, app: ASGIApp, profiler: RequestProfiler | None = None):
+        self.app = app
+        self.profiler = profiler or request_profiler
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        profiler = self.profiler
+        if (
+            scope["type"] != "http"
+            or not profiler.enabled
+            or scope["path"].startswith("/admin")
+        ):
+            await self.app(scope, receive, send)
+            return
+
+        token = Headers(scope=scope).get(PROFILE_TOKEN_HEADER)
+        requested = profiler.authorized(token)
+        if not requested and not profiler.should_sample():
+            await self.app(scope, receive, send)
+            return
+
+        profile = profiler.begin()
+        if profile is None:  # Another request is being profiled
+            await self.app(scope, receive, send)
+            return
+
+        profile_id = profiler.new_profile_id() if requested else None
+
+        async def send_with_profile_id(message: Message) -> None:
+            if profile_id and message["type"] == "http.response.start":
+                MutableHeaders(scope=message)["x-profile-id"] = profile_id
+            await send(message)
+
+        try:
+            await self.app(scope, receive, send_with_profile_id)
+        finally:
+            profiler.end(profile, profile_id)
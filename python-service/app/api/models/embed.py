@@ -1,6 +1,6 @@
 """Embedding API models."""
 from pydantic import BaseModel, Field
-from typing import List
+from typing import List, Optional
 
 from app.api.models.chunk import ChunkModel
 
@@ -10,11 +10,18 @@ class EmbedRequest(BaseModel):
 
     session_id: str
     chunks: List[ChunkModel]
+    document: Optional[str] = Field(
+        default=None,
+        description="Document name; defaults to the chunks' source type",
+    )
 
 
 class EmbedResponse(BaseModel):
     """Response with embeddings."""
 
     success: bool
+    document: str
     embedding_count: int
+    embedded_count: int = 0  # Chunks sent to the embedding API
+    reused_count: int = 0  # Chunks whose embedding was already held
 
@@ -1,5 +1,6 @@
 """RAG API models."""
 from pydantic import BaseModel, Field
+from typing import List, Literal, Optional
 
 from app.types.rag import RAGResponse
 
@@ -9,7 +10,21 @@ class RAGRequest(BaseModel):
 
     session_id: str
     query: str = Field(..., min_length=1)
-    top_k: int = Field(default=8, ge=1, le=50)
+    top_k: Optional[int] = Field(
+        default=None,
+        ge=1,
+        le=50,
+        description="Chunks to retrieve (server default if omitted)",
+    )
+    documents: Optional[List[str]] = Field(
+        default=None, description="Documents to query (all if omitted)"
+    )
+    retrieval_mode: Optional[Literal["vector", "hybrid", "lexical"]] = Field(
+        default=None, description="Retrieval mode (server default if omitted)"
+    )
+    timeout_seconds: Optional[float] = Field(
+        default=None, gt=0, le=300, description="Deadline for the answer"
+    )
 
 
 class RAGResponseModel(BaseModel):
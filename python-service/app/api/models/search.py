@@ -1,6 +1,9 @@
 """Vector search API models."""
-from pydantic import BaseModel, Field
-from typing import List
+import numpy as np
+from pydantic import BaseModel, Field, PrivateAttr, model_validator
+from typing import List, Literal, Optional
+
+from app.utils.vector_codec import decode_vector
 
 
 class SearchResultModel(BaseModel):
@@ -9,18 +12,61 @@ class SearchResultModel(BaseModel):
     chunk_id: str
     score: float
     chunk_text: str
+    document: Optional[str] = None
 
 
 class SearchRequest(BaseModel):
-    """Request for vector search."""
+    """Request for vector, hybrid or lexical search.
+
+    The query vector is sent either as a JSON float list or, more cheaply, as
+    base64-encoded little-endian float32 bytes in `query_embedding_b64`.
+    Hybrid and lexical modes also take the query text; lexical mode needs no
+    vector at all.
+    """
 
     session_id: str
-    query_embedding: List[float] = Field(..., description="Query embedding vector")
+    mode: Literal["vector", "hybrid", "lexical"] = "vector"
+    query: Optional[str] = Field(
+        default=None, min_length=1, description="Query text for BM25 scoring"
+    )
+    query_embedding: Optional[List[float]] = Field(
+        default=None, description="Query embedding vector"
+    )
+    query_embedding_b64: Optional[str] = Field(
+        default=None,
+        description="Query embedding as base64 little-endian float32",
+    )
     top_k: int = Field(default=8, ge=1, le=50)
+    documents: Optional[List[str]] = Field(
+        default=None, description="Documents to search (all if omitted)"
+    )
+
+    _query_vector: Optional[np.ndarray] = PrivateAttr(default=None)
+
+    @model_validator(mode="after")
+    def decode_query_vector(self) -> "SearchRequest":
+        """Check the inputs the mode needs and decode the vector once."""
+        if self.mode != "vector" and self.query is None:
+            raise ValueError(f"{self.mode} search requires query")
+        if self.mode == "lexical":
+            return self
+        if (self.query_embedding is None) == (self.query_embedding_b64 is None):
+            raise ValueError(
+                "Provide exactly one of query_embedding or query_embedding_b64"
+            )
+        if self.query_embedding_b64 is not None:
+            self._query_vector = decode_vector(self.query_embedding_b64)
+        else:
+            self._query_vector = np.asarray(self.query_embedding, dtype=np.float32)
+        return self
+
+    @property
+    def query_vector(self) -> Optional[np.ndarray]:
+        """Query embedding as a float32 array (None in lexical mode)."""
+        return self._query_vector
 
 
 class SearchResponse(BaseModel):
     """Response with search results."""
 
     results: List[SearchResultModel]
-
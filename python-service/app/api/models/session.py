@@ -1,5 +1,6 @@
 """Session API models."""
 from pydantic import BaseModel, Field
+from typing import List, Optional
 
 
 class SessionCreateRequest(BaseModel):
@@ -8,6 +9,14 @@ class SessionCreateRequest(BaseModel):
     source_type: str = Field(..., description="Source type: 'resume' or 'jd'")
 
 
+class WarmupStatusModel(BaseModel):
+    """Progress of background answer precomputation."""
+
+    state: str  # idle | running | done | failed | cancelled
+    completed: int
+    total: int
+
+
 class SessionResponse(BaseModel):
     """Session response model."""
 
@@ -15,6 +24,19 @@ class SessionResponse(BaseModel):
     expires_at: str  # ISO format datetime
     source_type: str
     created_at: str  # ISO format datetime
+    documents: List[str] = []  # Names of embedded documents
+    warmup: Optional[WarmupStatusModel] = None
+
+
+class SessionStatsResponse(BaseModel):
+    """Session capacity and memory accounting."""
+
+    active_sessions: int
+    max_sessions: int
+    memory_bytes: int
+    memory_budget_bytes: int
+    evictions: int
+    expirations: int
 
 
 class SessionDeleteResponse(BaseModel):
@@ -0,0 +1,34 @@
+"""Admin endpoints for request profiles."""
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from fastapi.responses import PlainTextResponse
+
+from app.api.dependencies import require_profiling_token
+from app.core.profiler import request_profiler
+
+router = APIRouter(dependencies=[Depends(require_profiling_token)])
+
+
+@router.get("/profile", response_class=PlainTextResponse)
+async def get_rolling_profile(limit: int = Query(default=50, ge=1, le=500)) -> str:
+    """Get the rolling profile aggregated from sampled requests."""
+    report = request_profiler.aggregate_report(limit)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail="No sampled profiles yet (is PROFILING_SAMPLE_EVERY set?)",
+        )
+    return report
+
+
+@router.get("/profiles/{profile_id}", response_class=PlainTextResponse)
+async def get_request_profile(
+    profile_id: str, limit: int = Query(default=50, ge=1, le=500)
+) -> str:
+    """Get the profile of a request sent with the profiling token."""
+    report = request_profiler.report(profile_id, limit)
+    if report is None:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=f"Profile not found or evicted: {profile_id}",
+        )
+    return report
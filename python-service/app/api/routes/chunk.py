@@ -1,4 +1,6 @@
 """Chunking endpoint."""
+from functools import partial
+
 from fastapi import APIRouter
 
 from app.api.models.chunk import (
@@ -7,6 +9,8 @@ from app.api.models.chunk import (
     ChunkRequest,
     ChunkResponse,
 )
+from app.core.config import settings
+from app.core.offload import run_cpu_bound
 from app.services.chunking.chunker import ChunkerService
 
 router = APIRouter()
@@ -19,11 +23,17 @@ async def chunk_text(request: ChunkRequest) -> ChunkResponse:
     metadata = request.metadata or {}
     metadata["source_type"] = request.source_type
 
-    chunks = chunker_service.chunk(
-        text=request.text,
-        max_size=request.max_chunk_size,
-        overlap=request.overlap,
-        metadata=metadata,
+    chunks = await run_cpu_bound(
+        "chunk",
+        partial(
+            chunker_service.chunk,
+            text=request.text,
+            max_size=request.max_chunk_size,
+            overlap=request.overlap,
+            metadata=metadata,
+        ),
+        size=len(request.text),
+        threshold=settings.offload_text_chars,
     )
 
     # Convert dataclass chunks to Pydantic models
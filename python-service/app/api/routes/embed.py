@@ -1,10 +1,28 @@
 """Embedding generation endpoint."""
+import math
+from functools import partial
+from typing import List
+
 from fastapi import APIRouter, HTTPException, status
 
 from app.api.dependencies import get_session_from_request_body
 from app.api.models.embed import EmbedRequest, EmbedResponse
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError, SessionNotFoundError
+from app.core.offload import run_cpu_bound
+from app.core.request_scheduler import Priority, request_class
+from app.core.session_manager import session_manager
+from app.services.embedding.batch_processor import embed_chunks_incremental
 from app.services.embedding.generator import EmbeddingService
-from app.utils.logger import logger
+from app.services.extraction.facts import extract_facts
+from app.services.rag.warmup import warmup_service
+from app.services.vector_search.bm25 import build_bm25_index
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.embedding import EmbeddingVector
+from app.types.session import SessionDocument
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 embedding_service = EmbeddingService()
@@ -19,12 +37,7 @@ async def generate_embeddings(
     session = get_session_from_request_body(request)
     
     try:
-        # Generate embeddings for all chunks
-        texts = [chunk.text for chunk in request.chunks]
-        embeddings = await embedding_service.generate_embeddings_batch(texts)
-
         # Convert Pydantic models to Chunk dataclasses for storage
-        from app.types.chunk import Chunk, ChunkMetadata
         stored_chunks = [
             Chunk(
                 id=chunk.id,
@@ -39,15 +52,65 @@ async def generate_embeddings(
             for chunk in request.chunks
         ]
 
-        # Store embeddings in session
-        session.embeddings = embeddings
-        session.chunks = stored_chunks
+        source_type = (
+            stored_chunks[0].metadata.source_type
+            if stored_chunks
+            else session.source_type
+        )
+        document_name = request.document or source_type
+        previous = session.documents.get(document_name)
+
+        # Only embed chunks whose text this document doesn't already hold
+        with request_class(Priority.INGESTION, session.session_id):
+            embeddings, reused = await embed_chunks_incremental(
+                stored_chunks,
+                previous.chunks if previous else [],
+                previous.embeddings if previous else [],
+                embedding_service,
+            )
+
+        # Fact extraction and the BM25 index scale with the document's text
+        document = await run_cpu_bound(
+            "index",
+            partial(
+                build_document, document_name, source_type, stored_chunks, embeddings
+            ),
+            size=sum(len(chunk.text) for chunk in stored_chunks),
+            threshold=settings.offload_text_chars,
+        )
+        # Replace this document's segment; other documents are untouched.
+        # Applied to the current copy, so concurrent uploads elsewhere survive
+        session = session_manager.update_session(
+            session.session_id, lambda current: current.add_document(document)
+        )
+        if settings.warmup_enabled:
+            warmup_service.schedule(session.session_id)
 
         logger.info(
-            f"Generated {len(embeddings)} embeddings for session {request.session_id}"
+            f"Stored {len(embeddings)} embeddings in document '{document_name}' "
+            f"for session {request.session_id} "
+            f"({len(embeddings) - reused} generated, {reused} reused)"
         )
 
-        return EmbedResponse(success=True, embedding_count=len(embeddings))
+        return EmbedResponse(
+            success=True,
+            document=document_name,
+            embedding_count=len(embeddings),
+            embedded_count=len(embeddings) - reused,
+            reused_count=reused,
+        )
+    except SessionNotFoundError as e:
+        raise HTTPException(
+            status_code=status.HTTP_404_NOT_FOUND,
+            detail=str(e),
+        )
+    except CircuitOpenError as e:
+        # Fail fast instead of tying up the worker on a failing backend
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after))},
+        )
     except Exception as e:
         logger.error(f"Embedding generation failed: {e}")
         error_str = str(e)
@@ -73,3 +136,19 @@ async def generate_embeddings(
             detail=f"Failed to generate embeddings: {error_str}",
         )
 
+
+def build_document(
+    name: str,
+    source_type: str,
+    chunks: List[Chunk],
+    embeddings: List[EmbeddingVector],
+) -> SessionDocument:
+    """Build a session document with its facts and lexical index."""
+    return SessionDocument(
+        name=name,
+        source_type=source_type,
+        chunks=chunks,
+        embeddings=embeddings,
+        facts=extract_facts(chunks),
+        lexical_index=build_bm25_index(chunks),
+    )
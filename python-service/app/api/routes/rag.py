@@ -1,16 +1,24 @@
 """RAG chat endpoint."""
+import math
+import time
+
 from fastapi import APIRouter, HTTPException, status
 
 from app.api.dependencies import get_session_from_request_body
 from app.api.models.rag import RAGRequest, RAGResponseModel
+from app.core.config import settings
 from app.core.exceptions import (
+    CircuitOpenError,
+    DeadlineExceededError,
     ResumeLensException,
     SessionNotFoundError,
     EmbeddingGenerationError,
     LLMGenerationError,
 )
 from app.services.rag.pipeline import RAGPipeline
-from app.utils.logger import logger
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 router = APIRouter()
 
@@ -31,6 +39,9 @@ async def rag_chat(request: RAGRequest) -> RAGResponseModel:
         # Validate session exists
         session = get_session_from_request_body(request)
         
+        timeout = request.timeout_seconds or settings.rag_timeout_seconds
+        deadline = time.monotonic() + timeout
+
         # Process RAG query - create fresh pipeline instance
         pipeline = get_rag_pipeline()
         logger.info(f"Using RAG pipeline with LLM client model: {pipeline.llm_client.model_name}")
@@ -38,6 +49,9 @@ async def rag_chat(request: RAGRequest) -> RAGResponseModel:
             query=request.query,
             session_id=request.session_id,
             top_k=request.top_k,
+            documents=request.documents,
+            retrieval_mode=request.retrieval_mode,
+            deadline=deadline,
         )
 
         return RAGResponseModel(
@@ -51,6 +65,19 @@ async def rag_chat(request: RAGRequest) -> RAGResponseModel:
             status_code=status.HTTP_404_NOT_FOUND,
             detail=str(e),
         )
+    except DeadlineExceededError as e:
+        logger.warning(f"RAG chat deadline of {timeout}s exceeded: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_504_GATEWAY_TIMEOUT,
+            detail=str(e),
+        )
+    except CircuitOpenError as e:
+        logger.warning(f"Rejected while circuit is open: {e}")
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail=str(e),
+            headers={"Retry-After": str(math.ceil(e.retry_after))},
+        )
     except EmbeddingGenerationError as e:
         logger.error(f"Embedding generation failed: {e}")
         raise HTTPException(
@@ -1,4 +1,6 @@
 """Vector search endpoint."""
+from functools import partial
+
 from fastapi import APIRouter
 
 from app.api.dependencies import get_session_from_request_body
@@ -7,6 +9,8 @@ from app.api.models.search import (
     SearchResponse,
     SearchResultModel,
 )
+from app.core.config import settings
+from app.core.offload import run_cpu_bound
 from app.services.vector_search.searcher import VectorSearchService
 
 router = APIRouter()
@@ -17,15 +21,34 @@ search_service = VectorSearchService()
 async def vector_search(
     request: SearchRequest
 ) -> SearchResponse:
-    """Perform vector similarity search."""
+    """Perform vector, hybrid or lexical search."""
     # Get session from request body
     session = get_session_from_request_body(request)
-    """Perform vector similarity search."""
-    results = search_service.search(
-        query_embedding=request.query_embedding,
-        document_embeddings=session.embeddings,
-        chunks=session.chunks,
-        top_k=request.top_k,
+    documents = session.select_documents(request.documents)
+    if request.mode == "lexical":
+        search = partial(
+            search_service.lexical_search, request.query, documents, request.top_k
+        )
+    elif request.mode == "hybrid":
+        search = partial(
+            search_service.hybrid_search,
+            request.query_vector,
+            request.query,
+            documents,
+            request.top_k,
+        )
+    else:
+        search = partial(
+            search_service.search_documents,
+            query_embedding=request.query_vector,
+            documents=documents,
+            top_k=request.top_k,
+        )
+    results = await run_cpu_bound(
+        "search",
+        search,
+        size=sum(len(document.chunks) for document in documents),
+        threshold=settings.offload_search_chunks,
     )
 
     # Convert to Pydantic models
@@ -34,6 +57,7 @@ async def vector_search(
             chunk_id=r.chunk_id,
             score=r.score,
             chunk_text=r.chunk_text,
+            document=r.document,
         )
         for r in results
     ]
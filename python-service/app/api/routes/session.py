@@ -7,8 +7,11 @@ from app.api.models.session import (
     SessionCreateRequest,
     SessionDeleteResponse,
     SessionResponse,
+    SessionStatsResponse,
+    WarmupStatusModel,
 )
 from app.core.session_manager import session_manager
+from app.services.rag.warmup import warmup_service
 from app.types.session import Session
 
 router = APIRouter()
@@ -33,9 +36,16 @@ async def create_session(request: SessionCreateRequest) -> SessionResponse:
         expires_at=session.expires_at.isoformat(),
         source_type=session.source_type,
         created_at=session.created_at.isoformat(),
+        documents=list(session.documents),
     )
 
 
+@router.get("/stats", response_model=SessionStatsResponse)
+async def get_session_stats() -> SessionStatsResponse:
+    """Get session capacity and memory usage."""
+    return SessionStatsResponse(**session_manager.stats())
+
+
 @router.get("/{session_id}", response_model=SessionResponse)
 async def get_session_info(
     session: Session = Depends(get_session),
@@ -46,12 +56,19 @@ async def get_session_info(
         expires_at=session.expires_at.isoformat(),
         source_type=session.source_type,
         created_at=session.created_at.isoformat(),
+        documents=list(session.documents),
+        warmup=WarmupStatusModel(
+            state=session.warmup.state,
+            completed=session.warmup.completed,
+            total=session.warmup.total,
+        ),
     )
 
 
 @router.delete("/{session_id}", response_model=SessionDeleteResponse)
 async def delete_session(session_id: str) -> SessionDeleteResponse:
     """Delete a session."""
+    warmup_service.cancel(session_id)
     success = session_manager.delete_session(session_id)
     if success:
         return SessionDeleteResponse(
@@ -0,0 +1,174 @@
+"""Admission control: per-route-class concurrency limits and bounded queues."""
+import asyncio
+import math
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Deque, Dict, Optional
+
+from app.core.config import settings
+from app.core.exceptions import AdmissionRejectedError
+from app.core.metrics import admission_rejected
+
+# Route classes by path prefix; other routes are not limited
+ROUTE_CLASSES = (
+    ("/api/rag", "chat"),
+    ("/api/chunk", "ingestion"),
+    ("/api/embed", "ingestion"),
+    ("/api/search", "search"),
+)
+# Bounds on the Retry-After hint, in seconds
+MIN_RETRY_AFTER = 1
+MAX_RETRY_AFTER = 60
+# Weight of the latest request in the running service-time average
+_SERVICE_TIME_SMOOTHING = 0.1
+
+
+def route_class(path: str) -> Optional[str]:
+    """Return the route class serving `path`, or None if it isn't limited."""
+    for prefix, name in ROUTE_CLASSES:
+        if path.startswith(prefix):
+            return name
+    return None
+
+
+class RouteLimiter:
+    """
+    Lets at most `max_concurrency` requests of one route class run at once,
+    queues up to `max_queue` more in arrival order, and rejects the rest
+    immediately. A queued request that isn't admitted within
+    `queue_timeout` seconds is rejected too, so under overload clients get
+    a fast 503 rather than a response after their own timeout.
+
+    Rejections carry a Retry-After hint: the time for the current queue to
+    drain at the recently observed service time.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        max_concurrency: int,
+        max_queue: int,
+        queue_timeout: float = 0.0,
+    ):
+        self.name = name
+        self.max_concurrency = max_concurrency
+        self.max_queue = max_queue
+        self.queue_timeout = queue_timeout
+        self._in_flight = 0
+        self._waiters: Deque[asyncio.Future] = deque()
+        self._service_time = 1.0
+        self._admitted = 0
+        self._rejected = {"queue_full": 0, "queue_timeout": 0}
+
+    @property
+    def enabled(self) -> bool:
+        return self.max_concurrency > 0
+
+    @asynccontextmanager
+    async def admit(self) -> AsyncIterator[None]:
+        """Hold a slot for one request; raises `AdmissionRejectedError`."""
+        if not self.enabled:
+            yield
+            return
+        await self._acquire()
+        loop = asyncio.get_running_loop()
+        started = loop.time()
+        try:
+            yield
+        finally:
+            self._service_time += _SERVICE_TIME_SMOOTHING * (
+                loop.time() - started - self._service_time
+            )
+            self._release()
+
+    def retry_after(self) -> int:
+        """Seconds until the queue is expected to have drained."""
+        backlog = (len(self._waiters) + 1) / self.max_concurrency
+        return max(
+            MIN_RETRY_AFTER,
+            min(MAX_RETRY_AFTER, math.ceil(backlog * self._service_time)),
+        )
+
+    def stats(self) -> dict:
+        return {
+            "max_concurrency": self.max_concurrency,
+            "max_queue": self.max_queue,
+            "in_flight": self._in_flight,
+            "queued": len(self._waiters),
+            "admitted": self._admitted,
+            "rejected": dict(self._rejected),
+            "service_time_ms": round(self._service_time * 1000, 1),
+        }
+
+    async def _acquire(self) -> None:
+        if self._in_flight < self.max_concurrency and not self._waiters:
+            self._in_flight += 1
+            self._admitted += 1
+            return
+        if len(self._waiters) >= self.max_queue:
+            self._reject("queue_full")
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            # The releasing request transfers its slot to us. Not wait_for:
+            # on 3.11 it swallows a cancel that races with the grant.
+            await asyncio.wait((waiter,), timeout=self.queue_timeout or None)
+        except asyncio.CancelledError:
+            if waiter.done():
+                self._release()  # Admitted just as we were cancelled
+            else:
+                self._discard(waiter)
+            raise
+        if not waiter.done():
+            self._discard(waiter)
+            self._reject("queue_timeout")
+        self._admitted += 1
+
+    def _release(self) -> None:
+        while self._waiters:
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _discard(self, waiter: asyncio.Future) -> None:
+        try:
+            self._waiters.remove(waiter)
+        except ValueError:
+            pass
+
+    def _reject(self, reason: str) -> None:
+        self._rejected[reason] += 1
+        admission_rejected.labels(self.name, reason).inc()
+        raise AdmissionRejectedError(self.name, self.retry_after())
+
+
+class AdmissionController:
+    """The limiters for every route class, configured from settings."""
+
+    def __init__(self, limiters: Dict[str, RouteLimiter] | None = None):
+        if limiters is None:
+            timeout = settings.admission_queue_timeout_seconds
+            limiters = {
+                name: RouteLimiter(
+                    name,
+                    getattr(settings, f"admission_{name}_concurrency"),
+                    getattr(settings, f"admission_{name}_queue"),
+                    timeout,
+                )
+                for name in ("chat", "ingestion", "search")
+            }
+        self.limiters = limiters
+
+    def limiter_for(self, path: str) -> Optional[RouteLimiter]:
+        name = route_class(path)
+        return self.limiters.get(name) if name else None
+
+    def stats(self) -> Dict[str, dict]:
+        return {name: limiter.stats() for name, limiter in self.limiters.items()}
+
+
+# Global controller used by AdmissionMiddleware
+admission_controller = AdmissionController()
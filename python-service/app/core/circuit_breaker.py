@@ -0,0 +1,151 @@
+"""Circuit breakers around Gemini dependencies."""
+import asyncio
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import AsyncIterator, Callable, Deque, Dict
+
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+CLOSED = "closed"
+OPEN = "open"
+HALF_OPEN = "half_open"
+
+
+class CircuitBreaker:
+    """
+    Tracks the outcome of recent calls to one dependency. When enough of
+    them fail, or take longer than `slow_call_seconds`, the circuit opens
+    and calls are rejected immediately with CircuitOpenError instead of
+    waiting on a struggling backend. After `open_seconds` a single probe
+    call is let through (half-open): success closes the circuit, failure
+    opens it again.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        slow_call_seconds: float,
+        failure_rate_threshold: float | None = None,
+        window_size: int | None = None,
+        min_calls: int | None = None,
+        open_seconds: float | None = None,
+        clock: Callable[[], float] = time.monotonic,
+    ):
+        self.name = name
+        self.slow_call_seconds = slow_call_seconds
+        self.failure_rate_threshold = (
+            failure_rate_threshold or settings.breaker_failure_rate_threshold
+        )
+        self.min_calls = min_calls or settings.breaker_min_calls
+        self.open_seconds = open_seconds or settings.breaker_open_seconds
+        self._clock = clock
+        # True for each failed or slow call in the rolling window
+        self._outcomes: Deque[bool] = deque(
+            maxlen=window_size or settings.breaker_window_size
+        )
+        self._state = CLOSED
+        self._opened_at = 0.0
+        self._probing = False
+        self.times_opened = 0
+        self.rejected = 0
+
+    @property
+    def state(self) -> str:
+        if self._state == OPEN and self.retry_after() == 0:
+            return HALF_OPEN
+        return self._state
+
+    def retry_after(self) -> float:
+        """Seconds until an open circuit lets a probe through."""
+        if self._state != OPEN:
+            return 0.0
+        return max(0.0, self._opened_at + self.open_seconds - self._clock())
+
+    def raise_if_open(self) -> None:
+        """Fail fast without reserving the half-open probe."""
+        if self.state == OPEN or (self.state == HALF_OPEN and self._probing):
+            self.rejected += 1
+            raise CircuitOpenError(self.name, self.retry_after())
+
+    @asynccontextmanager
+    async def call(self) -> AsyncIterator[None]:
+        """Guard one call to the dependency and record its outcome."""
+        self.raise_if_open()
+        probe = self.state == HALF_OPEN
+        if probe:
+            self._probing = True
+        started = self._clock()
+        try:
+            yield
+        except asyncio.CancelledError:
+            if probe:
+                self._probing = False
+            raise
+        except Exception:
+            self._record(failed=True, probe=probe)
+            raise
+        else:
+            slow = self._clock() - started > self.slow_call_seconds
+            self._record(failed=slow, probe=probe)
+
+    def stats(self) -> dict:
+        """Return state and failure rate over the rolling window."""
+        return {
+            "state": self.state,
+            "calls": len(self._outcomes),
+            "failure_rate": round(self._failure_rate(), 3),
+            "times_opened": self.times_opened,
+            "rejected": self.rejected,
+            "retry_after_seconds": round(self.retry_after(), 1),
+        }
+
+    def _failure_rate(self) -> float:
+        if not self._outcomes:
+            return 0.0
+        return sum(self._outcomes) / len(self._outcomes)
+
+    def _record(self, failed: bool, probe: bool) -> None:
+        if probe:
+            self._probing = False
+            if failed:
+                self._open()
+            else:
+                self._state = CLOSED
+                self._outcomes.clear()
+                logger.info(f"Circuit '{self.name}' closed after successful probe")
+            return
+
+        self._outcomes.append(failed)
+        if (
+            self._state == CLOSED
+            and len(self._outcomes) >= self.min_calls
+            and self._failure_rate() >= self.failure_rate_threshold
+        ):
+            self._open()
+
+    def _open(self) -> None:
+        self._state = OPEN
+        self._opened_at = self._clock()
+        self.times_opened += 1
+        logger.warning(
+            f"Circuit '{self.name}' opened for {self.open_seconds}s "
+            f"(failure rate {self._failure_rate():.0%})"
+        )
+
+
+# One breaker per Gemini dependency
+embedding_breaker = CircuitBreaker(
+    "embedding", slow_call_seconds=settings.breaker_embedding_slow_seconds
+)
+generation_breaker = CircuitBreaker(
+    "generation", slow_call_seconds=settings.breaker_generation_slow_seconds
+)
+
+circuit_breakers: Dict[str, CircuitBreaker] = {
+    breaker.name: breaker for breaker in (embedding_breaker, generation_breaker)
+}
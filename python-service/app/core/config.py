@@ -1,7 +1,7 @@
 """Configuration management."""
 from pydantic_settings import BaseSettings, SettingsConfigDict
-from pydantic import field_validator
-from typing import List, Union
+from pydantic import field_validator, model_validator
+from typing import List, Literal, Optional, Union
 
 
 class Settings(BaseSettings):
@@ -19,14 +19,53 @@ class Settings(BaseSettings):
     api_port: int = 8000
     api_reload: bool = True
 
-    # Gemini API
-    gemini_api_key: str
+    # Providers: "gemini", or "local" for deterministic offline backends
+    embedding_provider: Literal["gemini", "local"] = "gemini"
+    llm_provider: Literal["gemini", "local"] = "gemini"
+    # Local providers: simulated latency (with +/- jitter as a fraction),
+    # and the share of calls failing with a 500 or a 429
+    local_embedding_dimension: int = 256
+    local_embedding_latency_ms: float = 0.0
+    local_generation_latency_ms: float = 0.0
+    local_latency_jitter: float = 0.0
+    local_error_rate: float = 0.0
+    local_rate_limit_rate: float = 0.0
+    local_provider_seed: Optional[int] = None
+
+    # Gemini API (not needed when both providers are local)
+    gemini_api_key: str = ""
     gemini_model: str = "gemini-2.5-flash"  # Valid models: gemini-2.5-flash, gemini-2.0-flash, gemini-flash-latest
     gemini_embedding_model: str = "models/embedding-001"
+    # Concurrent Gemini calls; queued calls are served by priority class
+    gemini_max_concurrency: int = 4
+    # LLM hedging: duplicate a generation still running after the delay
+    # (0 = observed p95), for at most max_rate of requests
+    llm_hedging_enabled: bool = False
+    llm_hedge_delay_seconds: float = 0.0
+    llm_hedge_max_rate: float = 0.05
+    llm_hedge_model: Optional[str] = None  # Faster fallback model for hedges
+    # Circuit breakers: open when this share of recent calls failed or were slow
+    breaker_failure_rate_threshold: float = 0.5
+    breaker_window_size: int = 20
+    breaker_min_calls: int = 5
+    breaker_open_seconds: float = 30.0
+    breaker_embedding_slow_seconds: float = 5.0
+    breaker_generation_slow_seconds: float = 30.0
 
     # Session Configuration
     session_ttl_minutes: int = 25
-    max_sessions: int = 100
+    max_sessions: int = 10000  # Safety cap; memory budget governs capacity
+    session_memory_budget_mb: int = 512
+    session_sliding_ttl: bool = False  # Extend expiry on every access
+    session_lock_stripes: int = 16
+    session_cleanup_interval_seconds: int = 60
+    # Session storage: "memory" (single process) or "sqlite" (shared by workers)
+    session_backend: str = "memory"
+    session_store_path: str = "sessions.db"
+    # Snapshots: written on shutdown (and every interval if > 0), read on startup
+    session_snapshot_path: Optional[str] = None
+    session_snapshot_interval_seconds: int = 0
+    session_snapshot_key: Optional[str] = None  # Fernet key for encryption at rest
 
     # Chunking Configuration
     default_chunk_size: int = 1000
@@ -34,12 +73,56 @@ class Settings(BaseSettings):
 
     # Vector Search Configuration
     default_top_k: int = 8
+    # "vector", "hybrid" (vector + BM25 fused) or "lexical" (no query embedding)
+    retrieval_mode: Literal["vector", "hybrid", "lexical"] = "vector"
+    # Concurrent query embeddings within this window share one API call
+    query_batch_window_ms: float = 5.0
+    query_batch_max_size: int = 32
+
+    # Admission control per route class: requests beyond the concurrency
+    # limit queue, and beyond the queue size (or after waiting the timeout)
+    # get a 503 with Retry-After. A concurrency of 0 disables the limit.
+    admission_chat_concurrency: int = 32
+    admission_chat_queue: int = 64
+    admission_ingestion_concurrency: int = 16
+    admission_ingestion_queue: int = 48
+    admission_search_concurrency: int = 16
+    admission_search_queue: int = 32
+    admission_queue_timeout_seconds: float = 10.0  # 0 = wait indefinitely
+
+    # RAG Configuration
+    rag_timeout_seconds: float = 60.0  # Default chat deadline
+    fact_fast_path_enabled: bool = True  # Answer simple facts without the LLM
+
+    # Warm-up: precompute answers to predictable questions after ingestion
+    warmup_enabled: bool = False
+    warmup_questions: Union[str, List[str]] = (
+        "Summarize this document|What are the top skills?|"
+        "How well does this candidate fit the role?"
+    )
+    warmup_interval_seconds: float = 2.0  # Gap between warm-up questions
 
     # CORS - accept as string, convert to list
     cors_origins: Union[str, List[str]] = "http://localhost:3000"
 
-    # Logging
+    # Profiling: requests sending this token in X-Profile-Token are profiled;
+    # every Nth request also feeds the rolling profile (0 = off)
+    profiling_token: Optional[str] = None
+    profiling_sample_every: int = 0
+
+    # CPU-bound work (chunking, search, indexing) whose input reaches these
+    # sizes runs on a worker thread pool instead of the event loop
+    offload_workers: int = 2  # 0 = always run inline
+    offload_text_chars: int = 50_000
+    offload_search_chunks: int = 2_000
+    # How often event-loop lag is sampled (0 = off)
+    loop_lag_interval_ms: float = 100.0
+
+    # Logging: per-logger overrides as "name=LEVEL,..." on top of log_level,
+    # e.g. "resumelens.llm=DEBUG,uvicorn.access=WARNING"
     log_level: str = "INFO"
+    log_format: Literal["json", "text"] = "json"
+    log_levels: str = ""
 
     @field_validator("cors_origins", mode="before")
     @classmethod
@@ -52,6 +135,25 @@ class Settings(BaseSettings):
             return [origin.strip() for origin in v.split(",") if origin.strip()]
         return ["http://localhost:3000"]  # default
 
+    @field_validator("warmup_questions", mode="before")
+    @classmethod
+    def parse_warmup_questions(cls, v: Union[str, List[str]]) -> List[str]:
+        """Parse warm-up questions from a '|'-separated string or list."""
+        if isinstance(v, list):
+            return v
+        return [q.strip() for q in str(v).split("|") if q.strip()]
+
+    @model_validator(mode="after")
+    def require_gemini_api_key(self) -> "Settings":
+        """Require an API key unless every provider is local."""
+        uses_gemini = "gemini" in (self.embedding_provider, self.llm_provider)
+        if uses_gemini and not self.gemini_api_key:
+            raise ValueError(
+                "GEMINI_API_KEY is required unless EMBEDDING_PROVIDER and "
+                "LLM_PROVIDER are both 'local'"
+            )
+        return self
+
 
 settings = Settings()
 
@@ -27,6 +27,45 @@ class LLMGenerationError(ResumeLensException):
     pass
 
 
+class DeadlineExceededError(ResumeLensException):
+    """Raised when a request's deadline passes before its work completes."""
+
+    def __init__(self, operation: str):
+        self.operation = operation
+        super().__init__(f"Deadline exceeded during {operation}")
+
+
+class SessionConflictError(ResumeLensException):
+    """Raised when a session was changed by another writer since it was loaded."""
+
+    def __init__(self, session_id: str):
+        self.session_id = session_id
+        super().__init__(f"Session was modified concurrently: {session_id}")
+
+
+class CircuitOpenError(ResumeLensException):
+    """Raised when a dependency's circuit breaker is rejecting calls."""
+
+    def __init__(self, dependency: str, retry_after: float = 0.0):
+        self.dependency = dependency
+        self.retry_after = retry_after
+        super().__init__(
+            f"{dependency} is temporarily unavailable; retry in {retry_after:.0f}s"
+        )
+
+
+class AdmissionRejectedError(ResumeLensException):
+    """Raised when a route class is at capacity and its queue is full."""
+
+    def __init__(self, route_class: str, retry_after: float = 0.0):
+        self.route_class = route_class
+        self.retry_after = retry_after
+        super().__init__(
+            f"Too many {route_class} requests in progress; "
+            f"retry in {retry_after:.0f}s"
+        )
+
+
 class DocumentProcessingError(ResumeLensException):
     """Raised when document processing fails."""
 
@@ -0,0 +1,63 @@
+"""Simulated latency and failures for the local providers."""
+import asyncio
+import random
+
+from app.core.config import settings
+
+
+class InjectedFaultError(Exception):
+    """A failure injected by a local provider."""
+
+
+class FaultInjector:
+    """
+    Delays each call by `latency_ms` (varied by +/- `jitter` as a fraction)
+    and fails a share of calls. Rate-limit failures carry a 429 message so
+    they are handled and counted exactly like a Gemini quota error. With a
+    seed, the sequence of delays and failures is reproducible.
+    """
+
+    def __init__(
+        self,
+        latency_ms: float = 0.0,
+        jitter: float | None = None,
+        error_rate: float | None = None,
+        rate_limit_rate: float | None = None,
+        seed: int | None = None,
+    ):
+        self.latency_ms = latency_ms
+        self.jitter = settings.local_latency_jitter if jitter is None else jitter
+        self.error_rate = (
+            settings.local_error_rate if error_rate is None else error_rate
+        )
+        self.rate_limit_rate = (
+            settings.local_rate_limit_rate
+            if rate_limit_rate is None
+            else rate_limit_rate
+        )
+        self._rng = random.Random(seed)
+        self.calls = 0
+        self.errors = 0
+        self.rate_limited = 0
+
+    async def apply(self) -> None:
+        """Wait out the simulated latency, then maybe raise a fault."""
+        self.calls += 1
+        if self.latency_ms > 0:
+            spread = self._rng.uniform(-self.jitter, self.jitter)
+            await asyncio.sleep(max(0.0, self.latency_ms * (1 + spread)) / 1000)
+
+        roll = self._rng.random()
+        if roll < self.rate_limit_rate:
+            self.rate_limited += 1
+            raise InjectedFaultError("429 Resource has been exhausted (injected)")
+        if roll < self.rate_limit_rate + self.error_rate:
+            self.errors += 1
+            raise InjectedFaultError("500 Internal error (injected)")
+
+    def stats(self) -> dict:
+        return {
+            "calls": self.calls,
+            "errors": self.errors,
+            "rate_limited": self.rate_limited,
+        }
@@ -0,0 +1,56 @@
+"""Event-loop lag monitoring."""
+import asyncio
+from collections import deque
+from typing import Deque
+
+from app.core.config import settings
+from app.core.metrics import event_loop_lag_seconds
+
+
+class LoopLagMonitor:
+    """
+    Measures scheduling delay on the event loop: a task asks to wake up
+    after a fixed interval and records how much later it actually ran.
+    Sustained lag means something is holding the loop, such as CPU-bound
+    work running inline in a request, and every connection waits on it.
+    """
+
+    def __init__(self, interval_ms: float | None = None, sample_size: int = 600):
+        interval_ms = (
+            settings.loop_lag_interval_ms if interval_ms is None else interval_ms
+        )
+        self.interval_seconds = interval_ms / 1000
+        self._samples: Deque[float] = deque(maxlen=sample_size)
+
+    async def run(self) -> None:
+        """Sample lag until cancelled."""
+        loop = asyncio.get_running_loop()
+        while True:
+            wake_at = loop.time() + self.interval_seconds
+            await asyncio.sleep(self.interval_seconds)
+            self.record(max(0.0, loop.time() - wake_at))
+
+    def record(self, lag_seconds: float) -> None:
+        self._samples.append(lag_seconds)
+        event_loop_lag_seconds.observe(lag_seconds)
+
+    def stats(self) -> dict:
+        """Return lag percentiles over the recent samples."""
+        samples = sorted(self._samples)
+
+        def percentile(q: float) -> float:
+            if not samples:
+                return 0.0
+            return samples[min(len(samples) - 1, int(q * len(samples)))] * 1000
+
+        return {
+            "interval_ms": self.interval_seconds * 1000,
+            "samples": len(samples),
+            "lag_p50_ms": round(percentile(0.50), 2),
+            "lag_p99_ms": round(percentile(0.99), 2),
+            "lag_max_ms": round(samples[-1] * 1000 if samples else 0.0, 2),
+        }
+
+
+# Global monitor, started in the app lifespan
+loop_lag_monitor = LoopLagMonitor()
@@ -0,0 +1,226 @@
+"""Prometheus metrics for the RAG service.
+
+Hot-path instrumentation is limited to observing pre-bound histogram and
+counter children. Session, cache and scheduler figures are read from their
+owners only when `/metrics` is scraped.
+"""
+from typing import Callable, Dict, Iterable
+
+from prometheus_client import REGISTRY, Counter, Histogram
+from prometheus_client.core import GaugeMetricFamily
+from prometheus_client.registry import Collector
+
+# Latency buckets spanning fast lookups to slow LLM calls
+# fmt: off
+LATENCY_BUCKETS = (
+    0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 30, 60
+)
+# fmt: on
+
+RAG_STAGES = ("facts", "embed_query", "search", "build_prompt", "generate", "parse")
+
+_stage_seconds = Histogram(
+    "rag_stage_seconds",
+    "Time spent in each RAG pipeline stage",
+    ["stage"],
+    buckets=LATENCY_BUCKETS,
+)
+rag_stage: Dict[str, Histogram] = {
+    stage: _stage_seconds.labels(stage) for stage in RAG_STAGES
+}
+
+http_request_seconds = Histogram(
+    "http_request_duration_seconds",
+    "HTTP request latency by route template",
+    ["method", "route", "status"],
+    buckets=LATENCY_BUCKETS,
+)
+
+gemini_calls = Counter(
+    "gemini_calls",
+    "Gemini API calls by operation and outcome",
+    ["operation", "outcome"],
+)
+gemini_tokens = Counter(
+    "gemini_tokens",
+    "Gemini tokens (SDK usage metadata, else estimated at 4 characters per token)",
+    ["operation", "direction"],
+)
+gemini_retries = Counter(
+    "gemini_retries",
+    "Gemini requests re-sent, by reason",
+    ["operation", "reason"],
+)
+gemini_rate_limited = Counter(
+    "gemini_rate_limited",
+    "Gemini calls rejected with 429 / quota exhausted",
+    ["operation"],
+)
+event_loop_lag_seconds = Histogram(
+    "event_loop_lag_seconds",
+    "How late the event loop woke a task, i.e. how long it was held up",
+    buckets=(0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5),
+)
+cpu_offloaded = Counter(
+    "cpu_offloaded",
+    "CPU-bound calls run on the worker pool instead of the event loop",
+    ["operation"],
+)
+admission_rejected = Counter(
+    "admission_rejected",
+    "Requests turned away with 503 by admission control",
+    ["route_class", "reason"],  # queue_full | queue_timeout
+)
+rag_answers = Counter(
+    "rag_answers",
+    "Chat answers by where they came from",
+    ["source"],  # facts | cache | pipeline
+)
+
+
+def is_rate_limit_error(error: BaseException) -> bool:
+    """Whether an SDK error means the Gemini quota or rate limit was hit."""
+    text = str(error).lower()
+    return "429" in text or "quota" in text or "rate limit" in text
+
+
+def record_gemini_call(operation: str, error: BaseException | None = None) -> None:
+    """Count one Gemini call and, on failure, whether it was rate limited."""
+    if error is None:
+        gemini_calls.labels(operation, "ok").inc()
+    elif is_rate_limit_error(error):
+        gemini_calls.labels(operation, "rate_limited").inc()
+        gemini_rate_limited.labels(operation).inc()
+    else:
+        gemini_calls.labels(operation, "error").inc()
+
+
+def estimate_tokens(text: str) -> int:
+    return max(1, len(text) // 4)
+
+
+def _answer_counts() -> Dict[str, float]:
+    # Read the counter directly; querying REGISTRY would re-enter collect()
+    return {
+        sample.labels["source"]: sample.value
+        for metric in rag_answers.collect()
+        for sample in metric.samples
+        if sample.name == "rag_answers_total"
+    }
+
+
+class _ScrapeTimeCollector(Collector):
+    """Reports gauges computed from live service state at scrape time."""
+
+    def __init__(
+        self,
+        session_stats: Callable[[], dict],
+        scheduler_stats: Callable[[], dict],
+        breaker_stats: Callable[[], Dict[str, dict]],
+        coalescing_stats: Callable[[], Dict[str, dict]],
+        admission_stats: Callable[[], Dict[str, dict]],
+    ):
+        self._session_stats = session_stats
+        self._scheduler_stats = scheduler_stats
+        self._breaker_stats = breaker_stats
+        self._coalescing_stats = coalescing_stats
+        self._admission_stats = admission_stats
+
+    def collect(self) -> Iterable[GaugeMetricFamily]:
+        sessions = self._session_stats()
+        yield GaugeMetricFamily(
+            "sessions_active", "Live sessions", value=sessions["active_sessions"]
+        )
+        yield GaugeMetricFamily(
+            "session_memory_bytes",
+            "Accounted memory held by sessions",
+            value=sessions["memory_bytes"],
+        )
+        yield GaugeMetricFamily(
+            "session_memory_budget_bytes",
+            "Session memory budget",
+            value=sessions["memory_budget_bytes"],
+        )
+        yield self._cache_ratios()
+
+        scheduler = self._scheduler_stats()
+        yield GaugeMetricFamily(
+            "gemini_in_flight",
+            "Gemini calls holding a slot",
+            value=scheduler["in_flight"],
+        )
+        queued = GaugeMetricFamily(
+            "gemini_queued", "Gemini calls waiting for a slot", labels=["priority"]
+        )
+        for priority, figures in scheduler["classes"].items():
+            queued.add_metric([priority], figures["queued"])
+        yield queued
+
+        circuit_open = GaugeMetricFamily(
+            "gemini_circuit_open",
+            "1 while a dependency's circuit breaker rejects calls",
+            labels=["dependency"],
+        )
+        for dependency, figures in self._breaker_stats().items():
+            circuit_open.add_metric(
+                [dependency], 1.0 if figures["state"] == "open" else 0.0
+            )
+        yield circuit_open
+
+        admission = self._admission_stats()
+        in_flight = GaugeMetricFamily(
+            "admission_in_flight",
+            "Requests admitted and running, by route class",
+            labels=["route_class"],
+        )
+        queued = GaugeMetricFamily(
+            "admission_queued",
+            "Requests waiting for admission, by route class",
+            labels=["route_class"],
+        )
+        for route_class, figures in admission.items():
+            in_flight.add_metric([route_class], figures["in_flight"])
+            queued.add_metric([route_class], figures["queued"])
+        yield in_flight
+        yield queued
+
+    def _cache_ratios(self) -> GaugeMetricFamily:
+        answers = _answer_counts()
+        facts, cached, pipeline = (
+            answers.get(source, 0.0) for source in ("facts", "cache", "pipeline")
+        )
+        coalescing = self._coalescing_stats().values()
+        coalesced = sum(op["coalesced"] for op in coalescing)
+        executed = sum(op["executed"] for op in coalescing)
+
+        ratios = GaugeMetricFamily(
+            "cache_hit_ratio",
+            "Share of lookups served without new work",
+            labels=["cache"],
+        )
+        for cache, hits, total in (
+            ("facts", facts, facts + cached + pipeline),
+            ("answers", cached, cached + pipeline),
+            ("single_flight", coalesced, coalesced + executed),
+        ):
+            ratios.add_metric([cache], hits / total if total else 0.0)
+        return ratios
+
+
+def register_collectors(
+    session_stats: Callable[[], dict],
+    scheduler_stats: Callable[[], dict],
+    breaker_stats: Callable[[], Dict[str, dict]],
+    coalescing_stats: Callable[[], Dict[str, dict]],
+    admission_stats: Callable[[], Dict[str, dict]],
+) -> None:
+    """Register gauges that read service state when `/metrics` is scraped."""
+    REGISTRY.register(
+        _ScrapeTimeCollector(
+            session_stats,
+            scheduler_stats,
+            breaker_stats,
+            coalescing_stats,
+            admission_stats,
+        )
+    )
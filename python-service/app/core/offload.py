@@ -0,0 +1,54 @@
+"""Running CPU-bound work off the event loop."""
+import asyncio
+import contextvars
+from concurrent.futures import ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from app.core.config import settings
+from app.core.metrics import cpu_offloaded
+
+T = TypeVar("T")
+
+_executor: Optional[ThreadPoolExecutor] = None
+
+
+def _get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.offload_workers, thread_name_prefix="cpu-offload"
+        )
+    return _executor
+
+
+async def run_cpu_bound(
+    operation: str, work: Callable[[], T], size: int, threshold: int
+) -> T:
+    """
+    Run `work` inline when its input `size` is below `threshold`, otherwise
+    on the worker pool so the event loop keeps serving other requests.
+
+    Small inputs stay inline: the hand-off to a thread costs more than the
+    work. The pool is threads rather than processes because the inputs
+    (session segments, whole documents) would be expensive to pickle.
+    NumPy scoring releases the GIL and runs in parallel; pure-Python work
+    such as chunking still holds it, but the interpreter switches threads
+    every few milliseconds, so the loop is delayed by that slice rather
+    than by the whole call.
+    """
+    if settings.offload_workers <= 0 or size < threshold:
+        return work()
+    cpu_offloaded.labels(operation).inc()
+    # Carry context vars (request ID for logs) into the worker thread
+    context = contextvars.copy_context()
+    return await asyncio.get_running_loop().run_in_executor(
+        _get_executor(), context.run, work
+    )
+
+
+def shutdown_offload_pool() -> None:
+    """Stop the worker threads; queued work is cancelled."""
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
@@ -0,0 +1,106 @@
+"""On-demand and sampled request profiling."""
+import cProfile
+import hmac
+import io
+import itertools
+import pstats
+import uuid
+from collections import OrderedDict, deque
+from typing import Deque, Optional
+
+from app.core.config import settings
+
+# Individually requested profiles kept for retrieval
+MAX_STORED_PROFILES = 20
+# Sampled profiles combined into the rolling aggregate
+ROLLING_WINDOW = 100
+
+
+class RequestProfiler:
+    """
+    Runs selected requests under cProfile. A request is profiled when it
+    carries the profiling token (its profile is stored under an ID for
+    retrieval), or when it is the Nth request in sampled mode (its profile
+    joins a rolling aggregate of the last `ROLLING_WINDOW` samples).
+
+    cProfile is per thread and only one profiler can be active at a time,
+    so a request arriving while another is being profiled runs normally.
+    Because requests share the event loop thread, a profile also includes
+    whatever other coroutines ran while the profiled one was awaiting.
+    """
+
+    def __init__(self, token: str | None = None, sample_every: int | None = None):
+        self.token = token if token is not None else settings.profiling_token
+        self.sample_every = (
+            settings.profiling_sample_every if sample_every is None else sample_every
+        )
+        self._active: Optional[cProfile.Profile] = None
+        self._stored: "OrderedDict[str, cProfile.Profile]" = OrderedDict()
+        self._samples: Deque[cProfile.Profile] = deque(maxlen=ROLLING_WINDOW)
+        self._counter = itertools.count(1)
+
+    @property
+    def enabled(self) -> bool:
+        return bool(self.token)
+
+    def authorized(self, token: str | None) -> bool:
+        """Whether a presented token matches the configured one."""
+        return bool(self.token and token) and hmac.compare_digest(
+            token.encode(), self.token.encode()
+        )
+
+    def should_sample(self) -> bool:
+        """Pick 1 in `sample_every` requests for the rolling profile."""
+        return self.sample_every > 0 and next(self._counter) % self.sample_every == 0
+
+    def begin(self) -> Optional[cProfile.Profile]:
+        """Start profiling, or return None if a profile is already running."""
+        if self._active is not None:
+            return None
+        self._active = cProfile.Profile()
+        self._active.enable()
+        return self._active
+
+    def end(self, profile: cProfile.Profile, profile_id: str | None = None) -> None:
+        """Stop profiling; store it under `profile_id` or add it to the samples."""
+        profile.disable()
+        self._active = None
+        if profile_id is None:
+            self._samples.append(profile)
+            return
+        self._stored[profile_id] = profile
+        while len(self._stored) > MAX_STORED_PROFILES:
+            self._stored.popitem(last=False)
+
+    @staticmethod
+    def new_profile_id() -> str:
+        return uuid.uuid4().hex
+
+    def report(self, profile_id: str, limit: int = 50) -> Optional[str]:
+        """Text report of a stored profile, or None if unknown or evicted."""
+        profile = self._stored.get(profile_id)
+        if profile is None:
+            return None
+        return _format(pstats.Stats(profile), limit)
+
+    def aggregate_report(self, limit: int = 50) -> Optional[str]:
+        """Text report combining the sampled profiles, or None if empty."""
+        if not self._samples:
+            return None
+        samples = list(self._samples)
+        stats = pstats.Stats(samples[0])
+        for profile in samples[1:]:
+            stats.add(profile)
+        header = f"Aggregated over {len(samples)} sampled requests\n"
+        return header + _format(stats, limit)
+
+
+def _format(stats: pstats.Stats, limit: int) -> str:
+    stream = io.StringIO()
+    stats.stream = stream
+    stats.sort_stats("cumulative").print_stats(limit)
+    return stream.getvalue()
+
+
+# Global profiler used by the profiling middleware and admin endpoints
+request_profiler = RequestProfiler()
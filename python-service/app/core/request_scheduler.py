@@ -0,0 +1,172 @@
+"""Priority scheduling of outbound Gemini requests."""
+import asyncio
+import time
+from collections import OrderedDict, deque
+from contextlib import asynccontextmanager, contextmanager
+from contextvars import ContextVar
+from enum import IntEnum
+from typing import AsyncIterator, Deque, Dict, Iterator, List, Optional, Tuple
+
+from app.core.config import settings
+
+
+class Priority(IntEnum):
+    """Traffic classes, most urgent first."""
+
+    INTERACTIVE = 0
+    INGESTION = 1
+    WARMUP = 2
+
+
+# Class and session of the Gemini calls made by the current task
+_request_class: ContextVar[Tuple[Priority, Optional[str]]] = ContextVar(
+    "request_class", default=(Priority.INTERACTIVE, None)
+)
+
+
+@contextmanager
+def request_class(priority: Priority, session_id: str | None = None) -> Iterator[None]:
+    """Tag Gemini calls made inside the block with a traffic class."""
+    token = _request_class.set((priority, session_id))
+    try:
+        yield
+    finally:
+        _request_class.reset(token)
+
+
+def current_request_class() -> Tuple[Priority, Optional[str]]:
+    """Return the traffic class and session of the current task."""
+    return _request_class.get()
+
+
+class _ClassQueue:
+    """Waiters of one priority class, queued per session for round-robin."""
+
+    def __init__(self, sample_size: int) -> None:
+        self.sessions: "OrderedDict[Optional[str], Deque[asyncio.Future]]" = (
+            OrderedDict()
+        )
+        self.waits: Deque[float] = deque(maxlen=sample_size)
+        self.granted = 0
+
+    def __len__(self) -> int:
+        return sum(len(q) for q in self.sessions.values())
+
+    def push(self, session_id: Optional[str], waiter: asyncio.Future) -> None:
+        self.sessions.setdefault(session_id, deque()).append(waiter)
+
+    def pop(self) -> Optional[asyncio.Future]:
+        """Take the next live waiter, rotating between sessions."""
+        while self.sessions:
+            session_id, waiters = next(iter(self.sessions.items()))
+            waiter = waiters.popleft()
+            if waiters:
+                self.sessions.move_to_end(session_id)
+            else:
+                del self.sessions[session_id]
+            if not waiter.done():
+                return waiter
+        return None
+
+    def discard(self, session_id: Optional[str], waiter: asyncio.Future) -> None:
+        waiters = self.sessions.get(session_id)
+        if waiters is None:
+            return
+        try:
+            waiters.remove(waiter)
+        except ValueError:
+            return
+        if not waiters:
+            del self.sessions[session_id]
+
+
+class RequestScheduler:
+    """
+    Bounds concurrent Gemini requests and hands free slots out by priority:
+    interactive queries before ingestion before background warm-up. Within
+    a class, sessions take turns, so one large upload cannot monopolise the
+    ingestion share. Callers hold a slot per API call rather than per
+    document, so an interactive query waits for at most one in-flight call.
+
+    Time spent queued is sampled per class for `stats()`.
+    """
+
+    def __init__(self, max_concurrency: int | None = None, sample_size: int = 1024):
+        self.max_concurrency = max_concurrency or settings.gemini_max_concurrency
+        self._in_flight = 0
+        self._queues: Dict[Priority, _ClassQueue] = {
+            priority: _ClassQueue(sample_size) for priority in Priority
+        }
+
+    @asynccontextmanager
+    async def slot(
+        self, priority: Priority | None = None, session_id: str | None = None
+    ) -> AsyncIterator[None]:
+        """Hold one request slot; defaults to the current `request_class`."""
+        if priority is None:
+            priority, session_id = current_request_class()
+        await self._acquire(priority, session_id)
+        try:
+            yield
+        finally:
+            self._release()
+
+    def stats(self) -> dict:
+        """Return in-flight count and queue depth and wait times per class."""
+        classes = {}
+        for priority, queue in self._queues.items():
+            waits = sorted(queue.waits)
+            classes[priority.name.lower()] = {
+                "queued": len(queue),
+                "granted": queue.granted,
+                "wait_p50_ms": _percentile(waits, 0.50),
+                "wait_p99_ms": _percentile(waits, 0.99),
+                "wait_max_ms": waits[-1] * 1000 if waits else 0.0,
+            }
+        return {
+            "max_concurrency": self.max_concurrency,
+            "in_flight": self._in_flight,
+            "classes": classes,
+        }
+
+    async def _acquire(self, priority: Priority, session_id: Optional[str]) -> None:
+        queue = self._queues[priority]
+        started = time.monotonic()
+        if self._in_flight < self.max_concurrency and not self._has_waiters():
+            self._in_flight += 1
+        else:
+            waiter = asyncio.get_running_loop().create_future()
+            queue.push(session_id, waiter)
+            try:
+                # The releasing task transfers its slot to us
+                await waiter
+            except asyncio.CancelledError:
+                if waiter.done() and not waiter.cancelled():
+                    self._release()  # Granted just as we were cancelled
+                else:
+                    queue.discard(session_id, waiter)
+                raise
+        queue.granted += 1
+        queue.waits.append(time.monotonic() - started)
+
+    def _release(self) -> None:
+        for priority in Priority:
+            waiter = self._queues[priority].pop()
+            if waiter is not None:
+                waiter.set_result(None)
+                return
+        self._in_flight -= 1
+
+    def _has_waiters(self) -> bool:
+        return any(queue.sessions for queue in self._queues.values())
+
+
+def _percentile(sorted_values: List[float], q: float) -> float:
+    if not sorted_values:
+        return 0.0
+    index = min(len(sorted_values) - 1, int(q * len(sorted_values)))
+    return sorted_values[index] * 1000
+
+
+# Global scheduler shared by all Gemini clients
+request_scheduler = RequestScheduler()
@@ -0,0 +1,106 @@
+"""Compact binary encoding of sessions.
+
+A session is encoded as an uncompressed ``.npz`` archive: one float32 array
+per document embedding segment plus a JSON chunk table stored as raw bytes.
+"""
+import io
+import json
+from datetime import datetime
+from typing import Any, Dict
+
+import numpy as np
+
+from app.services.vector_search.bm25 import build_bm25_index
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.facts import Fact
+from app.types.session import Session, SessionDocument
+
+CODEC_VERSION = 1
+
+
+def encode_session(session: Session) -> bytes:
+    """Encode a session to bytes."""
+    documents = list(session.documents.values())
+    meta: Dict[str, Any] = {
+        "version": CODEC_VERSION,
+        "session_id": session.session_id,
+        "source_type": session.source_type,
+        "created_at": session.created_at.isoformat(),
+        "expires_at": session.expires_at.isoformat(),
+        "documents": [
+            {
+                "name": doc.name,
+                "source_type": doc.source_type,
+                # Chunk table rows: id, text, index, section, page, source type
+                "chunks": [
+                    [
+                        chunk.id,
+                        chunk.text,
+                        chunk.index,
+                        chunk.metadata.section,
+                        chunk.metadata.page_number,
+                        chunk.metadata.source_type,
+                    ]
+                    for chunk in doc.chunks
+                ],
+                "facts": [[f.kind, f.value, f.chunk_id] for f in doc.facts],
+            }
+            for doc in documents
+        ],
+    }
+    arrays = {f"embeddings_{i}": doc.embeddings for i, doc in enumerate(documents)}
+    arrays["meta"] = np.frombuffer(
+        json.dumps(meta, separators=(",", ":")).encode("utf-8"), dtype=np.uint8
+    )
+
+    buffer = io.BytesIO()
+    np.savez(buffer, **arrays)
+    return buffer.getvalue()
+
+
+def decode_session(data: bytes) -> Session:
+    """Decode a session previously produced by `encode_session`."""
+    with np.load(io.BytesIO(data), allow_pickle=False) as archive:
+        meta = json.loads(archive["meta"].tobytes().decode("utf-8"))
+        if meta.get("version") != CODEC_VERSION:
+            raise ValueError(
+                f"Unsupported session codec version: {meta.get('version')}"
+            )
+
+        session = Session(
+            session_id=meta["session_id"],
+            source_type=meta["source_type"],
+            created_at=datetime.fromisoformat(meta["created_at"]),
+            expires_at=datetime.fromisoformat(meta["expires_at"]),
+        )
+        documents = {}
+        for i, doc in enumerate(meta["documents"]):
+            chunks = [
+                Chunk(
+                    id=chunk_id,
+                    text=text,
+                    index=index,
+                    metadata=ChunkMetadata(
+                        section=section,
+                        page_number=page_number,
+                        source_type=source_type,
+                    ),
+                )
+                for chunk_id, text, index, section, page_number, source_type in doc[
+                    "chunks"
+                ]
+            ]
+            documents[doc["name"]] = SessionDocument(
+                name=doc["name"],
+                source_type=doc["source_type"],
+                chunks=chunks,
+                embeddings=archive[f"embeddings_{i}"],
+                facts=[
+                    Fact(kind=kind, value=value, chunk_id=chunk_id)
+                    for kind, value, chunk_id in doc.get("facts", [])
+                ],
+                # Cheap to rebuild, so the index isn't stored
+                lexical_index=build_bm25_index(chunks),
+            )
+        session.documents = documents
+    return session
@@ -1,23 +1,88 @@
 """Session storage and TTL management."""
+import asyncio
+import heapq
 import threading
 import time
+from collections import OrderedDict
 from datetime import datetime, timedelta
-from typing import Dict, Optional
+from typing import Callable, Dict, List, Optional, Tuple
 
 from app.core.config import settings
-from app.core.exceptions import SessionNotFoundError
+from app.core.exceptions import SessionConflictError, SessionNotFoundError
+from app.core.session_snapshot import read_snapshot, write_snapshot
+from app.core.session_store import SessionBackend, create_session_backend
 from app.types.session import Session
-from app.utils.logger import logger
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+# Attempts at an update before giving up on a session under heavy contention
+MAX_UPDATE_ATTEMPTS = 5
+
+
+class _Shard:
+    """One stripe of session bookkeeping, guarded by its own lock."""
+
+    def __init__(self) -> None:
+        self.lock = threading.Lock()
+        # Ordered from least to most recently used
+        self.sessions: "OrderedDict[str, Session]" = OrderedDict()
+        self.usage: Dict[str, int] = {}
+        self.last_used: Dict[str, float] = {}
+        self.expiry_heap: List[Tuple[float, str]] = []
 
 
 class SessionManager:
-    """In-memory session manager with TTL expiration."""
+    """
+    Session manager with TTL expiration over a pluggable storage backend.
+    Capacity is governed by a memory budget: when the accounted size of all
+    sessions exceeds it, the least recently used sessions are evicted.
 
-    def __init__(self, ttl_minutes: int | None = None):
-        self._sessions: Dict[str, Session] = {}
-        self._lock = threading.Lock()
+    Deadlines live in a min-heap holding at most one entry per session, so
+    purging costs O(expired). With sliding TTL, access only moves the
+    session's `expires_at`; its heap entry is re-pushed lazily when popped.
+
+    Bookkeeping is striped across shards keyed by session ID, each with its
+    own lock, so requests for different sessions don't contend. No code path
+    holds two shard locks at once. Session content is never locked by
+    readers: documents are swapped in whole (see `Session.add_document`).
+
+    LRU order, the heap and memory accounting cover the sessions this process
+    has seen; with a shared backend, sessions created by other workers are
+    adopted on first access. Budget eviction only releases this process's
+    copy, and expiry is confirmed against the backend before deleting, since
+    another worker may have extended the TTL.
+    """
+
+    def __init__(
+        self,
+        ttl_minutes: int | None = None,
+        memory_budget_bytes: int | None = None,
+        max_sessions: int | None = None,
+        sliding_ttl: bool | None = None,
+        backend: SessionBackend | None = None,
+        lock_stripes: int | None = None,
+    ):
+        self._shards = [
+            _Shard() for _ in range(lock_stripes or settings.session_lock_stripes)
+        ]
+        # Guards the counters below; always acquired last
+        self._stats_lock = threading.Lock()
+        self._session_count = 0
+        self._total_bytes = 0
+        self._evictions = 0
+        self._expirations = 0
+        self._backend = backend or create_session_backend(
+            settings.session_backend, settings.session_store_path
+        )
         self.ttl_minutes = ttl_minutes or settings.session_ttl_minutes
-        self._start_cleanup_task()
+        self.sliding_ttl = (
+            settings.session_sliding_ttl if sliding_ttl is None else sliding_ttl
+        )
+        self.memory_budget_bytes = (
+            memory_budget_bytes or settings.session_memory_budget_mb * 1024 * 1024
+        )
+        self.max_sessions = max_sessions or settings.max_sessions
 
     def create_session(
         self, session_id: str, source_type: str
@@ -26,68 +91,283 @@ class SessionManager:
         expires_at = datetime.now() + timedelta(minutes=self.ttl_minutes)
         session = Session(
             session_id=session_id,
-            chunks=[],
-            embeddings=[],
             source_type=source_type,
             created_at=datetime.now(),
             expires_at=expires_at,
         )
-        with self._lock:
-            if len(self._sessions) >= settings.max_sessions:
-                # Remove oldest expired session if any
-                self._cleanup_expired_sessions()
-                if len(self._sessions) >= settings.max_sessions:
-                    raise ValueError("Maximum sessions reached")
-            self._sessions[session_id] = session
+        if self._session_count >= self.max_sessions:
+            self.purge_expired()
+        shard = self._shard(session_id)
+        with shard.lock:
+            self._backend.store(session)
+            self._track(shard, session)
+        self._enforce_budget(keep=session_id)
         logger.info(f"Created session: {session_id}")
         return session
 
-    def get_session(self, session_id: str) -> Optional[Session]:
-        """Get session if not expired."""
-        with self._lock:
-            session = self._sessions.get(session_id)
-            if session and not session.is_expired():
-                return session
-            elif session:
-                # Session expired, remove it
-                del self._sessions[session_id]
+    def get_session(
+        self, session_id: str, touch: bool = True
+    ) -> Optional[Session]:
+        """Get session if not expired.
+
+        Background readers pass touch=False so they neither refresh the LRU
+        position nor extend a sliding TTL.
+        """
+        shard = self._shard(session_id)
+        with shard.lock:
+            session = self._backend.load(session_id)
+            if session is None:
+                # Deleted elsewhere (another worker or an external purge)
+                self._forget(shard, session_id)
+                return None
+            if session.is_expired():
+                self._remove(shard, session_id)
                 logger.info(f"Session expired and removed: {session_id}")
-            return None
+                return None
+            if not touch and session_id in shard.sessions:
+                return session
+            self._track(shard, session)
+            if touch and self.sliding_ttl:
+                session.expires_at = datetime.now() + timedelta(
+                    minutes=self.ttl_minutes
+                )
+                self._backend.touch(session_id, session.expires_at)
+            return session
+
+    def save_session(self, session: Session) -> None:
+        """Persist a modified session, re-measure it and enforce the budget.
+
+        Raises SessionConflictError if the session was stored elsewhere since
+        this copy was loaded; use `update_session` to re-apply the change.
+        """
+        shard = self._shard(session.session_id)
+        with shard.lock:
+            if session.session_id not in shard.sessions:
+                raise SessionNotFoundError(session.session_id)
+            self._backend.store(session)
+            self._track(shard, session)
+        self._enforce_budget(keep=session.session_id)
+
+    def update_session(
+        self, session_id: str, mutate: Callable[[Session], None]
+    ) -> Session:
+        """Apply `mutate` to the current session and persist the result.
+
+        If another worker stores the session between our load and save, the
+        session is reloaded and `mutate` applied again, so neither update is
+        lost.
+        """
+        for _ in range(MAX_UPDATE_ATTEMPTS):
+            session = self.get_session(session_id, touch=False)
+            if session is None:
+                raise SessionNotFoundError(session_id)
+            mutate(session)
+            try:
+                self.save_session(session)
+                return session
+            except SessionConflictError:
+                logger.info(f"Session {session_id} changed concurrently; retrying")
+        raise SessionConflictError(session_id)
 
     def delete_session(self, session_id: str) -> bool:
         """Explicitly delete session."""
-        with self._lock:
-            if session_id in self._sessions:
-                del self._sessions[session_id]
-                logger.info(f"Session deleted: {session_id}")
-                return True
-            return False
-
-    def _cleanup_expired_sessions(self) -> None:
-        """Remove expired sessions."""
-        expired = [
-            sid
-            for sid, session in self._sessions.items()
-            if session.is_expired()
-        ]
-        for sid in expired:
-            del self._sessions[sid]
-        if expired:
-            logger.info(f"Cleaned up {len(expired)} expired sessions")
+        shard = self._shard(session_id)
+        with shard.lock:
+            deleted = self._backend.delete(session_id)
+            self._forget(shard, session_id)
+        if deleted:
+            logger.info(f"Session deleted: {session_id}")
+        return deleted
+
+    def stats(self) -> dict:
+        """Return session count and memory accounting."""
+        active_sessions = self._backend.count()
+        with self._stats_lock:
+            return {
+                "active_sessions": active_sessions,
+                "max_sessions": self.max_sessions,
+                "memory_bytes": self._total_bytes,
+                "memory_budget_bytes": self.memory_budget_bytes,
+                "evictions": self._evictions,
+                "expirations": self._expirations,
+            }
+
+    def purge_expired(self, now: float | None = None) -> int:
+        """Remove sessions whose deadline has passed. Returns count removed."""
+        now = now if now is not None else time.time()
+        removed = sum(self._purge_shard(shard, now) for shard in self._shards)
+        # Sessions written by other workers that this process never saw
+        for sid in self._backend.purge_expired(now):
+            shard = self._shard(sid)
+            with shard.lock:
+                self._forget(shard, sid)
+            removed += 1
+        if removed:
+            with self._stats_lock:
+                self._expirations += removed
+            logger.info(f"Cleaned up {removed} expired sessions")
+        return removed
+
+    async def run_cleanup(self, interval_seconds: float | None = None) -> None:
+        """Purge expired sessions periodically until cancelled."""
+        interval = interval_seconds or settings.session_cleanup_interval_seconds
+        while True:
+            await asyncio.sleep(interval)
+            self.purge_expired()
+
+    def snapshot(self, path: str, key: str | None = None) -> int:
+        """Write live sessions to a snapshot file. Returns the number written."""
+        sessions: List[Session] = []
+        for shard in self._shards:
+            with shard.lock:
+                sessions.extend(
+                    s for s in shard.sessions.values() if not s.is_expired()
+                )
+        count = write_snapshot(sessions, path, key)
+        logger.info(f"Wrote snapshot of {count} sessions to {path}")
+        return count
+
+    def restore(self, path: str, key: str | None = None) -> int:
+        """Load unexpired sessions from a snapshot. Returns the number restored."""
+        restored = 0
+        for session in read_snapshot(path, key):
+            if session.is_expired():
+                continue
+            shard = self._shard(session.session_id)
+            with shard.lock:
+                try:
+                    self._backend.store(session)
+                except SessionConflictError:
+                    continue  # Another worker already holds a newer copy
+                self._track(shard, session)
+            self._enforce_budget(keep=session.session_id)
+            restored += 1
+        logger.info(f"Restored {restored} sessions from {path}")
+        return restored
+
+    async def run_snapshots(
+        self, path: str, interval_seconds: float, key: str | None = None
+    ) -> None:
+        """Write snapshots periodically until cancelled."""
+        while True:
+            await asyncio.sleep(interval_seconds)
+            try:
+                await asyncio.to_thread(self.snapshot, path, key)
+            except Exception as e:
+                logger.error(f"Session snapshot failed: {e}")
+
+    def close(self) -> None:
+        """Release the storage backend."""
+        self._backend.close()
 
-    def _start_cleanup_task(self) -> None:
-        """Start background task to cleanup expired sessions."""
-        def cleanup_loop():
-            while True:
-                time.sleep(60)  # Check every minute
-                with self._lock:
-                    self._cleanup_expired_sessions()
+    def _shard(self, session_id: str) -> _Shard:
+        return self._shards[hash(session_id) % len(self._shards)]
 
-        # Start cleanup thread
-        cleanup_thread = threading.Thread(target=cleanup_loop, daemon=True)
-        cleanup_thread.start()
+    def _track(self, shard: _Shard, session: Session) -> None:
+        """Record a session as most recently used and re-measure it.
+
+        Caller holds the shard lock.
+        """
+        session_id = session.session_id
+        is_new = session_id not in shard.usage
+        if is_new:
+            heapq.heappush(
+                shard.expiry_heap, (session.expires_at.timestamp(), session_id)
+            )
+        shard.sessions[session_id] = session
+        shard.sessions.move_to_end(session_id)
+        shard.last_used[session_id] = time.monotonic()
+
+        size = session.memory_bytes()
+        delta = size - shard.usage.get(session_id, 0)
+        shard.usage[session_id] = size
+        with self._stats_lock:
+            self._total_bytes += delta
+            self._session_count += is_new
+
+    def _remove(self, shard: _Shard, session_id: str) -> None:
+        """Delete a session from the backend and local bookkeeping."""
+        self._backend.delete(session_id)
+        self._forget(shard, session_id)
+
+    def _release(self, shard: _Shard, session_id: str) -> None:
+        """Drop this process's copy of a session; the backend decides the rest."""
+        self._backend.release(session_id)
+        self._forget(shard, session_id)
+
+    def _forget(self, shard: _Shard, session_id: str) -> None:
+        """Drop a session from local bookkeeping. Caller holds the shard lock."""
+        if session_id not in shard.usage:
+            return
+        shard.sessions.pop(session_id, None)
+        shard.last_used.pop(session_id, None)
+        size = shard.usage.pop(session_id)
+        with self._stats_lock:
+            self._total_bytes -= size
+            self._session_count -= 1
+
+    def _over_budget(self) -> bool:
+        with self._stats_lock:
+            return (
+                self._total_bytes > self.memory_budget_bytes
+                or self._session_count > self.max_sessions
+            )
+
+    def _enforce_budget(self, keep: str) -> None:
+        """Evict least recently used sessions until within budget."""
+        while self._over_budget():
+            # Each shard is LRU-ordered; compare their oldest entries
+            oldest: Tuple[float, str, _Shard] | None = None
+            for shard in self._shards:
+                with shard.lock:
+                    for sid in shard.sessions:
+                        if sid == keep:
+                            continue
+                        last_used = shard.last_used[sid]
+                        if oldest is None or last_used < oldest[0]:
+                            oldest = (last_used, sid, shard)
+                        break
+            if oldest is None:
+                logger.warning(
+                    f"Session {keep} alone exceeds the session memory budget"
+                )
+                return
+            _, victim, shard = oldest
+            with shard.lock:
+                if victim not in shard.sessions:
+                    continue  # Removed concurrently; re-check the budget
+                self._release(shard, victim)
+            with self._stats_lock:
+                self._evictions += 1
+            logger.info(f"Evicted least recently used session: {victim}")
+
+    def _purge_shard(self, shard: _Shard, now: float) -> int:
+        """Pop due heap entries in one shard and drop expired sessions."""
+        removed = 0
+        with shard.lock:
+            heap = shard.expiry_heap
+            while heap and heap[0][0] <= now:
+                _, sid = heapq.heappop(heap)
+                session = shard.sessions.get(sid)
+                if session is None:
+                    continue  # Already deleted or evicted
+                deadline = session.expires_at.timestamp()
+                if deadline <= now:
+                    if self._backend.delete_if_expired(sid, now):
+                        self._forget(shard, sid)
+                        removed += 1
+                        continue
+                    # Our copy is stale: another worker extended or deleted it
+                    session = self._backend.load(sid)
+                    if session is None:
+                        self._forget(shard, sid)
+                        continue
+                    shard.sessions[sid] = session
+                    deadline = session.expires_at.timestamp()
+                # Deadline slid forward since this entry was pushed
+                heapq.heappush(heap, (deadline, sid))
+        return removed
 
 
 # Global session manager instance
 session_manager = SessionManager()
-
@@ -0,0 +1,80 @@
+"""Session snapshots for warm restart and instance hand-off.
+
+A snapshot file is a short header followed by length-prefixed session
+records produced by `encode_session`. When a key is configured, everything
+after the header is encrypted with Fernet (AES-128-CBC + HMAC).
+"""
+import os
+import struct
+from typing import Iterable, List
+
+from app.core.session_codec import decode_session, encode_session
+from app.types.session import Session
+
+SNAPSHOT_MAGIC = b"RLSNAP1"
+FLAG_PLAIN = b"\x00"
+FLAG_ENCRYPTED = b"\x01"
+_RECORD_LENGTH = struct.Struct("<I")
+
+
+def _fernet(key: str):
+    """Build a Fernet cipher, importing `cryptography` only when needed."""
+    try:
+        from cryptography.fernet import Fernet
+    except ImportError as e:  # pragma: no cover - depends on environment
+        raise RuntimeError(
+            "Encrypted session snapshots require the 'cryptography' package"
+        ) from e
+    return Fernet(key.encode("utf-8") if isinstance(key, str) else key)
+
+
+def write_snapshot(
+    sessions: Iterable[Session], path: str, key: str | None = None
+) -> int:
+    """Write sessions to `path` atomically. Returns the number written."""
+    records = []
+    for session in sessions:
+        data = encode_session(session)
+        records.append(_RECORD_LENGTH.pack(len(data)))
+        records.append(data)
+    body = b"".join(records)
+
+    if key:
+        header = SNAPSHOT_MAGIC + FLAG_ENCRYPTED
+        body = _fernet(key).encrypt(body)
+    else:
+        header = SNAPSHOT_MAGIC + FLAG_PLAIN
+
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "wb") as f:
+        f.write(header)
+        f.write(body)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp_path, path)
+    return len(records) // 2
+
+
+def read_snapshot(path: str, key: str | None = None) -> List[Session]:
+    """Read sessions from a snapshot written by `write_snapshot`."""
+    with open(path, "rb") as f:
+        data = f.read()
+
+    header_size = len(SNAPSHOT_MAGIC) + 1
+    if data[: len(SNAPSHOT_MAGIC)] != SNAPSHOT_MAGIC:
+        raise ValueError(f"Not a session snapshot: {path}")
+    flag, body = data[len(SNAPSHOT_MAGIC) : header_size], data[header_size:]
+
+    if flag == FLAG_ENCRYPTED:
+        if not key:
+            raise ValueError("Session snapshot is encrypted but no key is set")
+        body = _fernet(key).decrypt(body)
+
+    sessions: List[Session] = []
+    offset = 0
+    while offset < len(body):
+        (length,) = _RECORD_LENGTH.unpack_from(body, offset)
+        offset += _RECORD_LENGTH.size
+        sessions.append(decode_session(body[offset : offset + length]))
+        offset += length
+    return sessions
@@ -0,0 +1,226 @@
+"""Pluggable session storage backends."""
+import sqlite3
+import threading
+from abc import ABC, abstractmethod
+from datetime import datetime
+from typing import Dict, List, Optional, Tuple
+
+from app.core.exceptions import SessionConflictError
+from app.core.session_codec import decode_session, encode_session
+from app.types.session import Session
+
+
+class SessionBackend(ABC):
+    """Storage behind SessionManager."""
+
+    @abstractmethod
+    def load(self, session_id: str) -> Optional[Session]:
+        """Return the current version of a session, or None."""
+
+    @abstractmethod
+    def store(self, session: Session) -> None:
+        """Insert a new session or replace the version it was loaded at.
+
+        Raises SessionConflictError if another writer stored the session
+        since then (or, for a new session, already created it).
+        """
+
+    @abstractmethod
+    def delete(self, session_id: str) -> bool:
+        """Remove a session. Returns True if it existed."""
+
+    @abstractmethod
+    def count(self) -> int:
+        """Return the number of stored sessions."""
+
+    def touch(self, session_id: str, expires_at: datetime) -> None:
+        """Persist a new expiry without rewriting the session."""
+
+    def delete_if_expired(self, session_id: str, now: float) -> bool:
+        """Remove a session only if its stored expiry is at or before `now`."""
+        session = self.load(session_id)
+        if session is None or session.expires_at.timestamp() > now:
+            return False
+        return self.delete(session_id)
+
+    def release(self, session_id: str) -> None:
+        """Drop this process's copy of a session, e.g. on budget eviction.
+
+        Backends holding sessions only in this process have nothing else to
+        fall back on, so by default this deletes the session.
+        """
+        self.delete(session_id)
+
+    def purge_expired(self, now: float) -> List[str]:
+        """Remove sessions expired at `now` that the caller may not track."""
+        return []
+
+    def close(self) -> None:
+        """Release backend resources."""
+
+
+class InMemorySessionBackend(SessionBackend):
+    """Process-local dict of live Session objects (the default)."""
+
+    def __init__(self) -> None:
+        self._sessions: Dict[str, Session] = {}
+
+    def load(self, session_id: str) -> Optional[Session]:
+        return self._sessions.get(session_id)
+
+    def store(self, session: Session) -> None:
+        self._sessions[session.session_id] = session
+
+    def delete(self, session_id: str) -> bool:
+        return self._sessions.pop(session_id, None) is not None
+
+    def count(self) -> int:
+        return len(self._sessions)
+
+
+class SQLiteSessionBackend(SessionBackend):
+    """
+    Sessions shared between worker processes through one SQLite file.
+    Each row holds an encoded session and a version counter; every process
+    keeps decoded copies and only re-decodes a session when its version moves,
+    so repeat reads cost one indexed lookup. Writes are compare-and-swap on
+    the version a copy was loaded at, so one worker can't overwrite another's
+    update with a stale copy.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._conn = sqlite3.connect(
+            path, timeout=30, check_same_thread=False, isolation_level=None
+        )
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        self._conn.execute(
+            """
+            CREATE TABLE IF NOT EXISTS sessions (
+                session_id TEXT PRIMARY KEY,
+                version INTEGER NOT NULL,
+                expires_at REAL NOT NULL,
+                payload BLOB NOT NULL
+            )
+            """
+        )
+        self._conn.execute(
+            "CREATE INDEX IF NOT EXISTS sessions_expires_at ON sessions (expires_at)"
+        )
+        self._lock = threading.Lock()
+        self._cache: Dict[str, Tuple[int, Session]] = {}
+
+    def load(self, session_id: str) -> Optional[Session]:
+        with self._lock:
+            row = self._conn.execute(
+                "SELECT version, expires_at FROM sessions WHERE session_id = ?",
+                (session_id,),
+            ).fetchone()
+            if row is None:
+                self._cache.pop(session_id, None)
+                return None
+            version, expires_at = row
+            cached = self._cache.get(session_id)
+            if cached and cached[0] == version:
+                session = cached[1]
+            else:
+                (payload,) = self._conn.execute(
+                    "SELECT payload FROM sessions WHERE session_id = ?",
+                    (session_id,),
+                ).fetchone()
+                session = decode_session(payload)
+                session.version = version
+                self._cache[session_id] = (version, session)
+            # Expiry may be moved by other workers without a version bump
+            session.expires_at = datetime.fromtimestamp(expires_at)
+            return session
+
+    def store(self, session: Session) -> None:
+        payload = encode_session(session)
+        expires_at = session.expires_at.timestamp()
+        with self._lock:
+            if session.version == 0:
+                cursor = self._conn.execute(
+                    """
+                    INSERT INTO sessions (session_id, version, expires_at, payload)
+                    VALUES (?, 1, ?, ?)
+                    ON CONFLICT (session_id) DO NOTHING
+                    """,
+                    (session.session_id, expires_at, payload),
+                )
+            else:
+                cursor = self._conn.execute(
+                    """
+                    UPDATE sessions
+                    SET version = version + 1, expires_at = ?, payload = ?
+                    WHERE session_id = ? AND version = ?
+                    """,
+                    (expires_at, payload, session.session_id, session.version),
+                )
+            if cursor.rowcount == 0:
+                raise SessionConflictError(session.session_id)
+            session.version += 1
+            self._cache[session.session_id] = (session.version, session)
+
+    def delete(self, session_id: str) -> bool:
+        with self._lock:
+            self._cache.pop(session_id, None)
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ?", (session_id,)
+            )
+            return cursor.rowcount > 0
+
+    def count(self) -> int:
+        with self._lock:
+            (count,) = self._conn.execute("SELECT COUNT(*) FROM sessions").fetchone()
+            return count
+
+    def delete_if_expired(self, session_id: str, now: float) -> bool:
+        # Checked in the same statement, so a concurrent touch wins
+        with self._lock:
+            cursor = self._conn.execute(
+                "DELETE FROM sessions WHERE session_id = ? AND expires_at <= ?",
+                (session_id, now),
+            )
+            if cursor.rowcount > 0:
+                self._cache.pop(session_id, None)
+                return True
+            return False
+
+    def release(self, session_id: str) -> None:
+        # Other workers may still be serving it; only drop the decoded copy
+        with self._lock:
+            self._cache.pop(session_id, None)
+
+    def touch(self, session_id: str, expires_at: datetime) -> None:
+        with self._lock:
+            self._conn.execute(
+                "UPDATE sessions SET expires_at = ? WHERE session_id = ?",
+                (expires_at.timestamp(), session_id),
+            )
+
+    def purge_expired(self, now: float) -> List[str]:
+        with self._lock:
+            rows = self._conn.execute(
+                "DELETE FROM sessions WHERE expires_at <= ? RETURNING session_id",
+                (now,),
+            ).fetchall()
+            for (session_id,) in rows:
+                self._cache.pop(session_id, None)
+            return [session_id for (session_id,) in rows]
+
+    def close(self) -> None:
+        with self._lock:
+            self._conn.close()
+
+
+def create_session_backend(name: str, path: str | None = None) -> SessionBackend:
+    """Create the session backend selected in settings."""
+    if name == "memory":
+        return InMemorySessionBackend()
+    if name == "sqlite":
+        if not path:
+            raise ValueError("session_store_path is required for the sqlite backend")
+        return SQLiteSessionBackend(path)
+    raise ValueError(f"Unknown session backend: {name}")
@@ -0,0 +1,97 @@
+"""Coalescing of identical in-flight requests."""
+import asyncio
+import time
+from collections import Counter
+from typing import Awaitable, Callable, Dict, Optional, Tuple, TypeVar
+
+from app.core.exceptions import DeadlineExceededError
+from app.core.request_scheduler import current_request_class
+from app.utils.text_utils import content_hash
+
+T = TypeVar("T")
+
+_Key = Tuple[Optional[str], str, str]
+
+
+class SingleFlight:
+    """
+    Runs at most one call per (session, operation, payload hash) at a time.
+    Duplicates that arrive while the first call is in flight await its
+    result instead of repeating the work, which covers frontend retries and
+    double submits. Once a call finishes its key is released, so later
+    requests run afresh.
+
+    The shared call is shielded: a caller that gives up (cancelled or past
+    its own deadline) doesn't cancel the work others are waiting on. Only
+    when every caller has given up is the shared call cancelled.
+    """
+
+    def __init__(self) -> None:
+        self._calls: Dict[_Key, asyncio.Future] = {}
+        self._waiters: Counter = Counter()
+        self._executed: Counter = Counter()
+        self._coalesced: Counter = Counter()
+
+    async def do(
+        self,
+        operation: str,
+        payload: str,
+        fn: Callable[[], Awaitable[T]],
+        session_id: str | None = None,
+        deadline: float | None = None,
+    ) -> T:
+        """Run `fn`, or join an identical call already in flight.
+
+        The session defaults to the one tagged with `request_class`.
+        `deadline` (a `time.monotonic()` value) bounds only this caller's
+        wait, raising DeadlineExceededError; `fn` itself should not apply a
+        caller's deadline, since other callers may be willing to wait longer.
+        """
+        if session_id is None:
+            session_id = current_request_class()[1]
+        key = (session_id, operation, content_hash(payload))
+        call = self._calls.get(key)
+        if call is None:
+            call = asyncio.ensure_future(fn())
+            self._calls[key] = call
+            call.add_done_callback(lambda done: self._release(key, done))
+            self._executed[operation] += 1
+        else:
+            self._coalesced[operation] += 1
+
+        self._waiters[call] += 1
+        try:
+            if deadline is None:
+                return await asyncio.shield(call)
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                raise DeadlineExceededError(operation)
+            try:
+                return await asyncio.wait_for(asyncio.shield(call), remaining)
+            except asyncio.TimeoutError:
+                raise DeadlineExceededError(operation)
+        finally:
+            self._waiters[call] -= 1
+            if not self._waiters[call]:
+                del self._waiters[call]
+                call.cancel()  # No-op once finished; otherwise nobody is left
+
+    def stats(self) -> dict:
+        """Return executed and coalesced call counts per operation."""
+        return {
+            operation: {
+                "executed": self._executed[operation],
+                "coalesced": self._coalesced[operation],
+            }
+            for operation in sorted(self._executed.keys() | self._coalesced.keys())
+        }
+
+    def _release(self, key: _Key, call: asyncio.Future) -> None:
+        if self._calls.get(key) is call:
+            del self._calls[key]
+        if not call.cancelled():
+            call.exception()  # Mark retrieved even if every caller gave up
+
+
+# Global single-flight registry for Gemini-backed work
+single_flight = SingleFlight()
@@ -1,6 +1,14 @@
 """LLM integration package."""
 from app.llm.client import LLMClient
+from app.llm.factory import create_llm_client
 from app.llm.gemini_client import GeminiClient
+from app.llm.local import LocalGenerativeModel, LocalLLMClient
 
-__all__ = ["LLMClient", "GeminiClient"]
+__all__ = [
+    "LLMClient",
+    "GeminiClient",
+    "LocalLLMClient",
+    "LocalGenerativeModel",
+    "create_llm_client",
+]
 
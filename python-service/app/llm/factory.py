@@ -0,0 +1,13 @@
+"""LLM client selected by `settings.llm_provider`."""
+from app.llm.client import LLMClient
+from app.llm.gemini_client import GeminiClient
+from app.llm.local import LocalLLMClient
+
+
+def create_llm_client(name: str, api_key: str | None = None) -> LLMClient:
+    """Create the LLM client selected in settings."""
+    if name == "gemini":
+        return GeminiClient(api_key)
+    if name == "local":
+        return LocalLLMClient()
+    raise ValueError(f"Unknown LLM provider: {name}")
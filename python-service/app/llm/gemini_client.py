@@ -1,38 +1,40 @@
 """Gemini LLM client implementation."""
-import google.generativeai as genai
+import logging
 
 from app.core.config import settings
-from app.llm.client import LLMClient
-from app.utils.logger import logger
+from app.llm.scheduled import ScheduledLLMClient
+from app.llm.sdk import load_genai
+from app.utils.logger import get_logger
 
+logger = get_logger(__name__)
 
-class GeminiClient(LLMClient):
+
+class GeminiClient(ScheduledLLMClient):
     """Gemini implementation of LLM client."""
 
     def __init__(self, api_key: str | None = None, model: str | None = None):
         # CRITICAL FIX: Use available model - gemini-1.5-flash doesn't exist!
         # Available models: gemini-2.5-flash, gemini-2.0-flash, gemini-flash-latest
         self.model_name = "gemini-2.5-flash"
-        
-        # Print to stdout to ensure we see it
-        print(f"=== GeminiClient.__init__ called - Model: {self.model_name} ===")
-        import sys
-        sys.stdout.flush()
-        
         self.api_key = api_key or settings.gemini_api_key
-        
-        logger.info(f"=== GeminiClient initialized with HARDCODED model: {self.model_name} ===")
-        logger.info(f"Config model was: {settings.gemini_model}")
-        logger.info(f"Parameter model was: {model}")
-        
+
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"GeminiClient using hardcoded model {self.model_name} "
+                f"(config: {settings.gemini_model}, parameter: {model})"
+            )
+
         # Skip all validation since we're hardcoding
+        genai = load_genai()
         genai.configure(api_key=self.api_key)
-        print(f"=== Creating GenerativeModel with: {self.model_name} ===")
-        sys.stdout.flush()
         self.model = genai.GenerativeModel(self.model_name)
-        print(f"=== GenerativeModel created successfully ===")
-        sys.stdout.flush()
         logger.info(f"GenerativeModel created with: {self.model_name}")
+        # Hedged duplicates may go to a faster fallback model
+        self.hedge_model = (
+            genai.GenerativeModel(settings.llm_hedge_model)
+            if settings.llm_hedge_model
+            else None
+        )
         return
         
         # OLD CODE BELOW (commented out for debugging)
@@ -98,45 +100,22 @@ class GeminiClient(LLMClient):
         self.model = genai.GenerativeModel(self.model_name)
         logger.info(f"Model created successfully. Model object: {self.model}")
 
-    async def generate(self, prompt: str, **kwargs) -> str:
-        """Generate text response from prompt."""
-        # CRITICAL: Double-check and fix model before generating
-        print(f"=== generate() called - self.model_name: {self.model_name} ===")
-        import sys
-        sys.stdout.flush()
-        
-        # Force check the model object
-        if hasattr(self.model, '_model_name'):
-            actual_model = self.model._model_name
-            print(f"=== Model object _model_name: {actual_model} ===")
-            sys.stdout.flush()
-            # Remove "models/" prefix for comparison
-            model_clean = actual_model.replace("models/", "") if actual_model.startswith("models/") else actual_model
-            # Fix invalid models: ggemini (typo) or 1.5 (doesn't exist)
-            if 'ggemini' in model_clean.lower() or '1.5' in model_clean:
-                print(f"=== ERROR: Invalid model in object! Recreating with gemini-2.5-flash... ===")
-                sys.stdout.flush()
-                self.model_name = "gemini-2.5-flash"
-                genai.configure(api_key=self.api_key)
-                self.model = genai.GenerativeModel(self.model_name)
-                print(f"=== Recreated model with: {self.model_name} ===")
-                sys.stdout.flush()
-        
-        # Also check self.model_name - fix if it's invalid
-        if 'ggemini' in self.model_name.lower() or '1.5' in self.model_name:
-            print(f"=== ERROR: Invalid model in self.model_name! Fixing to gemini-2.5-flash... ===")
-            sys.stdout.flush()
-            self.model_name = "gemini-2.5-flash"
-            genai.configure(api_key=self.api_key)
-            self.model = genai.GenerativeModel(self.model_name)
-            print(f"=== Fixed and recreated model ===")
-            sys.stdout.flush()
-        
-        logger.info(f"Generating with model: {self.model_name}")
-        logger.info(f"Model object name: {self.model._model_name if hasattr(self.model, '_model_name') else 'unknown'}")
+    async def generate(
+        self, prompt: str, deadline: float | None = None, **kwargs
+    ) -> str:
+        """Generate text response from prompt.
+
+        `deadline` is an absolute `time.monotonic()` value; the call is
+        abandoned with DeadlineExceededError once it passes.
+        """
+        self._ensure_valid_model()
+        if logger.isEnabledFor(logging.DEBUG):
+            logger.debug(
+                f"Generating with model {self.model_name} "
+                f"(model object: {getattr(self.model, '_model_name', 'unknown')})"
+            )
         try:
-            response = await self.model.generate_content_async(prompt)
-            return response.text
+            return await super().generate(prompt, deadline=deadline, **kwargs)
         except Exception as e:
             logger.error(f"Gemini generation error: {e}")
             logger.error(f"Model name being used: {self.model_name}")
@@ -150,3 +129,20 @@ class GeminiClient(LLMClient):
                     logger.error(f"ERROR: Model name from error message: models/{match.group(1)}")
             raise
 
+    def _ensure_valid_model(self) -> None:
+        """Recreate the model if it names one that doesn't exist."""
+        # Remove "models/" prefix for comparison
+        actual_model = getattr(self.model, "_model_name", "").replace("models/", "")
+        # Invalid models: ggemini (typo) or 1.5 (doesn't exist)
+        if any(
+            "ggemini" in name.lower() or "1.5" in name
+            for name in (actual_model, self.model_name)
+        ):
+            logger.warning(
+                f"Invalid model '{actual_model or self.model_name}', "
+                f"recreating with gemini-2.5-flash"
+            )
+            self.model_name = "gemini-2.5-flash"
+            genai = load_genai()
+            genai.configure(api_key=self.api_key)
+            self.model = genai.GenerativeModel(self.model_name)
@@ -0,0 +1,74 @@
+"""Hedging policy for LLM generation."""
+from collections import deque
+from typing import Deque, Optional
+
+from app.core.config import settings
+
+# Latency samples needed before the observed p95 is trusted
+MIN_LATENCY_SAMPLES = 20
+# Unused hedge allowance can accumulate up to this many hedges
+HEDGE_BUDGET_CAP = 10.0
+
+
+class HedgePolicy:
+    """
+    Decides when a slow generation gets a duplicate request. The hedge
+    delay is the configured value or, if that is 0, the observed p95 of
+    recent generation latency. Hedges are rate-capped with a token bucket:
+    each request earns `max_rate` of a hedge, so at most that fraction of
+    requests is duplicated over time.
+    """
+
+    def __init__(
+        self,
+        delay_seconds: float | None = None,
+        max_rate: float | None = None,
+        sample_size: int = 200,
+    ):
+        self.delay_seconds = (
+            settings.llm_hedge_delay_seconds if delay_seconds is None else delay_seconds
+        )
+        self.max_rate = settings.llm_hedge_max_rate if max_rate is None else max_rate
+        self._latencies: Deque[float] = deque(maxlen=sample_size)
+        self._budget = 0.0
+        self.requests = 0
+        self.hedges_fired = 0
+        self.hedges_won = 0
+
+    def record_latency(self, seconds: float) -> None:
+        self._latencies.append(seconds)
+
+    def observed_p95(self) -> Optional[float]:
+        if len(self._latencies) < MIN_LATENCY_SAMPLES:
+            return None
+        ordered = sorted(self._latencies)
+        return ordered[int(0.95 * (len(ordered) - 1))]
+
+    def hedge_delay(self) -> Optional[float]:
+        """Seconds to wait before hedging this request, or None to never hedge."""
+        self.requests += 1
+        self._budget = min(HEDGE_BUDGET_CAP, self._budget + self.max_rate)
+        if self.delay_seconds > 0:
+            return self.delay_seconds
+        return self.observed_p95()
+
+    def try_fire(self) -> bool:
+        """Spend one hedge from the budget if available."""
+        if self._budget < 1.0:
+            return False
+        self._budget -= 1.0
+        self.hedges_fired += 1
+        return True
+
+    def stats(self) -> dict:
+        p95 = self.observed_p95()
+        return {
+            "requests": self.requests,
+            "hedges_fired": self.hedges_fired,
+            "hedges_won": self.hedges_won,
+            "observed_p95_seconds": round(p95, 3) if p95 is not None else None,
+        }
+
+
+# Shared across client instances so latency history survives per-request clients
+hedge_policy = HedgePolicy()
@@ -0,0 +1,80 @@
+"""Deterministic offline generation backend."""
+import re
+from dataclasses import dataclass
+
+from app.core.config import settings
+from app.core.fault_injection import FaultInjector
+from app.llm.scheduled import ScheduledLLMClient
+from app.services.vector_search.bm25 import tokenize
+
+LOCAL_MODEL_NAME = "local-template"
+
+# Matches the "[chunk-N]\n<text>" snippets written by build_prompt
+_SNIPPET_PATTERN = re.compile(
+    r"^\[(chunk-\d+)\]\n(.*?)(?=\n\n\[chunk-\d+\]\n|\n\nQuestion: |\Z)",
+    re.MULTILINE | re.DOTALL,
+)
+_QUESTION_PATTERN = re.compile(r"^Question: (.*)$", re.MULTILINE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s")
+MAX_ANSWER_CHARS = 300
+
+# Shared so the injected sequence continues across per-request clients
+generation_faults = FaultInjector(
+    settings.local_generation_latency_ms,
+    seed=settings.local_provider_seed + 1
+    if settings.local_provider_seed is not None
+    else None,
+)
+
+
+@dataclass
+class LocalResponse:
+    """Mirrors the parts of a Gemini response the client reads."""
+
+    text: str
+    usage_metadata: None = None
+
+
+class LocalGenerativeModel:
+    """
+    Offline stand-in for `genai.GenerativeModel`. It answers a RAG prompt
+    with the opening sentence of the snippet sharing the most words with
+    the question, citing that snippet, so responses are deterministic and
+    parse like real ones.
+    """
+
+    def __init__(self, faults: FaultInjector | None = None):
+        self._model_name = LOCAL_MODEL_NAME
+        self.faults = faults or generation_faults
+
+    async def generate_content_async(self, prompt: str) -> LocalResponse:
+        await self.faults.apply()
+        return LocalResponse(template_answer(prompt))
+
+
+class LocalLLMClient(ScheduledLLMClient):
+    """
+    LLM client over LocalGenerativeModel. Calls still go through the
+    scheduler, circuit breaker, hedging and deadlines, so load tests
+    exercise the same paths as Gemini traffic.
+    """
+
+    def __init__(self, model: LocalGenerativeModel | None = None):
+        self.model_name = LOCAL_MODEL_NAME
+        self.model = model or LocalGenerativeModel()
+        self.hedge_model = None
+
+
+def template_answer(prompt: str) -> str:
+    """Answer from the prompt's best-matching snippet."""
+    snippets = _SNIPPET_PATTERN.findall(prompt)
+    if not snippets:
+        return "The provided snippets don't contain that information."
+
+    question = _QUESTION_PATTERN.search(prompt)
+    terms = set(tokenize(question.group(1))) if question else set()
+    chunk_id, text = max(
+        snippets, key=lambda snippet: len(terms.intersection(tokenize(snippet[1])))
+    )
+    sentence = _SENTENCE_END.split(text.strip(), maxsplit=1)[0]
+    return f"{sentence[:MAX_ANSWER_CHARS]} [{chunk_id}]"
@@ -0,0 +1,115 @@
+"""Generation through the shared scheduler, circuit breaker and hedging."""
+import asyncio
+import time
+
+from app.core.circuit_breaker import generation_breaker
+from app.core.config import settings
+from app.core.exceptions import DeadlineExceededError
+from app.core.metrics import (
+    estimate_tokens,
+    gemini_retries,
+    gemini_tokens,
+    record_gemini_call,
+)
+from app.core.request_scheduler import request_scheduler
+from app.llm.client import LLMClient
+from app.llm.hedging import hedge_policy
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class ScheduledLLMClient(LLMClient):
+    """
+    LLM client over a generative model backend: any object with an async
+    `generate_content_async(prompt)` whose result has `.text`. Every call
+    holds a request-scheduler slot, goes through the generation circuit
+    breaker, respects the caller's deadline and may be hedged, whichever
+    backend subclasses set as `model` (and optionally `hedge_model`).
+    """
+
+    model_name: str
+    model: object
+    hedge_model: object | None = None
+
+    async def generate(
+        self, prompt: str, deadline: float | None = None, **kwargs
+    ) -> str:
+        """Generate text response from prompt.
+
+        `deadline` is an absolute `time.monotonic()` value; the call is
+        abandoned with DeadlineExceededError once it passes.
+        """
+        # Fail fast rather than queue behind a backend that is down
+        generation_breaker.raise_if_open()
+        if deadline is None:
+            return await self._generate_hedged(prompt)
+        remaining = deadline - time.monotonic()
+        if remaining <= 0:
+            raise DeadlineExceededError("generation")
+        try:
+            return await asyncio.wait_for(self._generate_hedged(prompt), remaining)
+        except asyncio.TimeoutError:
+            raise DeadlineExceededError("generation")
+
+    async def _generate_hedged(self, prompt: str) -> str:
+        """Generate, firing a duplicate request if the first one is slow."""
+        delay = hedge_policy.hedge_delay() if settings.llm_hedging_enabled else None
+        if delay is None:
+            return await self._generate_once(self.model, prompt)
+
+        primary = asyncio.create_task(self._generate_once(self.model, prompt))
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done or not hedge_policy.try_fire():
+                return await primary
+
+            logger.info(f"Hedging generation still running after {delay:.2f}s")
+            gemini_retries.labels("generation", "hedge").inc()
+            hedge = asyncio.create_task(
+                self._generate_once(self.hedge_model or self.model, prompt)
+            )
+            tasks.add(hedge)
+            pending = set(tasks)
+            error: BaseException | None = None
+            while pending:
+                done, pending = await asyncio.wait(
+                    pending, return_when=asyncio.FIRST_COMPLETED
+                )
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            hedge_policy.hedges_won += 1
+                        return task.result()
+                    error = task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                task.cancel()
+
+    async def _generate_once(self, model, prompt: str) -> str:
+        async with request_scheduler.slot(), generation_breaker.call():
+            started = time.monotonic()
+            try:
+                response = await model.generate_content_async(prompt)
+            except Exception as e:
+                record_gemini_call("generation", e)
+                raise
+            hedge_policy.record_latency(time.monotonic() - started)
+        record_gemini_call("generation")
+        _count_tokens(prompt, response)
+        return response.text
+
+
+def _count_tokens(prompt: str, response) -> None:
+    """Count generation tokens from usage metadata, or estimate them."""
+    usage = getattr(response, "usage_metadata", None)
+    if usage is not None:
+        prompt_tokens = usage.prompt_token_count
+        output_tokens = usage.candidates_token_count
+    else:
+        prompt_tokens = estimate_tokens(prompt)
+        output_tokens = estimate_tokens(response.text)
+    gemini_tokens.labels("generation", "input").inc(prompt_tokens)
+    gemini_tokens.labels("generation", "output").inc(output_tokens)
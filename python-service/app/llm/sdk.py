@@ -0,0 +1,12 @@
+"""Deferred import of the Gemini SDK."""
+
+
+def load_genai():
+    """Return `google.generativeai`, importing it on first use.
+
+    The SDK takes about half a second to import, so it is kept off the
+    import path of `app.main` and loaded when a Gemini backend is built.
+    """
+    import google.generativeai
+
+    return google.generativeai
@@ -1,21 +1,105 @@
 """FastAPI application entry point."""
-from fastapi import FastAPI
+import asyncio
+import contextlib
+import os
+from contextlib import asynccontextmanager
+
+from fastapi import FastAPI, Response
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.responses import ORJSONResponse
+from prometheus_client import CONTENT_TYPE_LATEST, generate_latest
 
+from app.api.middleware import (
+    AdmissionMiddleware,
+    MetricsMiddleware,
+    ProfilingMiddleware,
+    RequestIdMiddleware,
+)
 from app.api.routes import session
+from app.core.admission import admission_controller
+from app.core.circuit_breaker import OPEN, circuit_breakers
 from app.core.config import settings
-from app.utils.logger import setup_logging
+from app.core.loop_monitor import loop_lag_monitor
+from app.core.metrics import register_collectors
+from app.core.offload import shutdown_offload_pool
+from app.core.request_scheduler import request_scheduler
+from app.core.session_manager import session_manager
+from app.core.single_flight import single_flight
+from app.llm.hedging import hedge_policy
+from app.llm.sdk import load_genai
+from app.services.embedding.query_batcher import query_embedding_batcher
+from app.services.rag.warmup import warmup_service
+from app.utils.logger import get_logger, setup_logging, shutdown_logging
 
 # Set up logging
 setup_logging()
+logger = get_logger(__name__)
+
+register_collectors(
+    session_stats=session_manager.stats,
+    scheduler_stats=request_scheduler.stats,
+    breaker_stats=lambda: {n: b.stats() for n, b in circuit_breakers.items()},
+    coalescing_stats=single_flight.stats,
+    admission_stats=admission_controller.stats,
+)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    """Run background tasks for the lifetime of the app."""
+    snapshot_path = settings.session_snapshot_path
+    snapshot_key = settings.session_snapshot_key
+    if snapshot_path and os.path.exists(snapshot_path):
+        try:
+            session_manager.restore(snapshot_path, snapshot_key)
+        except Exception as e:
+            logger.error(f"Failed to restore session snapshot: {e}")
+
+    tasks = [asyncio.create_task(session_manager.run_cleanup())]
+    if settings.loop_lag_interval_ms > 0:
+        tasks.append(asyncio.create_task(loop_lag_monitor.run()))
+    if "gemini" in (settings.embedding_provider, settings.llm_provider):
+        # Import the SDK in the background so the first request doesn't wait
+        tasks.append(asyncio.create_task(asyncio.to_thread(load_genai)))
+    if snapshot_path and settings.session_snapshot_interval_seconds > 0:
+        tasks.append(
+            asyncio.create_task(
+                session_manager.run_snapshots(
+                    snapshot_path,
+                    settings.session_snapshot_interval_seconds,
+                    snapshot_key,
+                )
+            )
+        )
+
+    yield
+
+    warmup_service.cancel_all()
+    for task in tasks:
+        task.cancel()
+        with contextlib.suppress(asyncio.CancelledError):
+            await task
+    if snapshot_path:
+        session_manager.snapshot(snapshot_path, snapshot_key)
+    shutdown_offload_pool()
+    shutdown_logging()
+
 
 # Create FastAPI app
 app = FastAPI(
     title="ResumeLens RAG Service",
     version="1.0.0",
     description="Ephemeral RAG-based conversational assistant",
+    lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
+# Innermost: rejected requests still get a request ID, metrics and CORS
+app.add_middleware(AdmissionMiddleware)
+app.add_middleware(ProfilingMiddleware)
+app.add_middleware(MetricsMiddleware)
+app.add_middleware(RequestIdMiddleware)
+
 # CORS middleware
 app.add_middleware(
     CORSMiddleware,
@@ -30,12 +114,13 @@ app.include_router(
     session.router, prefix="/api/session", tags=["session"]
 )
 
-from app.api.routes import chunk, embed, search, rag
+from app.api.routes import admin, chunk, embed, search, rag
 
 app.include_router(chunk.router, prefix="/api/chunk", tags=["chunk"])
 app.include_router(embed.router, prefix="/api/embed", tags=["embed"])
 app.include_router(search.router, prefix="/api/search", tags=["search"])
 app.include_router(rag.router, prefix="/api/rag", tags=["rag"])
+app.include_router(admin.router, prefix="/admin", tags=["admin"])
 
 
 @app.get("/")
@@ -47,5 +132,21 @@ async def root():
 @app.get("/health")
 async def health():
     """Health check endpoint."""
-    return {"status": "healthy"}
+    breakers = {name: b.stats() for name, b in circuit_breakers.items()}
+    degraded = any(b["state"] == OPEN for b in breakers.values())
+    return {
+        "status": "degraded" if degraded else "healthy",
+        "breakers": breakers,
+        "scheduler": request_scheduler.stats(),
+        "query_batching": query_embedding_batcher.stats(),
+        "single_flight": single_flight.stats(),
+        "llm_hedging": hedge_policy.stats(),
+        "event_loop": loop_lag_monitor.stats(),
+        "admission": admission_controller.stats(),
+    }
+
 
+@app.get("/metrics", include_in_schema=False)
+async def metrics() -> Response:
+    """Prometheus metrics in text exposition format."""
+    return Response(generate_latest(), media_type=CONTENT_TYPE_LATEST)
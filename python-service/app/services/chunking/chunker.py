@@ -1,10 +1,22 @@
 """Text chunking service."""
-import uuid
-from typing import List, Optional
+from typing import Dict, List, Optional
 
 from app.core.config import settings
 from app.types.chunk import Chunk, ChunkMetadata
-from app.utils.logger import logger
+from app.utils.logger import get_logger
+from app.utils.text_utils import content_hash
+
+logger = get_logger(__name__)
+
+
+def make_chunk_id(text: str, source_type: str, occurrence: int = 0) -> str:
+    """
+    Build a deterministic chunk ID from chunk content.
+    Identical text re-chunked later yields the same ID; repeated text within
+    one document is disambiguated by its occurrence number.
+    """
+    chunk_id = content_hash(f"{source_type}\x00{text}")
+    return chunk_id if occurrence == 0 else f"{chunk_id}-{occurrence}"
 
 
 class ChunkerService:
@@ -23,9 +35,9 @@ class ChunkerService:
         """
         max_size = max_size or settings.default_chunk_size
         overlap = overlap or settings.default_overlap
+        seen: Dict[str, int] = {}
 
-        if not text or len(text) <= max_size:
-            # Single chunk
+        def build_chunk(chunk_text: str, index: int) -> Chunk:
             chunk_metadata = ChunkMetadata(
                 section=metadata.get("section") if metadata else None,
                 page_number=metadata.get("page_number") if metadata else None,
@@ -33,14 +45,20 @@ class ChunkerService:
                 if metadata
                 else "resume",
             )
-            return [
-                Chunk(
-                    id=str(uuid.uuid4()),
-                    text=text,
-                    index=0,
-                    metadata=chunk_metadata,
-                )
-            ]
+            occurrence = seen.get(chunk_text, 0)
+            seen[chunk_text] = occurrence + 1
+            return Chunk(
+                id=make_chunk_id(
+                    chunk_text, chunk_metadata.source_type, occurrence
+                ),
+                text=chunk_text,
+                index=index,
+                metadata=chunk_metadata,
+            )
+
+        if not text or len(text) <= max_size:
+            # Single chunk
+            return [build_chunk(text, 0)]
 
         chunks: List[Chunk] = []
         overlap_size = int(max_size * overlap)
@@ -60,22 +78,7 @@ class ChunkerService:
             chunk_text = text[start:end].strip()
 
             if chunk_text:
-                chunk_metadata = ChunkMetadata(
-                    section=metadata.get("section") if metadata else None,
-                    page_number=metadata.get("page_number") if metadata else None,
-                    source_type=metadata.get("source_type", "resume")
-                    if metadata
-                    else "resume",
-                )
-
-                chunks.append(
-                    Chunk(
-                        id=str(uuid.uuid4()),
-                        text=chunk_text,
-                        index=index,
-                        metadata=chunk_metadata,
-                    )
-                )
+                chunks.append(build_chunk(chunk_text, index))
                 index += 1
 
             # Move start with overlap
@@ -85,4 +88,3 @@ class ChunkerService:
 
         logger.info(f"Created {len(chunks)} chunks from text")
         return chunks
-
@@ -2,15 +2,17 @@
 import io
 from typing import BinaryIO
 
-import PyPDF2
-from docx import Document
-
 from app.core.exceptions import DocumentProcessingError
-from app.utils.logger import logger
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 def extract_text_from_pdf(file_content: bytes) -> str:
     """Extract text from PDF file."""
+    # Imported here: only needed for server-side extraction, and slow to load
+    import PyPDF2
+
     try:
         pdf_file = io.BytesIO(file_content)
         pdf_reader = PyPDF2.PdfReader(pdf_file)
@@ -29,6 +31,8 @@ def extract_text_from_pdf(file_content: bytes) -> str:
 
 def extract_text_from_docx(file_content: bytes) -> str:
     """Extract text from DOCX file."""
+    from docx import Document
+
     try:
         docx_file = io.BytesIO(file_content)
         doc = Document(docx_file)
@@ -1,5 +1,17 @@
 """Embedding services package."""
 from app.services.embedding.generator import EmbeddingService
+from app.services.embedding.providers import (
+    EmbeddingProvider,
+    GeminiEmbeddingProvider,
+    LocalEmbeddingProvider,
+)
+from app.services.embedding.query_batcher import QueryEmbeddingBatcher
 
-__all__ = ["EmbeddingService"]
+__all__ = [
+    "EmbeddingService",
+    "EmbeddingProvider",
+    "GeminiEmbeddingProvider",
+    "LocalEmbeddingProvider",
+    "QueryEmbeddingBatcher",
+]
 
@@ -1,7 +1,11 @@
 """Batch embedding processing utilities."""
-from typing import List
+from typing import Dict, List, Sequence, Tuple
 
+from app.core.single_flight import single_flight
 from app.services.embedding.generator import EmbeddingService
+from app.types.chunk import Chunk
+from app.types.embedding import EmbeddingVector
+from app.utils.text_utils import content_hash
 
 
 async def process_embeddings_batch(
@@ -10,3 +14,38 @@ async def process_embeddings_batch(
     """Process embeddings in batches."""
     return await embedding_service.generate_embeddings_batch(texts)
 
+
+async def embed_chunks_incremental(
+    chunks: Sequence[Chunk],
+    existing_chunks: Sequence[Chunk],
+    existing_embeddings: Sequence[EmbeddingVector],
+    embedding_service: EmbeddingService,
+) -> Tuple[List[EmbeddingVector], int]:
+    """
+    Embed chunks, reusing embeddings already held for identical text.
+    Only new or changed chunks are sent to the embedding service.
+    Returns embeddings aligned with `chunks` and the number reused.
+    """
+    known: Dict[str, EmbeddingVector] = {
+        content_hash(chunk.text): embedding
+        for chunk, embedding in zip(existing_chunks, existing_embeddings)
+    }
+
+    keys = [content_hash(chunk.text) for chunk in chunks]
+    missing: Dict[str, str] = {}
+    for key, chunk in zip(keys, chunks):
+        if key not in known and key not in missing:
+            missing[key] = chunk.text
+
+    if missing:
+        # A retried or double-submitted upload joins the first one's call
+        texts = list(missing.values())
+        new_embeddings = await single_flight.do(
+            "chunk_embedding",
+            "\x00".join(texts),
+            lambda: embedding_service.generate_embeddings_batch(texts),
+        )
+        known.update(zip(missing.keys(), new_embeddings))
+
+    embeddings = [known[key] for key in keys]
+    return embeddings, len(chunks) - len(missing)
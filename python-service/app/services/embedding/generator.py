@@ -1,30 +1,62 @@
 """Embedding generation service."""
-import google.generativeai as genai
 from typing import List
 
 from app.core.config import settings
-from app.core.exceptions import EmbeddingGenerationError
-from app.utils.logger import logger
+from app.core.circuit_breaker import embedding_breaker
+from app.core.exceptions import CircuitOpenError, EmbeddingGenerationError
+from app.core.metrics import estimate_tokens, gemini_tokens, record_gemini_call
+from app.core.request_scheduler import request_scheduler
+from app.services.embedding.providers import (
+    EmbeddingProvider,
+    create_embedding_provider,
+)
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
 
 
 class EmbeddingService:
-    """Service for generating embeddings using Gemini."""
+    """Service for generating embeddings with the configured provider."""
+
+    def __init__(
+        self, api_key: str | None = None, provider: EmbeddingProvider | None = None
+    ):
+        self._api_key = api_key
+        self._provider = provider
 
-    def __init__(self, api_key: str | None = None):
-        self.api_key = api_key or settings.gemini_api_key
-        genai.configure(api_key=self.api_key)
-        self.model = settings.gemini_embedding_model
+    @property
+    def provider(self) -> EmbeddingProvider:
+        # Built on first use, so module-level services don't load the SDK
+        if self._provider is None:
+            self._provider = create_embedding_provider(
+                settings.embedding_provider, self._api_key
+            )
+        return self._provider
 
     async def generate_embedding(self, text: str) -> List[float]:
-        """Generate embedding for single text using Gemini API."""
+        """Generate embedding for single text."""
+        embeddings = await self._embed_content([text])
+        return embeddings[0]
+
+    async def embed_texts(self, texts: List[str]) -> List[List[float]]:
+        """Embed several texts with one batched API call."""
+        return await self._embed_content(texts)
+
+    async def _embed_content(self, texts: List[str]) -> List[List[float]]:
+        # Fail fast rather than queue behind a backend that is down
+        embedding_breaker.raise_if_open()
         try:
-            result = genai.embed_content(
-                model=self.model,
-                content=text,
-                task_type="retrieval_document",
+            async with request_scheduler.slot(), embedding_breaker.call():
+                embeddings = await self.provider.embed(texts)
+            record_gemini_call("embedding")
+            gemini_tokens.labels("embedding", "input").inc(
+                sum(estimate_tokens(text) for text in texts)
             )
-            return result["embedding"]
+            return embeddings
+        except CircuitOpenError:
+            raise
         except Exception as e:
+            record_gemini_call("embedding", e)
             error_str = str(e)
             logger.error(f"Embedding generation error: {e}")
             
@@ -41,7 +73,11 @@ class EmbeddingService:
     async def generate_embeddings_batch(
         self, texts: List[str]
     ) -> List[List[float]]:
-        """Generate embeddings for multiple texts efficiently."""
+        """Generate embeddings for multiple texts.
+
+        Each text takes its own scheduler slot, so interactive requests can
+        overtake a large batch between calls.
+        """
         embeddings = []
         for text in texts:
             embedding = await self.generate_embedding(text)
@@ -0,0 +1,90 @@
+"""Embedding backends selected by `settings.embedding_provider`."""
+import asyncio
+import zlib
+from abc import ABC, abstractmethod
+from typing import List
+
+import numpy as np
+
+from app.core.config import settings
+from app.core.fault_injection import FaultInjector
+from app.llm.sdk import load_genai
+from app.services.vector_search.bm25 import tokenize
+
+# Shared so the injected sequence continues across service instances
+embedding_faults = FaultInjector(
+    settings.local_embedding_latency_ms, seed=settings.local_provider_seed
+)
+
+
+class EmbeddingProvider(ABC):
+    """Turns texts into embedding vectors."""
+
+    @abstractmethod
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        """Embed texts, returning one vector per text in order."""
+
+
+class GeminiEmbeddingProvider(EmbeddingProvider):
+    """Embeddings from the Gemini API."""
+
+    def __init__(self, api_key: str | None = None, model: str | None = None):
+        self._genai = load_genai()
+        self._genai.configure(api_key=api_key or settings.gemini_api_key)
+        self.model = model or settings.gemini_embedding_model
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        # The SDK call blocks; keep the event loop free while it runs
+        result = await asyncio.to_thread(
+            self._genai.embed_content,
+            model=self.model,
+            content=texts,
+            task_type="retrieval_document",
+        )
+        return result["embedding"]
+
+
+class LocalEmbeddingProvider(EmbeddingProvider):
+    """
+    Deterministic offline embeddings: words and character trigrams hashed
+    into a fixed number of signed buckets, then L2-normalised. Texts sharing
+    vocabulary get similar vectors, which is enough for retrieval to behave
+    sensibly in tests and benchmarks.
+    """
+
+    def __init__(
+        self, dimension: int | None = None, faults: FaultInjector | None = None
+    ):
+        self.dimension = dimension or settings.local_embedding_dimension
+        self.faults = faults or embedding_faults
+
+    async def embed(self, texts: List[str]) -> List[List[float]]:
+        await self.faults.apply()
+        return [hashed_embedding(text, self.dimension) for text in texts]
+
+
+def hashed_embedding(text: str, dimension: int) -> List[float]:
+    """Embed text by feature hashing its words and character trigrams."""
+    vector = np.zeros(dimension, dtype=np.float32)
+    for word in tokenize(text):
+        padded = f"<{word}>"
+        features = [word] + [padded[i : i + 3] for i in range(len(padded) - 2)]
+        for feature in features:
+            # crc32 rather than hash(): stable across processes
+            digest = zlib.crc32(feature.encode())
+            vector[digest % dimension] += 1.0 if digest & 0x80000000 else -1.0
+    norm = float(np.linalg.norm(vector))
+    if norm > 0:
+        vector /= norm
+    return vector.tolist()
+
+
+def create_embedding_provider(
+    name: str, api_key: str | None = None
+) -> EmbeddingProvider:
+    """Create the embedding provider selected in settings."""
+    if name == "gemini":
+        return GeminiEmbeddingProvider(api_key)
+    if name == "local":
+        return LocalEmbeddingProvider()
+    raise ValueError(f"Unknown embedding provider: {name}")
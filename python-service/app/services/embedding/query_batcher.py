@@ -0,0 +1,92 @@
+"""Micro-batching of concurrent query embeddings."""
+import asyncio
+from typing import List, Set, Tuple
+
+from app.core.config import settings
+from app.core.request_scheduler import Priority, request_class
+from app.services.embedding.generator import EmbeddingService
+from app.types.embedding import EmbeddingVector
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class QueryEmbeddingBatcher:
+    """
+    Collects query-embedding requests that arrive within a short window and
+    sends them to Gemini as one batched call, then fans the vectors back out
+    to the waiting callers. A batch is sent when the window closes or when
+    it reaches the maximum size, so the added latency is bounded by the
+    window. Identical texts within a batch are embedded once.
+    """
+
+    def __init__(
+        self,
+        embedding_service: EmbeddingService | None = None,
+        window_ms: float | None = None,
+        max_batch_size: int | None = None,
+    ):
+        self.embedding_service = embedding_service or EmbeddingService()
+        self.window_seconds = (
+            window_ms if window_ms is not None else settings.query_batch_window_ms
+        ) / 1000
+        self.max_batch_size = max_batch_size or settings.query_batch_max_size
+        self._pending: List[Tuple[str, asyncio.Future]] = []
+        self._timer: asyncio.TimerHandle | None = None
+        self._flushes: Set[asyncio.Task] = set()
+        self.batches = 0
+        self.requests = 0
+
+    async def embed(self, text: str) -> EmbeddingVector:
+        """Embed one query, sharing an API call with concurrent queries."""
+        loop = asyncio.get_running_loop()
+        future = loop.create_future()
+        self._pending.append((text, future))
+        if len(self._pending) >= self.max_batch_size:
+            self._flush()
+        elif self._timer is None:
+            self._timer = loop.call_later(self.window_seconds, self._flush)
+        return await future
+
+    def stats(self) -> dict:
+        """Return batch count and mean batch size."""
+        return {
+            "batches": self.batches,
+            "requests": self.requests,
+            "mean_batch_size": self.requests / self.batches if self.batches else 0.0,
+        }
+
+    def _flush(self) -> None:
+        if self._timer is not None:
+            self._timer.cancel()
+            self._timer = None
+        batch, self._pending = self._pending, []
+        if not batch:
+            return
+        task = asyncio.get_running_loop().create_task(self._send(batch))
+        self._flushes.add(task)
+        task.add_done_callback(self._flushes.discard)
+
+    async def _send(self, batch: List[Tuple[str, asyncio.Future]]) -> None:
+        texts = list(dict.fromkeys(text for text, _ in batch))
+        self.batches += 1
+        self.requests += len(batch)
+        try:
+            with request_class(Priority.INTERACTIVE):
+                embeddings = await self.embedding_service.embed_texts(texts)
+        except Exception as e:
+            for _, future in batch:
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        by_text = dict(zip(texts, embeddings))
+        for text, future in batch:
+            if not future.done():  # Caller may have been cancelled
+                future.set_result(by_text[text])
+        if len(batch) > 1:
+            logger.debug(f"Embedded {len(batch)} queries in one batched call")
+
+
+# Global batcher shared by all pipeline instances
+query_embedding_batcher = QueryEmbeddingBatcher()
@@ -0,0 +1,4 @@
+"""Structured fact extraction services package."""
+from app.services.extraction.facts import answer_from_facts, extract_facts
+
+__all__ = ["extract_facts", "answer_from_facts"]
@@ -0,0 +1,295 @@
+"""Rule-based extraction of structured resume facts.
+
+Facts (contact details, experience statements, date ranges and skills) are
+extracted once per document at ingestion with precompiled patterns. Simple
+factual questions are then answered from them without embedding the query
+or calling the LLM.
+"""
+import re
+from collections import Counter
+from datetime import datetime
+from typing import Dict, Iterable, List, Optional, Sequence, Tuple
+
+from app.types.chunk import Chunk
+from app.types.facts import Fact
+from app.types.rag import RAGResponse
+
+FAST_PATH_CONFIDENCE = 0.95
+
+# fmt: off
+SKILLS = (
+    "Python", "Java", "JavaScript", "TypeScript", "Go", "Golang", "Rust", "C",
+    "C++", "C#", "Ruby", "PHP", "Swift", "Kotlin", "Scala", "R", "MATLAB",
+    "SQL", "NoSQL", "PostgreSQL", "MySQL", "SQLite", "MongoDB", "Redis",
+    "Elasticsearch", "Cassandra", "DynamoDB", "Snowflake", "BigQuery",
+    "HTML", "CSS", "Sass", "Tailwind", "React", "Next.js", "Vue", "Angular",
+    "Svelte", "Node.js", "Express", "Django", "Flask", "FastAPI", "Spring",
+    "Rails", ".NET", "GraphQL", "REST", "gRPC", "Kafka", "RabbitMQ", "Spark",
+    "Hadoop", "Airflow", "dbt", "Pandas", "NumPy", "SciPy", "scikit-learn",
+    "TensorFlow", "PyTorch", "Keras", "LangChain", "NLP", "Machine Learning",
+    "Deep Learning", "Computer Vision", "LLM", "AWS", "Azure", "GCP",
+    "Google Cloud", "Docker", "Kubernetes", "Terraform", "Ansible", "Jenkins",
+    "GitHub Actions", "CI/CD", "Git", "Linux", "Bash", "Microservices",
+    "Agile", "Scrum", "Jira", "Figma", "Tableau", "Power BI", "Excel",
+)
+_SKILL_NAMES = {skill.lower(): skill for skill in SKILLS}
+# Skill names that are also ordinary words ("I excel at", "spring 2020",
+# "Go to market"). They only match with their canonical casing, and only
+# in a technical context (see _in_technical_context).
+AMBIGUOUS_SKILLS = frozenset({
+    "Go", "Swift", "Spring", "REST", "Agile", "Excel", "Express", "Rails",
+    "Spark", "Rust", "React", "Angular", "Flask", "Bash", "Pandas", "Airflow",
+    "Snowflake", "Ruby", "Java", "Tableau", "Jenkins", "R", "C",
+})
+# fmt: on
+
+
+def _skill_pattern(skills: Iterable[str], flags: int = 0) -> "re.Pattern[str]":
+    # Longest first so "Next.js" wins over "Next"; custom boundaries allow C++/C#
+    return re.compile(
+        r"(?<![\w+#.])("
+        + "|".join(re.escape(s) for s in sorted(skills, key=len, reverse=True))
+        + r")(?![\w+#])",
+        flags,
+    )
+
+
+_SKILL_PATTERN = _skill_pattern(
+    [s for s in SKILLS if s not in AMBIGUOUS_SKILLS], re.IGNORECASE
+)
+_AMBIGUOUS_SKILL_PATTERN = _skill_pattern(AMBIGUOUS_SKILLS)
+_TECH_CUES = re.compile(
+    r"\b(apis?|frameworks?|languages?|programming|stack|sdks?|librar(y|ies)|"
+    r"backend|frontend|tools?|technologies|proficient)\b",
+    re.I,
+)
+_SENTENCE_END = re.compile(r"[.!?;\n]")
+
+_EXTRACTORS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("email", re.compile(r"[\w.+-]+@[\w-]+(?:\.[\w-]+)*\.[A-Za-z]{2,}")),
+    (
+        "phone",
+        re.compile(r"(?<![\w/])\+?\d[\d\s().-]{7,}\d(?![\w/])"),
+    ),
+    (
+        "linkedin",
+        re.compile(r"(?:https?://)?(?:[\w-]+\.)?linkedin\.com/[\w\-/%]+", re.I),
+    ),
+    ("github", re.compile(r"(?:https?://)?github\.com/[\w\-/]+", re.I)),
+    (
+        "experience",
+        re.compile(r"(\d{1,2})\+?\s*(?:years?|yrs?)\s+(?:of\s+)?experience", re.I),
+    ),
+)
+
+
+def _is_phone_number(value: str) -> bool:
+    # Rules out year ranges and other short digit runs
+    return 10 <= sum(c.isdigit() for c in value) <= 15
+
+
+_VALIDATORS = {"phone": _is_phone_number}
+_MONTH = r"(?:jan|feb|mar|apr|may|jun|jul|aug|sep|sept|oct|nov|dec)[a-z]*\.?\s+"
+_DATE_RANGE = re.compile(
+    rf"(?:{_MONTH})?((?:19|20)\d{{2}})\s*(?:-|–|—|to)\s*"
+    rf"(?:(?:{_MONTH})?((?:19|20)\d{{2}})|(present|current|now))",
+    re.I,
+)
+
+# Query intents, checked in order
+_INTENTS: Tuple[Tuple[str, "re.Pattern[str]"], ...] = (
+    ("email", re.compile(r"\be-?mail\b", re.I)),
+    ("phone", re.compile(r"\b(phone|mobile|cell|telephone|contact number)\b", re.I)),
+    ("linkedin", re.compile(r"\blinked\s?in\b", re.I)),
+    ("github", re.compile(r"\bgit\s?hub\b", re.I)),
+    (
+        "experience",
+        re.compile(
+            r"\b(years? of experience|how (many|long) years|how much experience)\b",
+            re.I,
+        ),
+    ),
+    (
+        "skill",
+        re.compile(r"\b(skills?|tech(nology|nical)? stack|technologies)\b", re.I),
+    ),
+)
+# Questions needing judgement, ranking or comparison always go to the LLM
+_NEEDS_REASONING = re.compile(
+    r"\b(why|fit|match|compare|comparison|suitable|strong\w*|weak\w*|better|best|"
+    r"top|most|least|main|key|primary|core|good|great|impressive|notable|"
+    r"expert\w*|proficien\w*|level|rate|rank\w*|assess\w*|evaluat\w*|"
+    r"improve|role|job|jd|requirement|gap|missing|lack|should|would|recommend)\b",
+    re.I,
+)
+# Facts are about the candidate as a whole; a question narrowed to a skill,
+# an employer, another person or a time ("email at Google", "years of Python
+# experience") can't be answered from them
+_QUALIFIERS = re.compile(
+    r"\b(with|at|for|in|using|from|during|before|after|since)\s+\w|"
+    r"\b(manager|boss|supervisor|reference|referee|colleague|recruiter|"
+    r"previous|former|prior|current|old|company|employer|team)\b",
+    re.I,
+)
+# Yes/no questions need a judgement, not a listing
+_YES_NO = re.compile(
+    r"^\s*(does|do|did|is|are|was|were|has|have|had|can|could|will)\b", re.I
+)
+# Capitalised words that name a fact kind rather than qualify the question
+_INTENT_WORDS = frozenset({"linkedin", "github", "email", "e-mail", "i"})
+_MAX_FAST_PATH_WORDS = 12
+
+
+def extract_facts(chunks: Iterable[Chunk]) -> Tuple[Fact, ...]:
+    """Extract structured facts from chunks."""
+    facts: List[Fact] = []
+    seen = set()
+
+    def add(kind: str, value: str, chunk_id: str) -> None:
+        key = (kind, value.lower())
+        if key not in seen:
+            seen.add(key)
+            facts.append(Fact(kind=kind, value=value, chunk_id=chunk_id))
+
+    for chunk in chunks:
+        text = chunk.text
+        for kind, pattern in _EXTRACTORS:
+            is_valid = _VALIDATORS.get(kind)
+            for match in pattern.finditer(text):
+                value = (match.group(1) if pattern.groups else match.group(0)).strip()
+                if is_valid is None or is_valid(value):
+                    add(kind, value, chunk.id)
+        for match in _DATE_RANGE.finditer(text):
+            end = match.group(2) or str(datetime.now().year)
+            add("date_range", f"{match.group(1)}-{end}", chunk.id)
+        # Skills are counted per mention, so keep duplicates across chunks
+        skills = [
+            (match.start(), _SKILL_NAMES[match.group(1).lower()])
+            for match in _SKILL_PATTERN.finditer(text)
+        ]
+        in_skills_section = "skill" in (chunk.metadata.section or "").lower()
+        for match in _AMBIGUOUS_SKILL_PATTERN.finditer(text):
+            if in_skills_section or _in_technical_context(text, match, skills):
+                skills.append((match.start(), match.group(1)))
+        facts.extend(
+            Fact(kind="skill", value=skill, chunk_id=chunk.id)
+            for _, skill in sorted(skills)
+        )
+    return tuple(facts)
+
+
+def _in_technical_context(
+    text: str, match: "re.Match[str]", skills: Sequence[Tuple[int, str]]
+) -> bool:
+    """Whether an ambiguous skill's sentence names other tech or a tech cue."""
+    start = max(
+        (m.end() for m in _SENTENCE_END.finditer(text, 0, match.start())), default=0
+    )
+    end_match = _SENTENCE_END.search(text, match.end())
+    end = end_match.start() if end_match else len(text)
+    return any(start <= pos < end for pos, _ in skills) or bool(
+        _TECH_CUES.search(text, start, end)
+    )
+
+
+def classify_query(query: str) -> Optional[str]:
+    """Return the fact kind a simple factual query asks for, if any."""
+    if (
+        len(query.split()) > _MAX_FAST_PATH_WORDS
+        or _NEEDS_REASONING.search(query)
+        or _is_qualified(query)
+    ):
+        return None
+    for kind, pattern in _INTENTS:
+        if pattern.search(query):
+            return kind
+    return None
+
+
+def _is_qualified(query: str) -> bool:
+    """Whether a query is a yes/no question or narrowed beyond the candidate."""
+    if _YES_NO.search(query) or _QUALIFIERS.search(query):
+        return True
+    if _SKILL_PATTERN.search(query) or _AMBIGUOUS_SKILL_PATTERN.search(query):
+        return True
+    # Proper nouns (employers, schools, people) after the first word
+    return any(
+        word[0].isupper() and word.strip("?.,!:;'\"").lower() not in _INTENT_WORDS
+        for word in query.split()[1:]
+    )
+
+
+def answer_from_facts(query: str, facts: Sequence[Fact]) -> Optional[RAGResponse]:
+    """Answer a simple factual query from extracted facts, or return None."""
+    kind = classify_query(query)
+    if kind is None:
+        return None
+
+    if kind == "skill":
+        return _answer_skills(facts)
+    if kind == "experience":
+        return _answer_experience(facts)
+
+    matches = [f for f in facts if f.kind == kind]
+    if not matches:
+        return None
+    label = {
+        "email": "Email",
+        "phone": "Phone",
+        "linkedin": "LinkedIn",
+        "github": "GitHub",
+    }[kind]
+    values = ", ".join(f.value for f in matches)
+    return _response(f"{label}: {values}", matches)
+
+
+def _answer_skills(facts: Sequence[Fact]) -> Optional[RAGResponse]:
+    skills = [f for f in facts if f.kind == "skill"]
+    if not skills:
+        return None
+    counts = Counter(f.value for f in skills)
+    ranked = [skill for skill, _ in counts.most_common()]
+    return _response(f"Skills mentioned: {', '.join(ranked)}", skills)
+
+
+def _answer_experience(facts: Sequence[Fact]) -> Optional[RAGResponse]:
+    stated = [f for f in facts if f.kind == "experience"]
+    if stated:
+        best = max(stated, key=lambda f: int(f.value))
+        return _response(f"{best.value}+ years of experience (as stated).", [best])
+
+    ranges = [f for f in facts if f.kind == "date_range"]
+    if not ranges:
+        return None
+    years = _merged_years(tuple(int(y) for y in f.value.split("-")) for f in ranges)
+    if years <= 0:
+        return None
+    return _response(
+        f"About {years} years of experience, based on the listed date ranges.",
+        ranges,
+    )
+
+
+def _merged_years(ranges: Iterable[Tuple[int, int]]) -> int:
+    """Total years covered by possibly overlapping year ranges."""
+    total = 0
+    current: Optional[List[int]] = None
+    for start, end in sorted(r for r in ranges if r[0] <= r[1]):
+        if current and start <= current[1]:
+            current[1] = max(current[1], end)
+            continue
+        if current:
+            total += current[1] - current[0]
+        current = [start, end]
+    if current:
+        total += current[1] - current[0]
+    return total
+
+
+def _response(answer: str, facts: Sequence[Fact]) -> RAGResponse:
+    sources: Dict[str, None] = dict.fromkeys(f.chunk_id for f in facts)
+    return RAGResponse(
+        answer=answer,
+        sources=list(sources),
+        confidence=FAST_PATH_CONFIDENCE,
+    )
@@ -1,14 +1,46 @@
 """RAG pipeline orchestrator."""
+import re
+from functools import partial
+from typing import List, Sequence
+
 from app.core.config import settings
-from app.core.exceptions import SessionNotFoundError
+from app.core.exceptions import (
+    CircuitOpenError,
+    EmbeddingGenerationError,
+    SessionNotFoundError,
+)
+from app.core.metrics import rag_answers, rag_stage
+from app.core.offload import run_cpu_bound
+from app.core.request_scheduler import Priority, request_class
 from app.core.session_manager import session_manager
-from app.llm.gemini_client import GeminiClient
+from app.core.single_flight import single_flight
+from app.llm.factory import create_llm_client
 from app.services.embedding.generator import EmbeddingService
+from app.services.embedding.query_batcher import query_embedding_batcher
+from app.services.extraction.facts import answer_from_facts
 from app.services.rag.prompt_builder import build_prompt
-from app.services.rag.response_parser import parse_response
+from app.services.rag.response_parser import parse_response, snippets_response
 from app.services.vector_search.searcher import VectorSearchService
-from app.types.rag import RAGResponse
-from app.utils.logger import logger
+from app.types.embedding import EmbeddingVector
+from app.types.rag import RAGResponse, SearchResult
+from app.types.session import Session, SessionDocument
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+_CACHE_KEY_STRIP = re.compile(r"[^\w\s]")
+
+
+def answer_cache_key(
+    query: str,
+    top_k: int,
+    retrieval_mode: str,
+    documents: Sequence[str] | None = None,
+) -> str:
+    """Normalise a query and its resolved options into an answer-cache key."""
+    words = _CACHE_KEY_STRIP.sub(" ", query.lower()).split()
+    scope = ",".join(sorted(documents)) if documents is not None else "*"
+    return f"{' '.join(words)}|{top_k}|{retrieval_mode}|{scope}"
 
 
 class RAGPipeline:
@@ -17,13 +49,21 @@ class RAGPipeline:
     def __init__(self):
         logger.info("Creating new RAGPipeline instance")
         self.embedding_service = EmbeddingService()
+        # Shared across pipelines so concurrent queries batch together
+        self.query_embedder = query_embedding_batcher
         self.search_service = VectorSearchService()
-        logger.info("Creating GeminiClient...")
-        self.llm_client = GeminiClient()
+        logger.info(f"Creating {settings.llm_provider} LLM client...")
+        self.llm_client = create_llm_client(settings.llm_provider)
         logger.info(f"RAGPipeline created with LLM client model: {self.llm_client.model_name}")
 
     async def process_query(
-        self, query: str, session_id: str, top_k: int | None = None
+        self,
+        query: str,
+        session_id: str,
+        top_k: int | None = None,
+        documents: List[str] | None = None,
+        retrieval_mode: str | None = None,
+        deadline: float | None = None,
     ) -> RAGResponse:
         """
         Complete RAG pipeline:
@@ -33,32 +73,98 @@ class RAGPipeline:
         4. Call LLM
         5. Return response with sources
         """
-        top_k = top_k or settings.default_top_k
-
         # 1. Get session
         session = session_manager.get_session(session_id)
         if not session:
             raise SessionNotFoundError(session_id)
 
-        if not session.chunks or not session.embeddings:
+        with request_class(Priority.INTERACTIVE, session_id):
+            return await self.answer(
+                session, query, top_k, documents, retrieval_mode, deadline
+            )
+
+    async def answer(
+        self,
+        session: Session,
+        query: str,
+        top_k: int | None = None,
+        documents: List[str] | None = None,
+        retrieval_mode: str | None = None,
+        deadline: float | None = None,
+    ) -> RAGResponse:
+        """Answer a query against an already-loaded session.
+
+        `deadline` (a `time.monotonic()` value) bounds the wait for the LLM.
+        """
+        top_k = top_k or settings.default_top_k
+        mode = retrieval_mode or settings.retrieval_mode
+        session_id = session.session_id
+
+        selected = [
+            doc for doc in session.select_documents(documents) if doc.chunks
+        ]
+        if not selected:
             return RAGResponse(
                 answer="No document has been processed yet. Please upload a document first.",
                 sources=[],
                 confidence=0.0,
             )
 
-        # 2. Generate query embedding
-        logger.info(f"Generating query embedding for session {session_id}")
-        query_embedding = await self.embedding_service.generate_embedding(query)
+        # Simple factual questions about the candidate are answered from facts
+        # extracted from the resume at ingestion (never from a job description)
+        if settings.fact_fast_path_enabled:
+            with rag_stage["facts"].time():
+                fast_response = answer_from_facts(
+                    query,
+                    [
+                        fact
+                        for doc in selected
+                        if doc.source_type == "resume"
+                        for fact in doc.facts
+                    ],
+                )
+            if fast_response:
+                logger.info(f"Answered from extracted facts for session {session_id}")
+                rag_answers.labels("facts").inc()
+                return fast_response
 
-        # 3. Search relevant chunks
-        logger.info(f"Searching for relevant chunks (top_k={top_k})")
-        search_results = self.search_service.search(
-            query_embedding=query_embedding,
-            document_embeddings=session.embeddings,
-            chunks=session.chunks,
-            top_k=top_k,
+        cached = session.answer_cache.get(
+            answer_cache_key(query, top_k, mode, documents)
         )
+        if cached:
+            logger.info(f"Answered from precomputed cache for session {session_id}")
+            rag_answers.labels("cache").inc()
+            return cached
+        rag_answers.labels("pipeline").inc()
+
+        # 2. Generate query embedding (lexical mode doesn't need one)
+        query_embedding = None
+        if mode != "lexical":
+            logger.info(f"Generating query embedding for session {session_id}")
+            try:
+                with rag_stage["embed_query"].time():
+                    query_embedding = await single_flight.do(
+                        "query_embedding",
+                        query,
+                        lambda: self.query_embedder.embed(query),
+                        session_id,
+                    )
+            except (EmbeddingGenerationError, CircuitOpenError) as e:
+                # Rate-limited or down: keyword retrieval still works
+                logger.warning(
+                    f"Query embedding unavailable, using lexical search: {e}"
+                )
+                mode = "lexical"
+
+        # 3. Search relevant chunks
+        logger.info(f"Searching for relevant chunks (top_k={top_k}, mode={mode})")
+        with rag_stage["search"].time():
+            search_results = await run_cpu_bound(
+                "search",
+                partial(self._retrieve, mode, query, query_embedding, selected, top_k),
+                size=sum(len(document.chunks) for document in selected),
+                threshold=settings.offload_search_chunks,
+            )
 
         if not search_results:
             return RAGResponse(
@@ -69,19 +175,33 @@ class RAGPipeline:
 
         # 4. Build prompt
         logger.info("Building RAG prompt")
-        chunks_for_prompt = [
-            chunk
-            for chunk in session.chunks
-            if chunk.id in [r.chunk_id for r in search_results]
-        ]
-        prompt = build_prompt(query, chunks_for_prompt)
+        # Keep search-result order so chunk-N citations map back correctly
+        with rag_stage["build_prompt"].time():
+            chunks_by_id = {
+                chunk.id: chunk for doc in selected for chunk in doc.chunks
+            }
+            chunks_for_prompt = [chunks_by_id[r.chunk_id] for r in search_results]
+            prompt = build_prompt(query, chunks_for_prompt)
 
         # 5. Generate response
         logger.info("Calling LLM")
-        llm_response = await self.llm_client.generate(prompt)
+        try:
+            with rag_stage["generate"].time():
+                # Each caller's deadline bounds its own wait, not the shared call
+                llm_response = await single_flight.do(
+                    "generate",
+                    prompt,
+                    lambda: self.llm_client.generate(prompt),
+                    session_id,
+                    deadline=deadline,
+                )
+        except CircuitOpenError as e:
+            logger.warning(f"Returning retrieved passages without a summary: {e}")
+            return snippets_response(search_results)
 
         # 6. Parse response
-        parsed_response = parse_response(llm_response, search_results)
+        with rag_stage["parse"].time():
+            parsed_response = parse_response(llm_response, search_results)
 
         logger.info(
             f"RAG pipeline completed. Found {len(parsed_response.sources)} sources."
@@ -89,3 +209,19 @@ class RAGPipeline:
 
         return parsed_response
 
+    def _retrieve(
+        self,
+        mode: str,
+        query: str,
+        query_embedding: EmbeddingVector | None,
+        documents: List[SessionDocument],
+        top_k: int,
+    ) -> List[SearchResult]:
+        """Run the search for a retrieval mode."""
+        if mode == "lexical":
+            return self.search_service.lexical_search(query, documents, top_k)
+        if mode == "hybrid":
+            return self.search_service.hybrid_search(
+                query_embedding, query, documents, top_k
+            )
+        return self.search_service.search_documents(query_embedding, documents, top_k)
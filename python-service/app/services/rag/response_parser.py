@@ -36,3 +36,17 @@ def parse_response(
         confidence=round(confidence, 2),
     )
 
+
+def snippets_response(search_results: List[SearchResult]) -> RAGResponse:
+    """Answer with the retrieved passages when no LLM summary is available."""
+    passages = "\n\n".join(
+        f"- {result.chunk_text.strip()}" for result in search_results[:3]
+    )
+    return RAGResponse(
+        answer=(
+            "The assistant is temporarily unavailable, so here are the most "
+            f"relevant passages from the document:\n\n{passages}"
+        ),
+        sources=[result.chunk_id for result in search_results[:3]],
+        confidence=0.0,
+    )
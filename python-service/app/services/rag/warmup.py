@@ -0,0 +1,141 @@
+"""Background precomputation of answers to predictable first questions."""
+import asyncio
+from typing import Callable, Dict, List, Tuple
+
+from app.core.circuit_breaker import CLOSED, generation_breaker
+from app.core.config import settings
+from app.core.exceptions import CircuitOpenError
+from app.core.request_scheduler import Priority, request_class
+from app.core.session_manager import session_manager
+from app.services.rag.pipeline import RAGPipeline, answer_cache_key
+from app.types.rag import RAGResponse
+from app.types.session import Session
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+
+class WarmupService:
+    """
+    Runs configured warm-up questions through the RAG pipeline after
+    ingestion and stores the answers in the session's answer cache.
+    One job runs per session; re-ingesting restarts it and deleting the
+    session cancels it. Questions are spaced out so warm-up traffic stays
+    well inside the Gemini rate limit.
+    """
+
+    def __init__(
+        self,
+        pipeline_factory: Callable[[], RAGPipeline] = RAGPipeline,
+        questions: List[str] | None = None,
+        interval_seconds: float | None = None,
+    ):
+        self._pipeline_factory = pipeline_factory
+        self._questions = questions
+        self._interval_seconds = interval_seconds
+        self._tasks: Dict[str, asyncio.Task] = {}
+
+    @property
+    def questions(self) -> List[str]:
+        return (
+            self._questions
+            if self._questions is not None
+            else settings.warmup_questions
+        )
+
+    @property
+    def interval_seconds(self) -> float:
+        if self._interval_seconds is not None:
+            return self._interval_seconds
+        return settings.warmup_interval_seconds
+
+    def schedule(self, session_id: str) -> asyncio.Task | None:
+        """Start (or restart) warm-up for a session. Returns the job task."""
+        self.cancel(session_id)
+        if not self.questions:
+            return None
+        task = asyncio.create_task(self._run(session_id))
+        self._tasks[session_id] = task
+        task.add_done_callback(lambda t: self._forget(session_id, t))
+        return task
+
+    def cancel(self, session_id: str) -> bool:
+        """Cancel a session's warm-up job if one is running."""
+        task = self._tasks.pop(session_id, None)
+        if task is None or task.done():
+            return False
+        task.cancel()
+        return True
+
+    def cancel_all(self) -> None:
+        """Cancel every running warm-up job."""
+        for session_id in list(self._tasks):
+            self.cancel(session_id)
+
+    def _forget(self, session_id: str, task: asyncio.Task) -> None:
+        if self._tasks.get(session_id) is task:
+            del self._tasks[session_id]
+
+    async def _run(self, session_id: str) -> None:
+        questions = self.questions
+        session = session_manager.get_session(session_id, touch=False)
+        if session is None:
+            return
+        status = session.warmup
+        status.state, status.completed, status.total = "running", 0, len(questions)
+        pipeline = self._pipeline_factory()
+        documents = _document_signature(session)
+        answers: Dict[str, RAGResponse] = {}
+
+        def merge_answers(current: Session) -> None:
+            current.warmup = status
+            # Answers over documents since replaced by another worker are stale
+            if _document_signature(current) == documents:
+                current.answer_cache = {**current.answer_cache, **answers}
+
+        try:
+            for question in questions:
+                # Yield to interactive traffic and respect the rate limit
+                await asyncio.sleep(self.interval_seconds)
+                if generation_breaker.state != CLOSED:
+                    # Don't cache passage-only answers from a degraded pipeline
+                    raise CircuitOpenError(
+                        generation_breaker.name, generation_breaker.retry_after()
+                    )
+                session = session_manager.get_session(session_id, touch=False)
+                if session is None or _document_signature(session) != documents:
+                    return
+                # Explicit options, so the key matches what answer() looks up
+                top_k, mode = settings.default_top_k, settings.retrieval_mode
+                with request_class(Priority.WARMUP, session_id):
+                    response = await pipeline.answer(
+                        session, question, top_k=top_k, retrieval_mode=mode
+                    )
+                key = answer_cache_key(question, top_k, mode)
+                answers[key] = response
+                session.answer_cache = {**session.answer_cache, key: response}
+                status.completed += 1
+            status.state = "done"
+            # Merged into the current copy: other workers may have written it
+            session_manager.update_session(session_id, merge_answers)
+            logger.info(
+                f"Precomputed {status.completed} warm-up answers for {session_id}"
+            )
+        except asyncio.CancelledError:
+            status.state = "cancelled"
+            raise
+        except Exception as e:
+            status.state = "failed"
+            logger.warning(f"Warm-up stopped for session {session_id}: {e}")
+
+
+def _document_signature(session: Session) -> Dict[str, Tuple[str, ...]]:
+    """Chunk IDs per document; IDs are content hashes, so equal means same text."""
+    return {
+        name: tuple(chunk.id for chunk in doc.chunks)
+        for name, doc in session.documents.items()
+    }
+
+
+# Global warm-up service instance
+warmup_service = WarmupService()
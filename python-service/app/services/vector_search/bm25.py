@@ -0,0 +1,72 @@
+"""BM25 lexical indexing and scoring."""
+import re
+from collections import Counter, defaultdict
+from typing import Dict, List, Sequence
+
+import numpy as np
+
+from app.types.chunk import Chunk
+from app.types.lexical import LexicalIndex
+
+# Standard BM25 parameters
+K1 = 1.5
+B = 0.75
+
+# Keeps technology names such as "c++", "c#" and "node.js" whole
+_TOKEN_PATTERN = re.compile(r"[a-z0-9][a-z0-9+#.]*")
+
+_STOPWORDS = frozenset(
+    "a an and are as at be by does for from has have how in is it its of on "
+    "or the this to was what when where which who with".split()
+)
+
+
+def tokenize(text: str) -> List[str]:
+    """Lowercase and split text into index terms."""
+    tokens = (token.rstrip(".") for token in _TOKEN_PATTERN.findall(text.lower()))
+    return [token for token in tokens if token and token not in _STOPWORDS]
+
+
+def build_bm25_index(chunks: Sequence[Chunk]) -> LexicalIndex:
+    """Build an inverted index over a document's chunks."""
+    positions: Dict[str, List[int]] = defaultdict(list)
+    frequencies: Dict[str, List[int]] = defaultdict(list)
+    lengths = np.zeros(len(chunks), dtype=np.float32)
+
+    for i, chunk in enumerate(chunks):
+        tokens = tokenize(chunk.text)
+        lengths[i] = len(tokens)
+        for term, count in Counter(tokens).items():
+            positions[term].append(i)
+            frequencies[term].append(count)
+
+    postings = {
+        term: (
+            np.asarray(positions[term], dtype=np.int32),
+            np.asarray(frequencies[term], dtype=np.float32),
+        )
+        for term in positions
+    }
+    average_length = float(lengths.mean()) if len(chunks) else 0.0
+    return LexicalIndex(postings, lengths, average_length)
+
+
+def bm25_scores(index: LexicalIndex, query: str) -> np.ndarray:
+    """Score every chunk in the index against a query."""
+    n = len(index.chunk_lengths)
+    scores = np.zeros(n, dtype=np.float32)
+    if n == 0 or index.average_length == 0:
+        return scores
+
+    length_norm = K1 * (1 - B + B * index.chunk_lengths / index.average_length)
+    for term in set(tokenize(query)):
+        posting = index.postings.get(term)
+        if posting is None:
+            continue
+        chunk_positions, tf = posting
+        df = len(chunk_positions)
+        idf = np.log(1 + (n - df + 0.5) / (df + 0.5))
+        scores[chunk_positions] += (
+            idf * tf * (K1 + 1) / (tf + length_norm[chunk_positions])
+        )
+    return scores
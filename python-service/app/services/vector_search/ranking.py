@@ -1,8 +1,11 @@
 """Result ranking and filtering."""
-from typing import List
+from typing import Dict, List, Sequence, Tuple
 
 from app.types.rag import SearchResult
 
+# Damping constant from the original reciprocal rank fusion paper
+RRF_K = 60
+
 
 def rank_results(results: List[SearchResult], top_k: int) -> List[SearchResult]:
     """Rank results by score and return top_k."""
@@ -10,3 +13,30 @@ def rank_results(results: List[SearchResult], top_k: int) -> List[SearchResult]:
     sorted_results = sorted(results, key=lambda x: x.score, reverse=True)
     return sorted_results[:top_k]
 
+
+def reciprocal_rank_fusion(
+    rankings: Sequence[List[SearchResult]], top_k: int, k: int = RRF_K
+) -> List[SearchResult]:
+    """
+    Fuse ranked lists by summing 1 / (k + rank) per chunk.
+    Scores are scaled so a chunk ranked first in every list scores 1.0.
+    """
+    fused: Dict[Tuple[str | None, str], float] = {}
+    firsts: Dict[Tuple[str | None, str], SearchResult] = {}
+    for ranking in rankings:
+        for rank, result in enumerate(ranking, start=1):
+            key = (result.document, result.chunk_id)
+            fused[key] = fused.get(key, 0.0) + 1.0 / (k + rank)
+            firsts.setdefault(key, result)
+
+    best = len(rankings) / (k + 1)
+    results = [
+        SearchResult(
+            chunk_id=result.chunk_id,
+            score=fused[key] / best,
+            chunk_text=result.chunk_text,
+            document=result.document,
+        )
+        for key, result in firsts.items()
+    ]
+    return rank_results(results, top_k)
@@ -1,12 +1,19 @@
-"""Vector search implementation."""
-from typing import List
+"""Vector, lexical and hybrid search implementation."""
+from typing import List, Sequence
+
+import numpy as np
 
 from app.core.config import settings
-from app.services.vector_search.ranking import rank_results
-from app.services.vector_search.similarity import cosine_similarity
+from app.services.vector_search.bm25 import bm25_scores
+from app.services.vector_search.ranking import rank_results, reciprocal_rank_fusion
+from app.services.vector_search.similarity import cosine_similarity_matrix
 from app.types.chunk import Chunk
 from app.types.embedding import EmbeddingVector
 from app.types.rag import SearchResult
+from app.types.session import SessionDocument
+
+# Each ranking contributes this many times top_k candidates to fusion
+HYBRID_CANDIDATE_FACTOR = 3
 
 
 class VectorSearchService:
@@ -25,7 +32,7 @@ class VectorSearchService:
         """
         top_k = top_k or settings.default_top_k
 
-        if not document_embeddings or not chunks:
+        if len(document_embeddings) == 0 or not chunks:
             return []
 
         if len(document_embeddings) != len(chunks):
@@ -33,19 +40,128 @@ class VectorSearchService:
                 "Number of embeddings must match number of chunks"
             )
 
-        # Calculate similarities
-        results: List[SearchResult] = []
-        for i, (embedding, chunk) in enumerate(zip(document_embeddings, chunks)):
-            score = cosine_similarity(query_embedding, embedding)
-            results.append(
-                SearchResult(
-                    chunk_id=chunk.id,
-                    score=score,
-                    chunk_text=chunk.text,
-                )
-            )
+        results = self._score_segment(
+            np.asarray(query_embedding, dtype=np.float32),
+            document_embeddings,
+            chunks,
+            top_k,
+        )
 
         # Rank and return top_k
         ranked_results = rank_results(results, top_k)
         return ranked_results
 
+    def search_documents(
+        self,
+        query_embedding: EmbeddingVector,
+        documents: Sequence[SessionDocument],
+        top_k: int | None = None,
+    ) -> List[SearchResult]:
+        """
+        Search across several document segments.
+        Each segment is scored independently and the results merged.
+        """
+        top_k = top_k or settings.default_top_k
+        query = np.asarray(query_embedding, dtype=np.float32)
+
+        results: List[SearchResult] = []
+        for document in documents:
+            if not document.chunks:
+                continue
+            results.extend(
+                self._score_segment(
+                    query,
+                    document.embeddings,
+                    document.chunks,
+                    top_k,
+                    document=document.name,
+                )
+            )
+
+        return rank_results(results, top_k)
+
+    def lexical_search(
+        self,
+        query: str,
+        documents: Sequence[SessionDocument],
+        top_k: int | None = None,
+    ) -> List[SearchResult]:
+        """
+        Rank chunks by BM25 against each document's lexical index.
+        Needs no query embedding. Scores are scaled so the best match is 1.0.
+        """
+        top_k = top_k or settings.default_top_k
+
+        results: List[SearchResult] = []
+        for document in documents:
+            if not document.chunks or document.lexical_index is None:
+                continue
+            scores = bm25_scores(document.lexical_index, query)
+            results.extend(
+                self._top_candidates(
+                    scores, document.chunks, top_k, document.name, positive_only=True
+                )
+            )
+
+        ranked = rank_results(results, top_k)
+        if ranked:
+            best = ranked[0].score
+            for result in ranked:
+                result.score /= best
+        return ranked
+
+    def hybrid_search(
+        self,
+        query_embedding: EmbeddingVector,
+        query: str,
+        documents: Sequence[SessionDocument],
+        top_k: int | None = None,
+    ) -> List[SearchResult]:
+        """Fuse vector and BM25 rankings with reciprocal rank fusion."""
+        top_k = top_k or settings.default_top_k
+        pool = top_k * HYBRID_CANDIDATE_FACTOR
+        return reciprocal_rank_fusion(
+            [
+                self.search_documents(query_embedding, documents, pool),
+                self.lexical_search(query, documents, pool),
+            ],
+            top_k,
+        )
+
+    @classmethod
+    def _score_segment(
+        cls,
+        query: np.ndarray,
+        embeddings,
+        chunks: Sequence[Chunk],
+        top_k: int,
+        document: str | None = None,
+    ) -> List[SearchResult]:
+        """Score one embedding segment and keep its top_k candidates."""
+        scores = cosine_similarity_matrix(query, embeddings)
+        return cls._top_candidates(scores, chunks, top_k, document)
+
+    @staticmethod
+    def _top_candidates(
+        scores: np.ndarray,
+        chunks: Sequence[Chunk],
+        top_k: int,
+        document: str | None = None,
+        positive_only: bool = False,
+    ) -> List[SearchResult]:
+        """Keep a segment's top_k candidates, optionally only positive scores."""
+        if len(scores) > top_k:
+            candidates = np.argpartition(-scores, top_k - 1)[:top_k]
+        else:
+            candidates = range(len(scores))
+
+        return [
+            SearchResult(
+                chunk_id=chunks[i].id,
+                score=float(scores[i]),
+                chunk_text=chunks[i].text,
+                document=document,
+            )
+            for i in candidates
+            if not positive_only or scores[i] > 0
+        ]
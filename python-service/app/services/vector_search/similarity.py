@@ -17,3 +17,17 @@ def cosine_similarity(vec1: List[float], vec2: List[float]) -> float:
 
     return float(dot_product / (norm1 * norm2))
 
+
+def cosine_similarity_matrix(query: np.ndarray, matrix: np.ndarray) -> np.ndarray:
+    """Calculate cosine similarity between a query and each row of a matrix."""
+    query = np.asarray(query, dtype=np.float32)
+    matrix = np.asarray(matrix, dtype=np.float32)
+
+    query_norm = np.linalg.norm(query)
+    row_norms = np.linalg.norm(matrix, axis=1)
+    denominator = row_norms * query_norm
+
+    scores = matrix @ query
+    return np.divide(
+        scores, denominator, out=np.zeros_like(scores), where=denominator != 0
+    )
@@ -1,14 +1,19 @@
 """Type definitions package."""
 from app.types.chunk import Chunk, ChunkMetadata
 from app.types.embedding import EmbeddingVector
+from app.types.facts import Fact
+from app.types.lexical import LexicalIndex
 from app.types.rag import RAGResponse, SearchResult
-from app.types.session import Session
+from app.types.session import Session, SessionDocument
 
 __all__ = [
     "Session",
+    "SessionDocument",
     "Chunk",
     "ChunkMetadata",
     "EmbeddingVector",
+    "Fact",
+    "LexicalIndex",
     "RAGResponse",
     "SearchResult",
 ]
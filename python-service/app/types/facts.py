@@ -0,0 +1,11 @@
+"""Extracted fact type definitions."""
+from dataclasses import dataclass
+
+
+@dataclass(frozen=True)
+class Fact:
+    """Structured fact extracted from a chunk at ingestion time."""
+
+    kind: str  # email, phone, linkedin, github, experience, date_range or skill
+    value: str
+    chunk_id: str
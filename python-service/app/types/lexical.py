@@ -0,0 +1,23 @@
+"""Lexical index type definitions."""
+from dataclasses import dataclass
+from typing import Dict, Tuple
+
+import numpy as np
+
+
+@dataclass(frozen=True)
+class LexicalIndex:
+    """Inverted index over one document's chunks, used for BM25 scoring."""
+
+    # term -> (chunk positions, term frequencies), both aligned arrays
+    postings: Dict[str, Tuple[np.ndarray, np.ndarray]]
+    chunk_lengths: np.ndarray  # Token count per chunk
+    average_length: float
+
+    @property
+    def nbytes(self) -> int:
+        """Approximate bytes held by the postings and length arrays."""
+        return self.chunk_lengths.nbytes + sum(
+            len(term) + positions.nbytes + frequencies.nbytes
+            for term, (positions, frequencies) in self.postings.items()
+        )
@@ -1,6 +1,6 @@
 """RAG type definitions."""
 from dataclasses import dataclass
-from typing import List
+from typing import List, Optional
 
 
 @dataclass
@@ -10,6 +10,7 @@ class SearchResult:
     chunk_id: str
     score: float
     chunk_text: str
+    document: Optional[str] = None  # Name of the session document
 
 
 @dataclass
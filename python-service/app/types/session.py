@@ -1,10 +1,74 @@
 """Session type definitions."""
-from dataclasses import dataclass
+import sys
+import threading
+from dataclasses import dataclass, field
 from datetime import datetime
-from typing import List, Optional
+from typing import Dict, List, Optional, Sequence, Tuple
+
+import numpy as np
 
 from app.types.chunk import Chunk
-from app.types.embedding import EmbeddingVector
+from app.types.facts import Fact
+from app.types.lexical import LexicalIndex
+from app.types.rag import RAGResponse
+
+# Rough per-object overhead of a Chunk (instance, metadata, id string)
+CHUNK_OVERHEAD_BYTES = 400
+# Rough per-object overhead of an extracted Fact
+FACT_OVERHEAD_BYTES = 150
+# Rough per-entry overhead of a cached answer
+ANSWER_OVERHEAD_BYTES = 300
+# Rough fixed overhead of an empty Session
+SESSION_OVERHEAD_BYTES = 1024
+
+
+@dataclass
+class SessionDocument:
+    """
+    Named document with its own chunk store and embedding segment.
+    Treated as immutable once built: chunks are a tuple and the segment is
+    read-only, so a reader holding a document always sees matching pairs.
+    """
+
+    name: str
+    source_type: str  # "resume" | "jd"
+    chunks: Tuple[Chunk, ...]
+    embeddings: np.ndarray  # (len(chunks), dim) float32 segment
+    facts: Tuple[Fact, ...] = ()  # Extracted at ingestion for the fast path
+    lexical_index: Optional[LexicalIndex] = field(default=None, repr=False)
+    nbytes: int = field(init=False, default=0, repr=False)
+
+    def __post_init__(self) -> None:
+        self.chunks = tuple(self.chunks)
+        self.facts = tuple(self.facts)
+        if not self.chunks:
+            self.embeddings = np.zeros((0, 0), dtype=np.float32)
+        else:
+            self.embeddings = np.asarray(
+                self.embeddings, dtype=np.float32
+            ).reshape(len(self.chunks), -1)
+        self.embeddings.setflags(write=False)
+        self.nbytes = self._measure()
+
+    def _measure(self) -> int:
+        """Approximate bytes held by chunk text, embeddings, facts and index."""
+        text_bytes = sum(
+            sys.getsizeof(chunk.text) + CHUNK_OVERHEAD_BYTES for chunk in self.chunks
+        )
+        fact_bytes = sum(
+            sys.getsizeof(fact.value) + FACT_OVERHEAD_BYTES for fact in self.facts
+        )
+        index_bytes = self.lexical_index.nbytes if self.lexical_index else 0
+        return text_bytes + self.embeddings.nbytes + fact_bytes + index_bytes
+
+
+@dataclass
+class WarmupStatus:
+    """Progress of background answer precomputation for a session."""
+
+    state: str = "idle"  # idle | running | done | failed | cancelled
+    completed: int = 0
+    total: int = 0
 
 
 @dataclass
@@ -12,13 +76,58 @@ class Session:
     """Session data structure for in-memory storage."""
 
     session_id: str
-    chunks: List[Chunk]
-    embeddings: List[EmbeddingVector]
     source_type: str  # "resume" | "jd"
     created_at: datetime
     expires_at: datetime
+    documents: Dict[str, SessionDocument] = field(default_factory=dict)
+    # Precomputed answers keyed by normalised query; cleared on ingestion
+    answer_cache: Dict[str, RAGResponse] = field(
+        default_factory=dict, repr=False, compare=False
+    )
+    warmup: WarmupStatus = field(
+        default_factory=WarmupStatus, repr=False, compare=False
+    )
+    # Backend version this copy was loaded or last stored at; 0 if never stored
+    version: int = field(default=0, repr=False, compare=False)
+    _write_lock: threading.Lock = field(
+        default_factory=threading.Lock, init=False, repr=False, compare=False
+    )
 
     def is_expired(self) -> bool:
         """Check if session has expired."""
         return datetime.now() > self.expires_at
 
+    @property
+    def chunks(self) -> List[Chunk]:
+        """All chunks across documents, in document order."""
+        return [chunk for doc in self.documents.values() for chunk in doc.chunks]
+
+    def memory_bytes(self) -> int:
+        """Approximate bytes held by this session's documents and caches."""
+        cache_bytes = sum(
+            sys.getsizeof(key) + sys.getsizeof(response.answer) + ANSWER_OVERHEAD_BYTES
+            for key, response in self.answer_cache.items()
+        )
+        return (
+            SESSION_OVERHEAD_BYTES
+            + sum(doc.nbytes for doc in self.documents.values())
+            + cache_bytes
+        )
+
+    def add_document(self, document: SessionDocument) -> None:
+        """Add or replace a document without touching the others."""
+        # Copy-on-write: readers keep whichever mapping they already hold,
+        # writers are serialised so concurrent updates aren't lost
+        with self._write_lock:
+            self.documents = {**self.documents, document.name: document}
+            # Answers computed over the old documents are stale
+            self.answer_cache = {}
+
+    def select_documents(
+        self, names: Optional[Sequence[str]] = None
+    ) -> List[SessionDocument]:
+        """Return the named documents (all documents if names is None)."""
+        documents = self.documents
+        if names is None:
+            return list(documents.values())
+        return [documents[name] for name in names if name in documents]
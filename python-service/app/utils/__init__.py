@@ -1,6 +1,12 @@
 """Utility functions package."""
-from app.utils.logger import logger, setup_logging
-from app.utils.text_utils import clean_text, normalize_whitespace, remove_empty_lines
+from app.utils.logger import get_logger, logger, setup_logging
+from app.utils.text_utils import (
+    clean_text,
+    content_hash,
+    normalize_whitespace,
+    remove_empty_lines,
+)
+from app.utils.vector_codec import decode_vector, encode_vector
 from app.utils.validation import (
     validate_chunk_size,
     validate_overlap,
@@ -10,11 +16,15 @@ from app.utils.validation import (
 )
 
 __all__ = [
+    "get_logger",
     "logger",
     "setup_logging",
     "clean_text",
+    "content_hash",
     "normalize_whitespace",
     "remove_empty_lines",
+    "encode_vector",
+    "decode_vector",
     "validate_session_id",
     "validate_chunk_size",
     "validate_overlap",
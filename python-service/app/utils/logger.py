@@ -1,18 +1,148 @@
-"""Logging configuration."""
+"""Logging configuration.
+
+Records are formatted as JSON lines (or plain text) and written by a
+background listener thread: loggers only enqueue, so request handlers on
+the event loop never block on stdout.
+"""
+import atexit
 import logging
+import queue
 import sys
-from app.core.config import settings
+import uuid
+from contextvars import ContextVar
+from logging.handlers import QueueHandler, QueueListener
+from typing import Dict, Optional
+
+import orjson
+
+ROOT_LOGGER = "resumelens"
+
+# Correlates every record logged while serving one request
+request_id_var: ContextVar[Optional[str]] = ContextVar("request_id", default=None)
+
+# Attributes every LogRecord has; anything else came from `extra=`
+_RECORD_ATTRS = frozenset(
+    vars(logging.LogRecord("", 0, "", 0, "", (), None)).keys()
+) | {"message", "asctime", "request_id"}
+
+_listener: Optional[QueueListener] = None
+# The root's queue handler, and the handler its listener writes to
+_queue_handler: Optional[QueueHandler] = None
+_stream_handler: Optional[logging.Handler] = None
+
+
+def new_request_id() -> str:
+    return uuid.uuid4().hex
+
+
+def get_logger(module_name: str) -> logging.Logger:
+    """Logger for a module; `app.llm.client` becomes `resumelens.llm.client`."""
+    if module_name.startswith("app."):
+        module_name = module_name[len("app."):]
+    return logging.getLogger(f"{ROOT_LOGGER}.{module_name}")
+
+
+class RequestIdFilter(logging.Filter):
+    """Attach the current request ID to each record."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        record.request_id = request_id_var.get()
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    """Format records as single-line JSON objects, including `extra` fields."""
+
+    def format(self, record: logging.LogRecord) -> str:
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "message": record.getMessage(),
+        }
+        request_id = getattr(record, "request_id", None)
+        if request_id:
+            entry["request_id"] = request_id
+        for key, value in vars(record).items():
+            if key not in _RECORD_ATTRS:
+                entry[key] = value
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return orjson.dumps(entry, default=str).decode()
+
+
+def parse_log_levels(spec: str) -> Dict[str, int]:
+    """Parse 'resumelens.llm=DEBUG,uvicorn.access=WARNING' into logger levels."""
+    levels = {}
+    for item in spec.split(","):
+        name, _, level = item.partition("=")
+        if not (name.strip() and level.strip()):
+            continue
+        # getLevelName maps known names to ints and anything else to a string
+        value = logging.getLevelName(level.strip().upper())
+        if isinstance(value, int):
+            levels[name.strip()] = value
+        else:
+            logger.warning(
+                f"Ignoring unknown log level {level.strip()!r} for {name.strip()}"
+            )
+    return levels
 
 
 def setup_logging(level: str | None = None) -> None:
-    """Set up structured logging."""
+    """Set up queued, structured logging with per-logger levels."""
+    # Imported here: app.core imports this module, so a top-level import cycles
+    from app.core.config import settings
+
+    global _listener, _queue_handler, _stream_handler
+    shutdown_logging()
+
+    stream_handler = logging.StreamHandler(sys.stdout)
+    if settings.log_format == "json":
+        stream_handler.setFormatter(JsonFormatter())
+    else:
+        stream_handler.setFormatter(
+            logging.Formatter(
+                "%(asctime)s - %(name)s - %(levelname)s - [%(request_id)s] %(message)s"
+            )
+        )
+
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+
+    root = logging.getLogger()
+    for handler in list(root.handlers):
+        root.removeHandler(handler)
+    root.addHandler(queue_handler)
     log_level = level or settings.log_level
-    logging.basicConfig(
-        level=getattr(logging, log_level.upper(), logging.INFO),
-        format="%(asctime)s - %(name)s - %(levelname)s - %(message)s",
-        handlers=[logging.StreamHandler(sys.stdout)],
-    )
+    root.setLevel(getattr(logging, log_level.upper(), logging.INFO))
+    for name, module_level in parse_log_levels(settings.log_levels).items():
+        logging.getLogger(name).setLevel(module_level)
+
+    _queue_handler, _stream_handler = queue_handler, stream_handler
+    _listener = QueueListener(log_queue, stream_handler, respect_handler_level=True)
+    _listener.start()
+
+
+def shutdown_logging() -> None:
+    """Flush queued records and stop the listener thread.
+
+    The root logger then writes directly to the stream, so records logged
+    after shutdown (e.g. by uvicorn) are not queued and lost.
+    """
+    global _listener, _queue_handler
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
+    if _queue_handler is not None:
+        root = logging.getLogger()
+        root.removeHandler(_queue_handler)
+        _stream_handler.addFilter(RequestIdFilter())
+        root.addHandler(_stream_handler)
+        _queue_handler = None
 
 
-logger = logging.getLogger("resumelens")
+atexit.register(shutdown_logging)
 
+logger = logging.getLogger(ROOT_LOGGER)
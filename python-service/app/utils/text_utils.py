@@ -1,4 +1,5 @@
 """Text manipulation utilities."""
+import hashlib
 import re
 from typing import List
 
@@ -33,3 +34,7 @@ def split_into_sentences(text: str) -> List[str]:
     sentences = re.split(r"[.!?]+\s+", text)
     return [s.strip() for s in sentences if s.strip()]
 
+
+def content_hash(text: str) -> str:
+    """Return a stable hex digest identifying text content."""
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
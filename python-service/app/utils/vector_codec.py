@@ -0,0 +1,23 @@
+"""Compact wire encoding for embedding vectors."""
+import base64
+from typing import Sequence
+
+import numpy as np
+
+# Little-endian float32, independent of host byte order
+WIRE_DTYPE = np.dtype("<f4")
+
+
+def encode_vector(vector: Sequence[float] | np.ndarray) -> str:
+    """Encode a vector as base64 little-endian float32."""
+    return base64.b64encode(np.asarray(vector, dtype=WIRE_DTYPE).tobytes()).decode(
+        "ascii"
+    )
+
+
+def decode_vector(data: str) -> np.ndarray:
+    """Decode a base64 little-endian float32 vector into a NumPy array."""
+    raw = base64.b64decode(data, validate=True)
+    if len(raw) % WIRE_DTYPE.itemsize:
+        raise ValueError("Encoded vector length is not a multiple of 4 bytes")
+    return np.frombuffer(raw, dtype=WIRE_DTYPE)
@@ -0,0 +1,244 @@
+"""Benchmark chunking, cleaning, search, ranking, prompt building and parsing.
+
+Text benchmarks run over document sizes from 1 KB to 10 MB; search and
+ranking run over sessions of 10 to 100k chunks. Results can be written as
+JSON and compared against a previous run, exiting non-zero if any case got
+slower by more than the threshold:
+
+    python -m benchmarks.bench_hot_paths --output base.json
+    git checkout my-branch
+    python -m benchmarks.bench_hot_paths --compare base.json
+
+Usage:
+    python -m benchmarks.bench_hot_paths [--quick] [--dim 768]
+        [--output results.json] [--compare baseline.json] [--threshold 0.2]
+"""
+import argparse
+import json
+import os
+import platform
+import random
+import subprocess
+import sys
+import time
+import timeit
+from typing import Callable, Dict, List
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+import numpy as np  # noqa: E402
+
+from app.services.chunking.chunker import ChunkerService  # noqa: E402
+from app.services.rag.prompt_builder import build_prompt  # noqa: E402
+from app.services.rag.response_parser import parse_response  # noqa: E402
+from app.services.vector_search.ranking import rank_results  # noqa: E402
+from app.services.vector_search.searcher import VectorSearchService  # noqa: E402
+from app.types.chunk import Chunk, ChunkMetadata  # noqa: E402
+from app.types.rag import SearchResult  # noqa: E402
+from app.utils.text_utils import clean_text  # noqa: E402
+
+DOC_SIZES = {
+    "1KB": 1_000,
+    "10KB": 10_000,
+    "100KB": 100_000,
+    "1MB": 1_000_000,
+    "10MB": 10_000_000,
+}
+SESSION_SIZES = {"10": 10, "100": 100, "1k": 1_000, "10k": 10_000, "100k": 100_000}
+# Chunks placed in the prompt, and cited in the parsed response
+PROMPT_SIZES = {"4": 4, "8": 8, "32": 32}
+QUICK_DOC_SIZES = ("1KB", "100KB")
+QUICK_SESSION_SIZES = ("10", "1k")
+TOP_K = 8
+
+_WORDS = (
+    "engineer python kubernetes led team of five designed built scalable "
+    "services reduced latency by 40% migrated postgres aws gcp terraform "
+    "mentored developers shipped features customers data pipelines kafka"
+).split()
+
+
+def synthetic_text(size: int, seed: int = 0) -> str:
+    """Resume-like text with blank lines and runs of spaces to clean up."""
+    rng = random.Random(seed)
+    parts: List[str] = []
+    length = 0
+    while length < size:
+        sentence = " ".join(rng.choices(_WORDS, k=rng.randint(6, 18))).capitalize()
+        separator = rng.choice([". ", ".  ", ".\n", ".\n\n\n", ".\n   \n"])
+        parts.append(sentence + separator)
+        length += len(sentence) + len(separator)
+    return "".join(parts)[:size]
+
+
+def make_chunks(count: int) -> List[Chunk]:
+    text = synthetic_text(800)
+    return [
+        Chunk(id=f"chunk-{i}", text=text, index=i, metadata=ChunkMetadata())
+        for i in range(count)
+    ]
+
+
+def measure(fn: Callable[[], object], min_time: float) -> Dict[str, float]:
+    """Best-of-5 seconds per call, with enough calls to fill `min_time`."""
+    number, elapsed = timeit.Timer(fn).autorange()
+    number = max(1, int(number * min_time / max(elapsed, 1e-9)))
+    runs = timeit.repeat(fn, number=number, repeat=5)
+    return {"seconds": min(runs) / number, "calls": number}
+
+
+def text_cases(sizes) -> List[tuple]:
+    chunker = ChunkerService()
+    cases = []
+    for label in sizes:
+        size = DOC_SIZES[label]
+        text = synthetic_text(size)
+        cases.append(("clean_text", label, size, lambda t=text: clean_text(t)))
+        cleaned = clean_text(text)
+        cases.append(("chunk", label, size, lambda t=cleaned: chunker.chunk(t)))
+    return cases
+
+
+def session_cases(sizes, dim: int) -> List[tuple]:
+    searcher = VectorSearchService()
+    rng = np.random.default_rng(0)
+    query = rng.standard_normal(dim).astype(np.float32).tolist()
+    cases = []
+    for label in sizes:
+        count = SESSION_SIZES[label]
+        chunks = make_chunks(count)
+        embeddings = rng.standard_normal((count, dim)).astype(np.float32)
+        results = [
+            SearchResult(chunk_id=c.id, score=float(s), chunk_text=c.text)
+            for c, s in zip(chunks, rng.random(count))
+        ]
+        cases.append(
+            (
+                "search",
+                label,
+                count,
+                lambda e=embeddings, c=chunks: searcher.search(query, e, c, TOP_K),
+            )
+        )
+        cases.append(
+            ("rank_results", label, count, lambda r=results: rank_results(r, TOP_K))
+        )
+    return cases
+
+
+def prompt_cases() -> List[tuple]:
+    cases = []
+    for label, count in PROMPT_SIZES.items():
+        chunks = make_chunks(count)
+        results = [
+            SearchResult(chunk_id=c.id, score=0.8, chunk_text=c.text) for c in chunks
+        ]
+        answer = " ".join(
+            f"Led a team of five engineers [chunk-{i}]." for i in range(count)
+        )
+        cases.append(
+            (
+                "build_prompt",
+                label,
+                count,
+                lambda c=chunks: build_prompt("What did they lead?", c),
+            )
+        )
+        cases.append(
+            (
+                "parse_response",
+                label,
+                count,
+                lambda r=results, a=answer: parse_response(a, r),
+            )
+        )
+    return cases
+
+
+def git_commit() -> str | None:
+    try:
+        return subprocess.run(
+            ["git", "rev-parse", "--short", "HEAD"],
+            capture_output=True,
+            text=True,
+            check=True,
+        ).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def compare(results: List[dict], baseline_path: str, threshold: float) -> bool:
+    """Print slowdowns against a baseline run; return True if none regressed."""
+    with open(baseline_path) as f:
+        baseline = {
+            (r["benchmark"], r["size"]): r["seconds"] for r in json.load(f)["results"]
+        }
+    print(
+        f"\n{'benchmark':<16} {'size':<7} {'baseline':>12} "
+        f"{'current':>12} {'change':>8}"
+    )
+    ok = True
+    for result in results:
+        before = baseline.get((result["benchmark"], result["size"]))
+        if before is None:
+            continue
+        change = result["seconds"] / before - 1
+        flag = "  REGRESSION" if change > threshold else ""
+        ok = ok and not flag
+        print(
+            f"{result['benchmark']:<16} {result['size']:<7} "
+            f"{before * 1e6:>10.1f}us {result['seconds'] * 1e6:>10.1f}us "
+            f"{change:>+7.0%}{flag}"
+        )
+    return ok
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--quick", action="store_true", help="Smaller sizes only")
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--min-time", type=float, default=0.2)
+    parser.add_argument("--output", help="Write results as JSON")
+    parser.add_argument("--compare", help="Baseline JSON to compare against")
+    parser.add_argument("--threshold", type=float, default=0.2)
+    args = parser.parse_args()
+
+    doc_sizes = QUICK_DOC_SIZES if args.quick else tuple(DOC_SIZES)
+    session_sizes = QUICK_SESSION_SIZES if args.quick else tuple(SESSION_SIZES)
+
+    print(f"{'benchmark':<16} {'size':<7} {'us/call':>12} {'per item':>14}")
+    results = []
+    for groups in (
+        lambda: text_cases(doc_sizes),
+        lambda: session_cases(session_sizes, args.dim),
+        prompt_cases,
+    ):
+        for benchmark, label, items, fn in groups():
+            timing = measure(fn, args.min_time)
+            results.append(
+                {"benchmark": benchmark, "size": label, "items": items, **timing}
+            )
+            per_item = timing["seconds"] / items * 1e9
+            print(
+                f"{benchmark:<16} {label:<7} {timing['seconds'] * 1e6:>12.1f} "
+                f"{per_item:>11.1f} ns"
+            )
+
+    if args.output:
+        report = {
+            "commit": git_commit(),
+            "timestamp": time.strftime("%Y-%m-%dT%H:%M:%S"),
+            "python": platform.python_version(),
+            "numpy": np.__version__,
+            "dim": args.dim,
+            "results": results,
+        }
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+    if args.compare and not compare(results, args.compare, args.threshold):
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,101 @@
+"""Benchmark logging cost on the request path.
+
+Compares the logging the chat path used to do per Gemini generation (two
+flushed prints plus two INFO records through a synchronous StreamHandler)
+with the current setup (DEBUG-gated introspection and a QueueHandler whose
+listener thread does the formatting and writing), and the cost of a single
+INFO record under each handler.
+
+Usage:
+    python -m benchmarks.bench_logging [--number 20000] [--output /dev/null]
+"""
+import argparse
+import logging
+import os
+import queue
+import sys
+import timeit
+from contextlib import redirect_stdout
+from logging.handlers import QueueHandler, QueueListener
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from app.utils.logger import JsonFormatter, RequestIdFilter  # noqa: E402
+
+MODEL_NAME = "gemini-2.5-flash"
+
+
+def per_call_us(fn, number: int) -> float:
+    """Best-of-5 mean time per call in microseconds."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def make_logger(name: str, handler: logging.Handler) -> logging.Logger:
+    log = logging.getLogger(f"bench.{name}")
+    log.handlers = [handler]
+    log.propagate = False
+    log.setLevel(logging.INFO)
+    return log
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=20000)
+    parser.add_argument("--output", default=os.devnull)
+    args = parser.parse_args()
+
+    sink = open(args.output, "w")
+
+    sync_handler = logging.StreamHandler(sink)
+    sync_handler.setFormatter(
+        logging.Formatter("%(asctime)s - %(name)s - %(levelname)s - %(message)s")
+    )
+    sync_logger = make_logger("sync", sync_handler)
+
+    json_handler = logging.StreamHandler(sink)
+    json_handler.setFormatter(JsonFormatter())
+    log_queue: "queue.Queue[logging.LogRecord]" = queue.Queue(-1)
+    queue_handler = QueueHandler(log_queue)
+    queue_handler.addFilter(RequestIdFilter())
+    queued_logger = make_logger("queued", queue_handler)
+    listener = QueueListener(log_queue, json_handler)
+    listener.start()
+
+    def old_generate_logging():
+        print(f"=== generate() called - self.model_name: {MODEL_NAME} ===")
+        sys.stdout.flush()
+        print(f"=== Model object _model_name: models/{MODEL_NAME} ===")
+        sys.stdout.flush()
+        sync_logger.info(f"Generating with model: {MODEL_NAME}")
+        sync_logger.info(f"Model object name: models/{MODEL_NAME}")
+
+    def new_generate_logging():
+        if queued_logger.isEnabledFor(logging.DEBUG):
+            queued_logger.debug(f"Generating with model {MODEL_NAME}")
+
+    rows = [
+        ("generate() logging", "print+flush, sync", old_generate_logging),
+        ("generate() logging", "debug-gated", new_generate_logging),
+        (
+            "one INFO record",
+            "sync StreamHandler",
+            lambda: sync_logger.info("Processing RAG query", extra={"top_k": 5}),
+        ),
+        (
+            "one INFO record",
+            "QueueHandler",
+            lambda: queued_logger.info("Processing RAG query", extra={"top_k": 5}),
+        ),
+    ]
+
+    print(f"{'operation':<20} {'variant':<20} {'us/call':>10}")
+    with redirect_stdout(sink):
+        costs = [per_call_us(fn, args.number) for _, _, fn in rows]
+    listener.stop()
+    sink.close()
+    for (operation, variant, _), cost in zip(rows, costs):
+        print(f"{operation:<20} {variant:<20} {cost:>10.2f}")
+
+
+if __name__ == "__main__":
+    main()
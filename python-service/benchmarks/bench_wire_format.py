@@ -0,0 +1,122 @@
+"""Benchmark request parsing and response serialization per endpoint.
+
+Compares the JSON float-list query embedding against the base64 float32
+encoding for /api/search, and the stdlib JSON encoder against orjson for
+/api/search and /api/embed responses.
+
+Usage:
+    python -m benchmarks.bench_wire_format [--dim 768] [--number 2000]
+"""
+import argparse
+import json
+import os
+import random
+import timeit
+
+os.environ.setdefault("GEMINI_API_KEY", "benchmark")
+
+from fastapi.responses import JSONResponse, ORJSONResponse  # noqa: E402
+
+from app.api.models.embed import EmbedRequest, EmbedResponse  # noqa: E402
+from app.api.models.search import (  # noqa: E402
+    SearchRequest,
+    SearchResponse,
+    SearchResultModel,
+)
+from app.utils.vector_codec import encode_vector  # noqa: E402
+
+
+def per_call_us(fn, number: int) -> float:
+    """Best-of-5 mean time per call in microseconds."""
+    return min(timeit.repeat(fn, number=number, repeat=5)) / number * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--dim", type=int, default=768)
+    parser.add_argument("--number", type=int, default=2000)
+    args = parser.parse_args()
+
+    query = [random.uniform(-1, 1) for _ in range(args.dim)]
+    search_json = json.dumps(
+        {"session_id": "bench", "query_embedding": query, "top_k": 8}
+    ).encode()
+    search_b64 = json.dumps(
+        {"session_id": "bench", "query_embedding_b64": encode_vector(query), "top_k": 8}
+    ).encode()
+    embed_body = json.dumps(
+        {
+            "session_id": "bench",
+            "chunks": [
+                {
+                    "id": f"chunk-{i}",
+                    "text": "Experienced Python engineer. " * 30,
+                    "index": i,
+                    "metadata": {"section": None, "page_number": None},
+                }
+                for i in range(20)
+            ],
+        }
+    ).encode()
+
+    search_response = SearchResponse(
+        results=[
+            SearchResultModel(
+                chunk_id=f"chunk-{i}",
+                score=random.random(),
+                chunk_text="Experienced Python engineer. " * 30,
+                document="resume",
+            )
+            for i in range(8)
+        ]
+    )
+    embed_response = EmbedResponse(
+        success=True,
+        document="resume",
+        embedding_count=20,
+        embedded_count=2,
+        reused_count=18,
+    )
+
+    def render(response_class, model):
+        # Mirrors FastAPI: dump the response_model to JSON types, then render
+        return lambda: response_class(model.model_dump(mode="json")).body
+
+    rows = [
+        (
+            "search",
+            "parse",
+            "json float list",
+            lambda: SearchRequest.model_validate(json.loads(search_json)).query_vector,
+        ),
+        (
+            "search",
+            "parse",
+            "base64 float32",
+            lambda: SearchRequest.model_validate(json.loads(search_b64)).query_vector,
+        ),
+        ("search", "serialize", "stdlib json", render(JSONResponse, search_response)),
+        ("search", "serialize", "orjson", render(ORJSONResponse, search_response)),
+        (
+            "embed",
+            "parse",
+            "json",
+            lambda: EmbedRequest.model_validate(json.loads(embed_body)),
+        ),
+        ("embed", "serialize", "stdlib json", render(JSONResponse, embed_response)),
+        ("embed", "serialize", "orjson", render(ORJSONResponse, embed_response)),
+    ]
+
+    print(f"{'endpoint':<8} {'stage':<10} {'variant':<16} {'us/call':>10}")
+    results = []
+    for endpoint, stage, variant, fn in rows:
+        cost = per_call_us(fn, args.number)
+        results.append(
+            {"endpoint": endpoint, "stage": stage, "variant": variant, "us": cost}
+        )
+        print(f"{endpoint:<8} {stage:<10} {variant:<16} {cost:>10.1f}")
+    print(f"\nrequest bytes: search json={len(search_json)} b64={len(search_b64)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,320 @@
+"""Load test replaying the session -> upload -> chat flow with virtual users.
+
+Each virtual user creates a session, uploads a resume (and sometimes a job
+description) through /api/chunk and /api/embed, asks a few questions with
+think time between them, deletes the session and starts over. By default
+the app runs in-process on the local offline providers, so no API key or
+network is needed, and event-loop lag is measured on the loop serving the
+requests. With --url the same flow is sent to a running server instead.
+
+Usage:
+    python -m benchmarks.load_test [--users 20] [--duration 30]
+        [--think-time 1.0] [--doc-mix 2k=6,8k=3,32k=1] [--jd-probability 0.5]
+        [--embed-latency-ms 100] [--llm-latency-ms 1000] [--output out.json]
+        [--url http://localhost:8000]
+"""
+import argparse
+import asyncio
+import json
+import os
+import random
+import time
+from collections import defaultdict
+from typing import Dict, List, Tuple
+
+import httpx
+
+# Nothing from `app` is imported at module level: the provider settings
+# below must be in the environment before the app's settings are loaded.
+
+QUESTIONS = [
+    "Summarize this candidate's experience.",
+    "What are their strongest technical skills?",
+    "Have they led a team?",
+    "Which cloud platforms have they used?",
+    "How well do they fit the job description?",
+    "What is their email?",
+]
+# How often the event loop is sampled for lag
+LAG_INTERVAL_SECONDS = 0.05
+# Shortest pause after a failed upload, so rejected users don't spin
+MIN_BACKOFF_SECONDS = 0.1
+
+_WORDS = (
+    "engineer python kubernetes led team of five designed built scalable "
+    "services reduced latency migrated postgres aws gcp terraform mentored "
+    "developers shipped features customers data pipelines kafka"
+).split()
+
+
+def synthetic_document(size: int, rng: random.Random) -> str:
+    """Resume-like text of about `size` characters, with contact details."""
+    parts = [f"Candidate {rng.randrange(10_000)}\ncandidate@example.com\n\n"]
+    length = len(parts[0])
+    while length < size:
+        sentence = " ".join(rng.choices(_WORDS, k=rng.randint(6, 18))).capitalize()
+        parts.append(sentence + rng.choice([". ", ".\n"]))
+        length += len(sentence) + 2
+    return "".join(parts)[:size]
+
+
+class Recorder:
+    """Collects latencies and status codes per endpoint."""
+
+    def __init__(self):
+        self.latencies: Dict[str, List[float]] = defaultdict(list)
+        self.statuses: Dict[str, Dict[int, int]] = defaultdict(lambda: defaultdict(int))
+        self.loop_lag: List[float] = []
+        self.flows = 0
+
+    async def call(
+        self, client: httpx.AsyncClient, endpoint: str, method: str, path: str, **kwargs
+    ) -> httpx.Response:
+        started = time.perf_counter()
+        response = await client.request(method, path, **kwargs)
+        self.latencies[endpoint].append(time.perf_counter() - started)
+        self.statuses[endpoint][response.status_code] += 1
+        return response
+
+
+def parse_doc_mix(spec: str) -> Tuple[List[int], List[float]]:
+    """Parse '2k=6,8k=3' into document sizes in characters and weights."""
+    sizes, weights = [], []
+    for item in spec.split(","):
+        size, _, weight = item.partition("=")
+        size = size.strip().lower()
+        multiplier = 1000 if size.endswith("k") else 1
+        sizes.append(int(float(size.rstrip("k")) * multiplier))
+        weights.append(float(weight or 1))
+    return sizes, weights
+
+
+async def upload(
+    recorder: Recorder,
+    client: httpx.AsyncClient,
+    session_id: str,
+    text: str,
+    source_type: str,
+) -> bool:
+    chunked = await recorder.call(
+        client,
+        "chunk",
+        "POST",
+        "/api/chunk/",
+        json={"text": text, "session_id": session_id, "source_type": source_type},
+    )
+    if chunked.status_code != 200:
+        return False
+    embedded = await recorder.call(
+        client,
+        "embed",
+        "POST",
+        "/api/embed/",
+        json={"session_id": session_id, "chunks": chunked.json()["chunks"]},
+    )
+    return embedded.status_code == 200
+
+
+async def virtual_user(
+    recorder: Recorder,
+    client: httpx.AsyncClient,
+    args,
+    rng: random.Random,
+    start_delay: float,
+) -> None:
+    sizes, weights = parse_doc_mix(args.doc_mix)
+    await asyncio.sleep(start_delay)
+    while True:
+        created = await recorder.call(
+            client,
+            "session_create",
+            "POST",
+            "/api/session/create",
+            json={"source_type": "resume"},
+        )
+        if created.status_code != 200:
+            await asyncio.sleep(args.think_time)
+            continue
+        session_id = created.json()["session_id"]
+
+        documents = [("resume", rng.choices(sizes, weights)[0])]
+        if rng.random() < args.jd_probability:
+            documents.append(("jd", rng.choices(sizes, weights)[0]))
+        uploaded = True
+        for source_type, size in documents:
+            text = synthetic_document(size, rng)
+            uploaded = uploaded and await upload(
+                recorder, client, session_id, text, source_type
+            )
+
+        if uploaded:
+            for question in rng.sample(QUESTIONS, min(args.chats, len(QUESTIONS))):
+                if args.think_time:
+                    await asyncio.sleep(rng.expovariate(1 / args.think_time))
+                await recorder.call(
+                    client,
+                    "chat",
+                    "POST",
+                    "/api/rag/chat",
+                    json={"session_id": session_id, "query": question},
+                )
+
+        await recorder.call(
+            client, "session_delete", "DELETE", f"/api/session/{session_id}"
+        )
+        recorder.flows += 1
+        if not uploaded:
+            # Back off after a rejected upload (e.g. a 503), as a client would
+            await asyncio.sleep(max(args.think_time, MIN_BACKOFF_SECONDS))
+
+
+async def monitor_loop_lag(samples: List[float]) -> None:
+    """Record how late the loop wakes a sleeping task."""
+    loop = asyncio.get_running_loop()
+    while True:
+        started = loop.time()
+        await asyncio.sleep(LAG_INTERVAL_SECONDS)
+        samples.append(loop.time() - started - LAG_INTERVAL_SECONDS)
+
+
+def percentile(values: List[float], q: float) -> float:
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+def summarize(recorder: Recorder, elapsed: float) -> dict:
+    endpoints = {}
+    for endpoint, latencies in recorder.latencies.items():
+        statuses = recorder.statuses[endpoint]
+        endpoints[endpoint] = {
+            "requests": len(latencies),
+            "errors": sum(n for code, n in statuses.items() if code >= 400),
+            "statuses": dict(statuses),
+            "throughput_rps": len(latencies) / elapsed,
+            "p50_ms": percentile(latencies, 0.50) * 1000,
+            "p95_ms": percentile(latencies, 0.95) * 1000,
+            "p99_ms": percentile(latencies, 0.99) * 1000,
+        }
+    lag = recorder.loop_lag
+    return {
+        "elapsed_seconds": elapsed,
+        "flows_completed": recorder.flows,
+        "throughput_rps": sum(e["requests"] for e in endpoints.values()) / elapsed,
+        "endpoints": endpoints,
+        "loop_lag_ms": {
+            "p50": percentile(lag, 0.50) * 1000,
+            "p99": percentile(lag, 0.99) * 1000,
+            "max": max(lag, default=0.0) * 1000,
+        },
+    }
+
+
+def print_report(report: dict) -> None:
+    print(
+        f"{report['elapsed_seconds']:.1f}s, {report['flows_completed']} flows, "
+        f"{report['throughput_rps']:.1f} req/s"
+    )
+    print(
+        f"\n{'endpoint':<16} {'requests':>9} {'errors':>7} {'req/s':>8} "
+        f"{'p50 ms':>9} {'p95 ms':>9} {'p99 ms':>9}"
+    )
+    for endpoint, stats in sorted(report["endpoints"].items()):
+        print(
+            f"{endpoint:<16} {stats['requests']:>9} {stats['errors']:>7} "
+            f"{stats['throughput_rps']:>8.1f} {stats['p50_ms']:>9.1f} "
+            f"{stats['p95_ms']:>9.1f} {stats['p99_ms']:>9.1f}"
+        )
+    lag = report["loop_lag_ms"]
+    print(
+        f"\nevent loop lag: p50 {lag['p50']:.1f} ms, p99 {lag['p99']:.1f} ms, "
+        f"max {lag['max']:.1f} ms"
+    )
+
+
+def make_client(args) -> httpx.AsyncClient:
+    """Client for a running server, or for the app in this process."""
+    timeout = httpx.Timeout(120.0)
+    if args.url:
+        return httpx.AsyncClient(base_url=args.url, timeout=timeout)
+
+    # Must be set before the app and its settings are imported
+    os.environ.setdefault("EMBEDDING_PROVIDER", "local")
+    os.environ.setdefault("LLM_PROVIDER", "local")
+    os.environ["LOG_LEVEL"] = os.environ.get("LOG_LEVEL") or "WARNING"
+    os.environ["LOCAL_EMBEDDING_LATENCY_MS"] = str(args.embed_latency_ms)
+    os.environ["LOCAL_GENERATION_LATENCY_MS"] = str(args.llm_latency_ms)
+    os.environ["LOCAL_LATENCY_JITTER"] = str(args.jitter)
+    os.environ["LOCAL_RATE_LIMIT_RATE"] = str(args.rate_limit_rate)
+    from app.main import app
+
+    return httpx.AsyncClient(
+        transport=httpx.ASGITransport(app=app),
+        base_url="http://loadtest",
+        timeout=timeout,
+    )
+
+
+async def run(args) -> dict:
+    recorder = Recorder()
+    rng = random.Random(args.seed)
+    async with make_client(args) as client:
+        monitor = asyncio.create_task(monitor_loop_lag(recorder.loop_lag))
+        users = [
+            asyncio.create_task(
+                virtual_user(
+                    recorder,
+                    client,
+                    args,
+                    random.Random(rng.random()),
+                    start_delay=args.ramp_up * i / args.users,
+                )
+            )
+            for i in range(args.users)
+        ]
+        started = time.perf_counter()
+        await asyncio.sleep(args.duration)
+        elapsed = time.perf_counter() - started
+        for task in users + [monitor]:
+            task.cancel()
+        await asyncio.gather(*users, monitor, return_exceptions=True)
+    return summarize(recorder, elapsed)
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--users", type=int, default=20)
+    parser.add_argument("--duration", type=float, default=30.0, help="Seconds")
+    parser.add_argument("--ramp-up", type=float, default=0.0, help="Seconds")
+    parser.add_argument(
+        "--think-time",
+        type=float,
+        default=1.0,
+        help="Mean seconds between chat questions",
+    )
+    parser.add_argument("--chats", type=int, default=3, help="Questions per session")
+    parser.add_argument(
+        "--doc-mix",
+        default="2k=6,8k=3,32k=1",
+        help="Document sizes in characters and their weights",
+    )
+    parser.add_argument("--jd-probability", type=float, default=0.5)
+    parser.add_argument("--embed-latency-ms", type=float, default=100.0)
+    parser.add_argument("--llm-latency-ms", type=float, default=1000.0)
+    parser.add_argument("--jitter", type=float, default=0.3)
+    parser.add_argument("--rate-limit-rate", type=float, default=0.0)
+    parser.add_argument("--seed", type=int, default=0)
+    parser.add_argument("--url", help="Target a running server instead")
+    parser.add_argument("--output", help="Write the report as JSON")
+    args = parser.parse_args()
+
+    report = asyncio.run(run(args))
+    print_report(report)
+    if args.output:
+        with open(args.output, "w") as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == "__main__":
+    main()
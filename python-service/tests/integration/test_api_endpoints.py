@@ -19,3 +19,125 @@ def test_health_endpoint():
     assert response.status_code == 200
     assert response.json()["status"] == "healthy"
 
+
+def test_request_id_is_echoed_or_generated():
+    """Responses carry the caller's X-Request-ID, or a generated one."""
+    echoed = client.get("/", headers={"X-Request-ID": "trace-123"})
+    assert echoed.headers["x-request-id"] == "trace-123"
+
+    generated = client.get("/")
+    assert len(generated.headers["x-request-id"]) == 32
+
+
+def test_metrics_endpoint():
+    """Test Prometheus metrics cover routes, sessions and pipeline stages."""
+    created = client.post("/api/session/create", json={"source_type": "resume"})
+    session_id = created.json()["session_id"]
+    client.get(f"/api/session/{session_id}")
+
+    response = client.get("/metrics")
+    assert response.status_code == 200
+    assert response.headers["content-type"].startswith("text/plain")
+    body = response.text
+    assert (
+        'http_request_duration_seconds_count{method="GET",'
+        'route="/api/session/{session_id}",status="200"}' in body
+    )
+    assert "sessions_active" in body
+    assert "# TYPE rag_stage_seconds histogram" in body
+    assert 'cache_hit_ratio{cache="answers"}' in body
+
+
+def test_embed_appends_documents(monkeypatch):
+    """Test embedding a second document keeps the first and is searchable."""
+    from app.api.routes import embed
+
+    class FakeEmbeddingService:
+        async def generate_embeddings_batch(self, texts):
+            return [[1.0, 0.0] if "python" in t else [0.0, 1.0] for t in texts]
+
+    monkeypatch.setattr(embed, "embedding_service", FakeEmbeddingService())
+
+    session_id = client.post(
+        "/api/session/create", json={"source_type": "resume"}
+    ).json()["session_id"]
+
+    def chunk_payload(text, source_type):
+        return client.post(
+            "/api/chunk/",
+            json={"text": text, "session_id": session_id, "source_type": source_type},
+        ).json()["chunks"]
+
+    resume = client.post(
+        "/api/embed/",
+        json={
+            "session_id": session_id,
+            "chunks": chunk_payload("python dev", "resume"),
+        },
+    )
+    jd = client.post(
+        "/api/embed/",
+        json={"session_id": session_id, "chunks": chunk_payload("go role", "jd")},
+    )
+    assert resume.json()["document"] == "resume"
+    assert jd.json()["document"] == "jd"
+
+    info = client.get(f"/api/session/{session_id}").json()
+    assert info["documents"] == ["resume", "jd"]
+
+    search = client.post(
+        "/api/search/",
+        json={
+            "session_id": session_id,
+            "query_embedding": [1.0, 0.0],
+            "documents": ["jd"],
+        },
+    ).json()
+    assert [r["document"] for r in search["results"]] == ["jd"]
+
+
+def test_search_accepts_base64_query_embedding():
+    """Test the binary query encoding matches the JSON float list."""
+    from app.core.session_manager import session_manager
+    from app.types.chunk import Chunk, ChunkMetadata
+    from app.types.session import SessionDocument
+    from app.utils.vector_codec import encode_vector
+
+    session_id = client.post(
+        "/api/session/create", json={"source_type": "resume"}
+    ).json()["session_id"]
+    session = session_manager.get_session(session_id)
+    chunks = [
+        Chunk(id=f"c-{i}", text=f"chunk {i}", index=i, metadata=ChunkMetadata())
+        for i in range(3)
+    ]
+    session.add_document(
+        SessionDocument(
+            name="resume",
+            source_type="resume",
+            chunks=chunks,
+            embeddings=[[1.0, 0.0], [0.0, 1.0], [0.6, 0.8]],
+        )
+    )
+    session_manager.save_session(session)
+
+    query = [0.1, 0.9]
+    as_list = client.post(
+        "/api/search/", json={"session_id": session_id, "query_embedding": query}
+    )
+    as_b64 = client.post(
+        "/api/search/",
+        json={"session_id": session_id, "query_embedding_b64": encode_vector(query)},
+    )
+    assert as_b64.status_code == 200
+    assert as_b64.json() == as_list.json()
+
+    both = client.post(
+        "/api/search/",
+        json={
+            "session_id": session_id,
+            "query_embedding": query,
+            "query_embedding_b64": encode_vector(query),
+        },
+    )
+    assert both.status_code == 422
@@ -0,0 +1,49 @@
+"""Integration tests for request profiling."""
+import pytest
+from fastapi.testclient import TestClient
+
+from app.core.profiler import request_profiler
+from app.main import app
+
+client = TestClient(app)
+TOKEN = {"X-Profile-Token": "secret"}
+
+
+@pytest.fixture
+def profiling(monkeypatch):
+    """Enable profiling with a known token."""
+    monkeypatch.setattr(request_profiler, "token", "secret")
+    monkeypatch.setattr(request_profiler, "sample_every", 0)
+    return request_profiler
+
+
+def test_profiling_is_inert_without_a_token():
+    """Test no profile is taken or served when profiling isn't configured."""
+    response = client.get("/health", headers=TOKEN)
+    assert "x-profile-id" not in response.headers
+    assert client.get("/admin/profile", headers=TOKEN).status_code == 404
+
+
+def test_token_header_profiles_the_request(profiling):
+    """Test an authorized request gets a retrievable profile."""
+    response = client.get("/health", headers=TOKEN)
+    profile_id = response.headers["x-profile-id"]
+
+    report = client.get(f"/admin/profiles/{profile_id}", headers=TOKEN)
+    assert report.status_code == 200
+    assert "function calls" in report.text
+
+    assert client.get(f"/admin/profiles/{profile_id}").status_code == 403
+    wrong = client.get("/health", headers={"X-Profile-Token": "guess"})
+    assert "x-profile-id" not in wrong.headers
+
+
+def test_sampled_requests_build_a_rolling_profile(profiling):
+    """Test 1-in-N sampling aggregates profiles without the header."""
+    profiling.sample_every = 1
+    client.get("/")
+    client.get("/health")
+
+    response = client.get("/admin/profile", headers=TOKEN)
+    assert response.status_code == 200
+    assert "sampled requests" in response.text
@@ -0,0 +1,104 @@
+"""Unit tests for per-route admission control."""
+import asyncio
+
+import httpx
+import pytest
+from starlette.responses import PlainTextResponse
+
+from app.api.middleware import AdmissionMiddleware
+from app.core.admission import AdmissionController, RouteLimiter, route_class
+from app.core.exceptions import AdmissionRejectedError
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+def test_routes_map_to_classes():
+    """Chat, ingestion and search routes are limited; others are not."""
+    assert route_class("/api/rag/chat") == "chat"
+    assert route_class("/api/chunk/") == "ingestion"
+    assert route_class("/api/embed/") == "ingestion"
+    assert route_class("/api/search/") == "search"
+    assert route_class("/api/session/create") is None
+    assert route_class("/health") is None
+
+
+@pytest.mark.asyncio
+async def test_full_queue_rejects_immediately_and_queued_requests_run_in_order():
+    """Beyond concurrency plus queue, requests fail fast with a retry hint."""
+    limiter = RouteLimiter("chat", max_concurrency=1, max_queue=2)
+    gate = asyncio.Event()
+    order = []
+
+    async def request(label):
+        async with limiter.admit():
+            order.append(label)
+            await gate.wait()
+
+    tasks = [asyncio.create_task(request(label)) for label in ("a", "b", "c")]
+    await settle()
+    assert limiter.stats()["in_flight"] == 1
+    assert limiter.stats()["queued"] == 2
+
+    with pytest.raises(AdmissionRejectedError) as rejected:
+        async with limiter.admit():
+            pass
+    assert rejected.value.retry_after >= 1
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    stats = limiter.stats()
+    assert order == ["a", "b", "c"]
+    assert (stats["in_flight"], stats["queued"], stats["admitted"]) == (0, 0, 3)
+    assert stats["rejected"] == {"queue_full": 1, "queue_timeout": 0}
+
+
+@pytest.mark.asyncio
+async def test_queued_request_is_rejected_after_timeout():
+    """A request waiting longer than the queue timeout gets a 503 instead."""
+    limiter = RouteLimiter("search", max_concurrency=1, max_queue=5, queue_timeout=0.02)
+    gate = asyncio.Event()
+
+    async def holder():
+        async with limiter.admit():
+            await gate.wait()
+
+    task = asyncio.create_task(holder())
+    await settle()
+    with pytest.raises(AdmissionRejectedError):
+        async with limiter.admit():
+            pass
+    assert limiter.stats()["queued"] == 0
+    assert limiter.stats()["rejected"]["queue_timeout"] == 1
+
+    gate.set()
+    await task
+    assert limiter.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_middleware_returns_503_with_retry_after():
+    """Over-capacity requests get a 503 before reaching the app."""
+    gate = asyncio.Event()
+
+    async def slow_app(scope, receive, send):
+        await gate.wait()
+        await PlainTextResponse("ok")(scope, receive, send)
+
+    controller = AdmissionController(
+        {"chat": RouteLimiter("chat", max_concurrency=1, max_queue=0)}
+    )
+    app = AdmissionMiddleware(slow_app, controller)
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://test") as client:
+        first = asyncio.create_task(client.post("/api/rag/chat"))
+        await settle()
+        rejected = await client.post("/api/rag/chat")
+        gate.set()
+        assert (await first).status_code == 200
+
+    assert rejected.status_code == 503
+    assert int(rejected.headers["retry-after"]) >= 1
+    assert "chat" in rejected.json()["detail"]
@@ -0,0 +1,52 @@
+"""Unit tests for incremental embedding."""
+import pytest
+
+from app.services.embedding.batch_processor import embed_chunks_incremental
+from app.types.chunk import Chunk, ChunkMetadata
+
+
+class FakeEmbeddingService:
+    """Embedding service that records the texts it was asked to embed."""
+
+    def __init__(self):
+        self.calls = []
+
+    async def generate_embeddings_batch(self, texts):
+        self.calls.append(list(texts))
+        return [[float(len(text)), 1.0] for text in texts]
+
+
+def make_chunk(text: str, index: int) -> Chunk:
+    return Chunk(id=f"id-{index}", text=text, index=index, metadata=ChunkMetadata())
+
+
+@pytest.mark.asyncio
+async def test_embed_chunks_incremental_only_embeds_changes():
+    """Test unchanged chunks reuse stored embeddings."""
+    service = FakeEmbeddingService()
+    old_chunks = [make_chunk("alpha", 0), make_chunk("beta", 1)]
+    old_embeddings = [[1.0, 0.0], [0.0, 1.0]]
+    new_chunks = [make_chunk("alpha", 0), make_chunk("beta!", 1)]
+
+    embeddings, reused = await embed_chunks_incremental(
+        new_chunks, old_chunks, old_embeddings, service
+    )
+
+    assert service.calls == [["beta!"]]
+    assert reused == 1
+    assert embeddings == [[1.0, 0.0], [5.0, 1.0]]
+
+
+@pytest.mark.asyncio
+async def test_embed_chunks_incremental_skips_call_when_unchanged():
+    """Test re-embedding identical chunks makes no API call."""
+    service = FakeEmbeddingService()
+    chunks = [make_chunk("alpha", 0)]
+
+    embeddings, reused = await embed_chunks_incremental(
+        chunks, chunks, [[1.0, 0.0]], service
+    )
+
+    assert service.calls == []
+    assert reused == 1
+    assert embeddings == [[1.0, 0.0]]
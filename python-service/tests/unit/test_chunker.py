@@ -20,3 +20,19 @@ def test_chunker_single_chunk():
     assert len(chunks) == 1
     assert chunks[0].text == text
 
+
+def test_chunker_ids_are_deterministic(sample_text):
+    """Test re-chunking identical text yields identical, unique IDs."""
+    chunker = ChunkerService()
+    first = chunker.chunk(sample_text, max_size=200, overlap=0.25)
+    second = chunker.chunk(sample_text, max_size=200, overlap=0.25)
+    assert [c.id for c in first] == [c.id for c in second]
+    assert len({c.id for c in first}) == len(first)
+
+
+def test_chunker_ids_change_with_content():
+    """Test a chunk ID changes only when its content changes."""
+    chunker = ChunkerService()
+    original = chunker.chunk("Python developer", max_size=1000)
+    edited = chunker.chunk("Python developer.", max_size=1000)
+    assert original[0].id != edited[0].id
@@ -0,0 +1,87 @@
+"""Unit tests for dependency circuit breakers."""
+import pytest
+
+from app.core.circuit_breaker import CLOSED, HALF_OPEN, OPEN, CircuitBreaker
+from app.core.exceptions import CircuitOpenError
+
+
+class FakeClock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def make_breaker(clock):
+    return CircuitBreaker(
+        "generation",
+        slow_call_seconds=2.0,
+        failure_rate_threshold=0.5,
+        window_size=4,
+        min_calls=4,
+        open_seconds=30.0,
+        clock=clock,
+    )
+
+
+async def fail(breaker):
+    with pytest.raises(RuntimeError):
+        async with breaker.call():
+            raise RuntimeError("503 from backend")
+
+
+async def succeed(breaker, clock=None, duration=0.0):
+    async with breaker.call():
+        if clock:
+            clock.now += duration
+
+
+@pytest.mark.asyncio
+async def test_opens_on_failure_rate_and_fails_fast():
+    """Half the window failing opens the circuit; calls are then rejected."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    await succeed(breaker)
+    await fail(breaker)
+    await succeed(breaker)
+    assert breaker.state == CLOSED
+    await fail(breaker)
+    assert breaker.state == OPEN
+
+    with pytest.raises(CircuitOpenError) as excinfo:
+        await succeed(breaker)
+    assert excinfo.value.retry_after == 30.0
+    assert breaker.stats()["rejected"] == 1
+
+
+@pytest.mark.asyncio
+async def test_slow_calls_count_as_failures():
+    """Calls over the latency threshold trip the breaker like errors."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(2):
+        await succeed(breaker)
+    for _ in range(2):
+        await succeed(breaker, clock, duration=5.0)
+    assert breaker.state == OPEN
+
+
+@pytest.mark.asyncio
+async def test_half_open_probe_closes_or_reopens():
+    """After the open period one probe decides the next state."""
+    clock = FakeClock()
+    breaker = make_breaker(clock)
+    for _ in range(4):
+        await fail(breaker)
+    clock.now += 31
+    assert breaker.state == HALF_OPEN
+
+    await fail(breaker)
+    assert breaker.state == OPEN
+    assert breaker.times_opened == 2
+
+    clock.now += 31
+    await succeed(breaker)
+    assert breaker.state == CLOSED
+    assert breaker.stats()["calls"] == 0
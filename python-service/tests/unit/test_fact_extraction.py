@@ -0,0 +1,108 @@
+"""Unit tests for rule-based fact extraction."""
+from app.services.extraction.facts import (
+    answer_from_facts,
+    classify_query,
+    extract_facts,
+)
+from app.types.chunk import Chunk, ChunkMetadata
+
+RESUME = (
+    "Jane Doe | jane.doe@example.com | +1 (555) 123-4567 | "
+    "linkedin.com/in/janedoe\n"
+    "Backend engineer. Acme Corp, Jan 2019 - 2023. Beta Inc 2015 - 2018.\n"
+    "Skills: Python, SQL, Docker, Python, C++"
+)
+
+
+def facts():
+    return extract_facts(
+        [Chunk(id="chunk-a", text=RESUME, index=0, metadata=ChunkMetadata())]
+    )
+
+
+def test_extract_contact_details():
+    """Test contact details are extracted and year ranges aren't phones."""
+    by_kind = {}
+    for fact in facts():
+        by_kind.setdefault(fact.kind, []).append(fact.value)
+    assert by_kind["email"] == ["jane.doe@example.com"]
+    assert by_kind["phone"] == ["+1 (555) 123-4567"]
+    assert by_kind["linkedin"] == ["linkedin.com/in/janedoe"]
+
+
+def test_answers_simple_questions_with_sources():
+    """Test factual questions are answered from facts with their chunk."""
+    email = answer_from_facts("What's their email?", facts())
+    assert email.answer == "Email: jane.doe@example.com"
+    assert email.sources == ["chunk-a"]
+
+    skills = answer_from_facts("list skills", facts())
+    assert skills.answer.startswith("Skills mentioned: Python, ")
+
+    experience = answer_from_facts("How many years of experience?", facts())
+    assert "7 years" in experience.answer
+
+
+def test_reasoning_questions_fall_back():
+    """Test judgement questions and unknown facts are left to the LLM."""
+    assert classify_query("Are their skills a good fit for the role?") is None
+    assert answer_from_facts("Summarize the candidate", facts()) is None
+    assert answer_from_facts("What is their GitHub?", facts()) is None
+
+
+def test_ambiguous_skill_words_need_technical_context():
+    """Test everyday words aren't reported as skills outside tech context."""
+    prose = (
+        "I excel at client work. Joined in spring 2020. Go to market plans "
+        "kept the rest of the team agile and swift."
+    )
+    chunk = Chunk(id="chunk-p", text=prose, index=0, metadata=ChunkMetadata())
+    assert [f for f in extract_facts([chunk]) if f.kind == "skill"] == []
+
+    tech = "Built REST APIs in Go and Python. Spring Boot services."
+    chunk = Chunk(id="chunk-t", text=tech, index=0, metadata=ChunkMetadata())
+    skills = {f.value for f in extract_facts([chunk]) if f.kind == "skill"}
+    assert skills == {"REST", "Go", "Python"}
+
+    listed = Chunk(
+        id="chunk-s",
+        text="Swift, Excel",
+        index=0,
+        metadata=ChunkMetadata(section="Skills"),
+    )
+    assert {f.value for f in extract_facts([listed])} == {"Swift", "Excel"}
+
+
+def test_evaluative_questions_go_to_the_llm():
+    """Test superlative and judgement questions aren't answered from facts."""
+    for question in (
+        "what are their strongest skills?",
+        "What are the top skills?",
+        "Which skills are they most proficient in?",
+        "What is their main technology stack?",
+    ):
+        assert classify_query(question) is None, question
+        assert answer_from_facts(question, facts()) is None, question
+
+
+def test_qualified_and_yes_no_questions_go_to_the_llm():
+    """Test questions narrowed to a skill, employer or person aren't answered."""
+    chunk = Chunk(
+        id="chunk-q",
+        text="jane@example.com. 8 years of experience. Python (2 years)",
+        index=0,
+        metadata=ChunkMetadata(),
+    )
+    qualified = extract_facts([chunk])
+    for question in (
+        "How many years of Python experience?",
+        "How many years of experience with Python do they have?",
+        "Does the candidate know Kubernetes skills?",
+        "What is the phone number of their previous manager?",
+        "What was their email at Google?",
+    ):
+        assert classify_query(question) is None, question
+        assert answer_from_facts(question, qualified) is None, question
+
+    assert answer_from_facts("How many years of experience?", qualified) is not None
+    assert classify_query("What is their LinkedIn?") == "linkedin"
@@ -0,0 +1,49 @@
+"""Import-time budget for the service entry point."""
+import json
+import os
+import subprocess
+import sys
+
+import pytest
+
+# Generous enough for slow CI machines; importing the Gemini SDK alone
+# adds about half a second
+IMPORT_BUDGET_SECONDS = 1.5
+# Loaded on first use, never while importing app.main
+DEFERRED_MODULES = ("google.generativeai", "PyPDF2", "docx")
+
+_PROBE = """
+import json, sys, time
+started = time.perf_counter()
+import app.main
+elapsed = time.perf_counter() - started
+print(json.dumps({"seconds": elapsed, "modules": sorted(sys.modules)}))
+"""
+
+
+def import_app_main() -> dict:
+    env = {**os.environ, "GEMINI_API_KEY": os.environ.get("GEMINI_API_KEY") or "test"}
+    output = subprocess.run(
+        [sys.executable, "-c", _PROBE],
+        capture_output=True,
+        text=True,
+        check=True,
+        env=env,
+    ).stdout
+    return json.loads(output.strip().splitlines()[-1])
+
+
+@pytest.fixture(scope="module")
+def imports():
+    # Three runs, so one slow run on a busy machine doesn't fail the budget
+    return [import_app_main() for _ in range(3)]
+
+
+def test_heavy_dependencies_are_not_imported_eagerly(imports):
+    """Importing the app leaves the Gemini SDK and document parsers unloaded."""
+    assert set(imports[0]["modules"]).isdisjoint(DEFERRED_MODULES)
+
+
+def test_import_time_within_budget(imports):
+    """Importing app.main stays within the cold-start budget."""
+    assert min(run["seconds"] for run in imports) < IMPORT_BUDGET_SECONDS
@@ -0,0 +1,87 @@
+"""Unit tests for LLM deadlines and hedged generation."""
+import asyncio
+import time
+
+import pytest
+
+from app.core.config import settings
+from app.core.exceptions import DeadlineExceededError
+from app.llm import scheduled
+from app.llm.gemini_client import GeminiClient
+from app.llm.hedging import MIN_LATENCY_SAMPLES, HedgePolicy
+
+
+class FakeModel:
+    """Generative model that answers after a fixed delay."""
+
+    def __init__(self, name: str, delay: float):
+        self._model_name = name
+        self.delay = delay
+        self.calls = 0
+
+    async def generate_content_async(self, prompt):
+        self.calls += 1
+        await asyncio.sleep(self.delay)
+        return type("Response", (), {"text": f"from {self._model_name}"})()
+
+
+def make_client(primary_delay: float, hedge_delay: float) -> GeminiClient:
+    client = GeminiClient.__new__(GeminiClient)
+    client.model_name = "gemini-2.5-flash"
+    client.api_key = "test"
+    client.model = FakeModel("gemini-2.5-flash", primary_delay)
+    client.hedge_model = FakeModel("fast-fallback", hedge_delay)
+    return client
+
+
+@pytest.fixture
+def policy(monkeypatch):
+    """Enable hedging with a short fixed delay and no rate limit."""
+    policy = HedgePolicy(delay_seconds=0.02, max_rate=1.0)
+    monkeypatch.setattr(scheduled, "hedge_policy", policy)
+    monkeypatch.setattr(settings, "llm_hedging_enabled", True)
+    return policy
+
+
+@pytest.mark.asyncio
+async def test_slow_generation_is_hedged_and_hedge_wins(policy):
+    """A generation still running after the delay races a duplicate."""
+    client = make_client(primary_delay=1.0, hedge_delay=0.0)
+
+    assert await client.generate("prompt") == "from fast-fallback"
+    assert policy.stats()["hedges_fired"] == 1
+    assert policy.stats()["hedges_won"] == 1
+
+
+@pytest.mark.asyncio
+async def test_hedge_rate_is_capped(policy):
+    """Requests earn hedges at max_rate, so not every slow call is hedged."""
+    policy.max_rate = 0.5
+    client = make_client(primary_delay=0.05, hedge_delay=0.0)
+
+    assert await client.generate("first") == "from gemini-2.5-flash"
+    assert await client.generate("second") == "from fast-fallback"
+    assert policy.hedges_fired == 1
+    assert client.model.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_deadline_bounds_generation():
+    """A generation past its deadline is abandoned."""
+    client = make_client(primary_delay=1.0, hedge_delay=1.0)
+
+    with pytest.raises(DeadlineExceededError):
+        await client.generate("prompt", deadline=time.monotonic() + 0.02)
+
+
+def test_hedge_delay_tracks_observed_p95():
+    """With no fixed delay, hedging waits for enough latency samples."""
+    policy = HedgePolicy(delay_seconds=0, max_rate=0.1)
+    assert policy.hedge_delay() is None
+
+    for i in range(MIN_LATENCY_SAMPLES * 5):
+        policy.record_latency(1.0 if i % 10 else 9.0)
+    assert policy.hedge_delay() == 9.0
+    for _ in range(MIN_LATENCY_SAMPLES * 5):
+        policy.record_latency(1.0)
+    assert policy.hedge_delay() == 1.0
@@ -0,0 +1,116 @@
+"""Unit tests for the offline embedding and generation providers."""
+import time
+
+import numpy as np
+import pytest
+from pydantic import ValidationError
+
+from app.core.config import Settings
+from app.core.exceptions import EmbeddingGenerationError
+from app.core.fault_injection import FaultInjector, InjectedFaultError
+from app.llm.factory import create_llm_client
+from app.llm.local import LocalGenerativeModel, LocalLLMClient
+from app.services.embedding.generator import EmbeddingService
+from app.services.embedding.providers import LocalEmbeddingProvider, hashed_embedding
+from app.services.rag.prompt_builder import build_prompt
+from app.types.chunk import Chunk, ChunkMetadata
+
+
+def test_hashed_embeddings_are_deterministic_and_similarity_preserving():
+    """Same text gives the same unit vector; shared vocabulary scores higher."""
+    query = np.array(hashed_embedding("kubernetes deployments", 256))
+    related = np.array(hashed_embedding("Managed Kubernetes deployment pipelines", 256))
+    unrelated = np.array(hashed_embedding("Fluent in Spanish and French", 256))
+
+    assert query.tolist() == hashed_embedding("kubernetes deployments", 256)
+    assert np.linalg.norm(query) == pytest.approx(1.0)
+    assert query @ related > query @ unrelated
+
+
+@pytest.mark.asyncio
+async def test_template_generator_cites_best_matching_snippet():
+    """The local model answers from the snippet closest to the question."""
+    chunks = [
+        Chunk(
+            id="a",
+            text="Speaks Spanish. Lived in Madrid.",
+            index=0,
+            metadata=ChunkMetadata(),
+        ),
+        Chunk(
+            id="b",
+            text="Ran Kafka clusters at scale. Also Redis.",
+            index=1,
+            metadata=ChunkMetadata(),
+        ),
+    ]
+    prompt = build_prompt("Have they run Kafka clusters?", chunks)
+    model = LocalGenerativeModel(faults=FaultInjector(error_rate=0, rate_limit_rate=0))
+
+    response = await model.generate_content_async(prompt)
+
+    assert response.text == "Ran Kafka clusters at scale. [chunk-1]"
+
+
+@pytest.mark.asyncio
+async def test_llm_client_factory_selects_local_backend():
+    """The factory builds a local client that answers through the scheduler."""
+    client = create_llm_client("local")
+    assert isinstance(client, LocalLLMClient)
+    client.model = LocalGenerativeModel(
+        faults=FaultInjector(error_rate=0, rate_limit_rate=0)
+    )
+
+    answer = await client.generate(
+        build_prompt(
+            "Kafka?",
+            [Chunk(id="k", text="Ran Kafka.", index=0, metadata=ChunkMetadata())],
+        )
+    )
+
+    assert answer == "Ran Kafka. [chunk-0]"
+    with pytest.raises(ValueError):
+        create_llm_client("unknown")
+
+
+@pytest.mark.asyncio
+async def test_injected_rate_limit_surfaces_as_quota_error():
+    """An injected 429 is handled like a Gemini quota error."""
+    faults = FaultInjector(error_rate=0, rate_limit_rate=1.0)
+    service = EmbeddingService(provider=LocalEmbeddingProvider(faults=faults))
+
+    with pytest.raises(EmbeddingGenerationError, match="quota exceeded"):
+        await service.generate_embedding("hello")
+    assert faults.stats()["rate_limited"] == 1
+
+
+@pytest.mark.asyncio
+async def test_injected_latency_and_seeded_failures():
+    """Calls are delayed, and a seed makes the failure sequence reproducible."""
+    slow = FaultInjector(latency_ms=30, jitter=0, error_rate=0, rate_limit_rate=0)
+    started = time.monotonic()
+    await slow.apply()
+    assert time.monotonic() - started >= 0.025
+
+    async def outcomes(seed):
+        faults = FaultInjector(error_rate=0.5, rate_limit_rate=0, seed=seed)
+        results = []
+        for _ in range(20):
+            try:
+                await faults.apply()
+                results.append(True)
+            except InjectedFaultError:
+                results.append(False)
+        return results
+
+    first = await outcomes(seed=7)
+    assert first == await outcomes(seed=7)
+    assert 0 < first.count(False) < 20
+
+
+def test_api_key_only_required_for_gemini_providers():
+    """Fully local configurations start without a Gemini API key."""
+    Settings(gemini_api_key="", embedding_provider="local", llm_provider="local")
+
+    with pytest.raises(ValidationError):
+        Settings(gemini_api_key="", embedding_provider="local", llm_provider="gemini")
@@ -0,0 +1,84 @@
+"""Unit tests for structured logging."""
+import io
+import json
+import logging
+from logging.handlers import QueueHandler
+
+from app.utils.logger import (
+    JsonFormatter,
+    RequestIdFilter,
+    get_logger,
+    parse_log_levels,
+    request_id_var,
+    setup_logging,
+    shutdown_logging,
+)
+
+
+def make_record(message: str, **extra) -> logging.LogRecord:
+    record = logging.LogRecord(
+        "resumelens.test", logging.INFO, __file__, 1, message, (), None
+    )
+    for key, value in extra.items():
+        setattr(record, key, value)
+    return record
+
+
+def test_json_formatter_includes_request_id_and_extra_fields():
+    """Records carry the current request ID and any `extra` fields."""
+    record = make_record("answered", session_id="abc", top_k=5)
+    token = request_id_var.set("req-1")
+    try:
+        RequestIdFilter().filter(record)
+    finally:
+        request_id_var.reset(token)
+
+    entry = json.loads(JsonFormatter().format(record))
+
+    assert entry["message"] == "answered"
+    assert entry["level"] == "INFO"
+    assert entry["logger"] == "resumelens.test"
+    assert entry["request_id"] == "req-1"
+    assert entry["session_id"] == "abc"
+    assert entry["top_k"] == 5
+
+
+def test_json_formatter_omits_missing_request_id():
+    """Records logged outside a request have no request_id field."""
+    record = make_record("startup")
+    RequestIdFilter().filter(record)
+
+    assert "request_id" not in json.loads(JsonFormatter().format(record))
+
+
+def test_parse_log_levels():
+    """Per-logger levels are parsed and malformed entries are skipped."""
+    levels = parse_log_levels(
+        "resumelens.llm=debug, uvicorn.access=WARNING,bad,app.x=VERBOSE,"
+    )
+
+    assert levels == {
+        "resumelens.llm": logging.DEBUG,
+        "uvicorn.access": logging.WARNING,
+    }
+
+
+def test_module_loggers_share_the_service_root():
+    """Module loggers sit under the service logger so levels can target them."""
+    assert get_logger("app.llm.gemini_client").name == "resumelens.llm.gemini_client"
+
+
+def test_records_after_shutdown_are_written_directly():
+    """After shutdown the root logger no longer queues records nobody reads."""
+    setup_logging()
+    try:
+        shutdown_logging()
+        root = logging.getLogger()
+        assert not any(isinstance(h, QueueHandler) for h in root.handlers)
+
+        stream = io.StringIO()
+        root.handlers[0].setStream(stream)
+        get_logger("app.test").warning("after shutdown")
+        assert "after shutdown" in stream.getvalue()
+    finally:
+        setup_logging()
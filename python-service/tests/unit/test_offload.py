@@ -0,0 +1,50 @@
+"""Unit tests for CPU offloading and event-loop lag monitoring."""
+import asyncio
+import threading
+import time
+
+import pytest
+
+from app.core.loop_monitor import LoopLagMonitor
+from app.core.offload import run_cpu_bound
+from app.utils.logger import request_id_var
+
+
+def current_thread_and_request():
+    return threading.get_ident(), request_id_var.get()
+
+
+@pytest.mark.asyncio
+async def test_small_work_runs_inline_and_large_work_is_offloaded():
+    """Inputs below the threshold stay on the loop thread; larger ones move."""
+    token = request_id_var.set("req-7")
+    try:
+        inline = await run_cpu_bound(
+            "test", current_thread_and_request, size=10, threshold=100
+        )
+        offloaded = await run_cpu_bound(
+            "test", current_thread_and_request, size=100, threshold=100
+        )
+    finally:
+        request_id_var.reset(token)
+
+    assert inline == (threading.get_ident(), "req-7")
+    assert offloaded[0] != threading.get_ident()
+    # Context vars follow the work, so worker logs keep the request ID
+    assert offloaded[1] == "req-7"
+
+
+@pytest.mark.asyncio
+async def test_loop_lag_monitor_detects_blocking_call():
+    """A synchronous call holding the loop shows up as lag."""
+    monitor = LoopLagMonitor(interval_ms=10)
+    task = asyncio.create_task(monitor.run())
+    await asyncio.sleep(0.03)
+
+    time.sleep(0.1)  # Block the event loop
+    await asyncio.sleep(0.03)
+    task.cancel()
+
+    stats = monitor.stats()
+    assert stats["samples"] >= 2
+    assert stats["lag_max_ms"] >= 80
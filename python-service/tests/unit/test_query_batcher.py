@@ -0,0 +1,70 @@
+"""Unit tests for query-embedding micro-batching."""
+import asyncio
+
+import pytest
+
+from app.core.exceptions import EmbeddingGenerationError
+from app.services.embedding.query_batcher import QueryEmbeddingBatcher
+
+
+class FakeEmbeddingService:
+    """Records each batched call and embeds text as its length."""
+
+    def __init__(self, error: Exception | None = None):
+        self.calls = []
+        self.error = error
+
+    async def embed_texts(self, texts):
+        self.calls.append(list(texts))
+        if self.error:
+            raise self.error
+        return [[float(len(text))] for text in texts]
+
+
+@pytest.mark.asyncio
+async def test_concurrent_queries_share_one_call():
+    """Queries inside the window go out together and get their own vectors."""
+    service = FakeEmbeddingService()
+    batcher = QueryEmbeddingBatcher(service, window_ms=5, max_batch_size=10)
+
+    results = await asyncio.gather(
+        batcher.embed("a"),
+        batcher.embed("bb"),
+        batcher.embed("a"),
+        batcher.embed("ccc"),
+    )
+
+    assert results == [[1.0], [2.0], [1.0], [3.0]]
+    assert service.calls == [["a", "bb", "ccc"]]
+    assert batcher.stats()["mean_batch_size"] == 4
+
+
+@pytest.mark.asyncio
+async def test_full_batch_is_sent_before_the_window_closes():
+    """Reaching the size cap flushes immediately; the rest wait for the window."""
+    service = FakeEmbeddingService()
+    batcher = QueryEmbeddingBatcher(service, window_ms=10_000, max_batch_size=2)
+
+    first = await asyncio.wait_for(
+        asyncio.gather(batcher.embed("a"), batcher.embed("bb")), timeout=1
+    )
+    assert first == [[1.0], [2.0]]
+
+    late = asyncio.create_task(batcher.embed("ccc"))
+    await asyncio.sleep(0.01)
+    assert not late.done()
+    late.cancel()
+
+
+@pytest.mark.asyncio
+async def test_batch_errors_reach_every_caller():
+    """A failed batched call fails each waiting query."""
+    service = FakeEmbeddingService(error=EmbeddingGenerationError("quota"))
+    batcher = QueryEmbeddingBatcher(service, window_ms=1, max_batch_size=10)
+
+    results = await asyncio.gather(
+        batcher.embed("a"), batcher.embed("b"), return_exceptions=True
+    )
+
+    assert all(isinstance(r, EmbeddingGenerationError) for r in results)
+    assert len(service.calls) == 1
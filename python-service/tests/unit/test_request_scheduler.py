@@ -0,0 +1,106 @@
+"""Unit tests for the Gemini request scheduler."""
+import asyncio
+
+import pytest
+
+from app.core.request_scheduler import Priority, RequestScheduler, request_class
+
+
+async def queue_request(scheduler, order, label, priority=None, session_id=None):
+    """Take a slot, record the grant and release on the next tick."""
+    async with scheduler.slot(priority, session_id):
+        order.append(label)
+        await asyncio.sleep(0)
+
+
+async def settle():
+    for _ in range(5):
+        await asyncio.sleep(0)
+
+
+@pytest.mark.asyncio
+async def test_slots_are_granted_by_priority():
+    """Queued interactive calls run before ingestion, ingestion before warm-up."""
+    scheduler = RequestScheduler(max_concurrency=1)
+    order = []
+    gate = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot(Priority.INGESTION):
+            await gate.wait()
+
+    tasks = [asyncio.create_task(holder())]
+    await settle()
+    for label, priority in [
+        ("warmup", Priority.WARMUP),
+        ("ingestion", Priority.INGESTION),
+        ("interactive", Priority.INTERACTIVE),
+    ]:
+        tasks.append(
+            asyncio.create_task(queue_request(scheduler, order, label, priority))
+        )
+    await settle()
+    assert scheduler.stats()["in_flight"] == 1
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert order == ["interactive", "ingestion", "warmup"]
+    assert scheduler.stats()["in_flight"] == 0
+
+
+@pytest.mark.asyncio
+async def test_sessions_take_turns_within_a_class():
+    """A session with many queued calls doesn't block another session."""
+    scheduler = RequestScheduler(max_concurrency=1)
+    order = []
+    gate = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot(Priority.INGESTION, "big"):
+            await gate.wait()
+
+    tasks = [asyncio.create_task(holder())]
+    await settle()
+
+    async def tagged(label, session_id):
+        with request_class(Priority.INGESTION, session_id):
+            await queue_request(scheduler, order, label)
+
+    for label in ["big-1", "big-2", "big-3"]:
+        tasks.append(asyncio.create_task(tagged(label, "big")))
+    await settle()
+    tasks.append(asyncio.create_task(tagged("small-1", "small")))
+    await settle()
+
+    gate.set()
+    await asyncio.gather(*tasks)
+    assert order == ["big-1", "small-1", "big-2", "big-3"]
+    assert scheduler.stats()["classes"]["ingestion"]["granted"] == 5
+
+
+@pytest.mark.asyncio
+async def test_cancelled_waiter_does_not_leak_a_slot():
+    """Cancelling a queued call leaves the slot free for others."""
+    scheduler = RequestScheduler(max_concurrency=1)
+    order = []
+    gate = asyncio.Event()
+
+    async def holder():
+        async with scheduler.slot(Priority.INTERACTIVE):
+            await gate.wait()
+
+    held = asyncio.create_task(holder())
+    await settle()
+    cancelled = asyncio.create_task(
+        queue_request(scheduler, order, "cancelled", Priority.WARMUP)
+    )
+    await settle()
+    cancelled.cancel()
+    await settle()
+    assert scheduler.stats()["classes"]["warmup"]["queued"] == 0
+
+    gate.set()
+    await held
+    await queue_request(scheduler, order, "next", Priority.WARMUP)
+    assert order == ["next"]
+    assert scheduler.stats()["in_flight"] == 0
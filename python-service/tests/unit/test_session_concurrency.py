@@ -0,0 +1,113 @@
+"""Concurrency stress tests for sessions and the session manager."""
+import random
+import threading
+
+from app.core.exceptions import SessionNotFoundError
+from app.core.session_manager import SessionManager
+from app.services.vector_search.searcher import VectorSearchService
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.session import SessionDocument
+
+THREADS = 8
+ITERATIONS = 300
+
+
+def make_document(name: str, rows: int) -> SessionDocument:
+    chunks = [
+        Chunk(
+            id=f"{name}-{rows}-{i}", text=f"text {i}", index=i, metadata=ChunkMetadata()
+        )
+        for i in range(rows)
+    ]
+    embeddings = [[random.random() for _ in range(8)] for _ in range(rows)]
+    return SessionDocument(
+        name=name, source_type="resume", chunks=chunks, embeddings=embeddings
+    )
+
+
+def start_thread(target, errors: list) -> threading.Thread:
+    """Start a thread that records any exception raised by target."""
+
+    def run() -> None:
+        try:
+            target()
+        except Exception as e:  # pragma: no cover - asserted by callers
+            errors.append(e)
+
+    thread = threading.Thread(target=run)
+    thread.start()
+    return thread
+
+
+def test_readers_never_see_mismatched_documents():
+    """Test searches during concurrent document swaps always see valid pairs."""
+    manager = SessionManager(ttl_minutes=5)
+    session = manager.create_session("stress-search", "resume")
+    session.add_document(make_document("resume", 5))
+    search = VectorSearchService()
+    stop = threading.Event()
+    errors: list = []
+
+    def writer() -> None:
+        for _ in range(ITERATIONS):
+            name = random.choice(["resume", "jd"])
+            session.add_document(make_document(name, random.randint(1, 40)))
+            manager.save_session(session)
+
+    def reader() -> None:
+        while not stop.is_set():
+            results = search.search_documents(
+                [random.random() for _ in range(8)],
+                session.select_documents(),
+                top_k=5,
+            )
+            assert all(r.chunk_id.startswith(r.document) for r in results)
+
+    writers = [start_thread(writer, errors) for _ in range(THREADS // 2)]
+    readers = [start_thread(reader, errors) for _ in range(THREADS // 2)]
+    for thread in writers:
+        thread.join()
+    stop.set()
+    for thread in readers:
+        thread.join()
+
+    assert errors == []
+    assert set(session.documents) == {"resume", "jd"}
+
+
+def test_manager_bookkeeping_consistent_under_contention():
+    """Test concurrent create/get/save/delete keep counts and bytes exact."""
+    manager = SessionManager(ttl_minutes=5, lock_stripes=4)
+    errors: list = []
+
+    def worker(n: int) -> None:
+        for i in range(ITERATIONS):
+            sid = f"stress-{n}-{i % 10}"
+            action = random.random()
+            if action < 0.4:
+                manager.create_session(sid, "resume")
+            elif action < 0.7:
+                session = manager.get_session(sid)
+                if session is not None:
+                    session.add_document(make_document("resume", 3))
+                    try:
+                        manager.save_session(session)
+                    except SessionNotFoundError:
+                        pass  # Deleted by another thread in between
+            else:
+                manager.delete_session(sid)
+
+    threads = [start_thread(lambda n=n: worker(n), errors) for n in range(THREADS)]
+    for thread in threads:
+        thread.join()
+    assert errors == []
+
+    live = [
+        manager.get_session(f"stress-{n}-{i}")
+        for n in range(THREADS)
+        for i in range(10)
+    ]
+    live = [s for s in live if s is not None]
+    stats = manager.stats()
+    assert stats["active_sessions"] == len(live)
+    assert stats["memory_bytes"] == sum(s.memory_bytes() for s in live)
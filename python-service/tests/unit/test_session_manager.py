@@ -2,7 +2,8 @@
 import pytest
 from datetime import datetime, timedelta
 from app.core.session_manager import SessionManager
-from app.types.session import Session
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.session import Session, SessionDocument
 
 
 def test_create_session(session_manager):
@@ -28,3 +29,95 @@ def test_delete_session(session_manager):
     assert result is True
     assert session_manager.get_session("test-session-3") is None
 
+
+def make_document(name: str, rows: int) -> SessionDocument:
+    chunks = [
+        Chunk(id=f"{name}-{i}", text="x" * 100, index=i, metadata=ChunkMetadata())
+        for i in range(rows)
+    ]
+    return SessionDocument(
+        name=name, source_type="resume", chunks=chunks, embeddings=[[0.0] * 768] * rows
+    )
+
+
+def test_session_memory_accounting():
+    """Test saved sessions are measured by their chunk and embedding bytes."""
+    manager = SessionManager(ttl_minutes=5)
+    session = manager.create_session("test-session-4", "resume")
+    empty_bytes = manager.stats()["memory_bytes"]
+
+    session.add_document(make_document("resume", 10))
+    manager.save_session(session)
+
+    stats = manager.stats()
+    assert stats["active_sessions"] == 1
+    assert stats["memory_bytes"] - empty_bytes >= 10 * 768 * 4
+
+
+def test_memory_budget_evicts_least_recently_used():
+    """Test exceeding the memory budget evicts the least recently used session."""
+    budget = 2 * make_document("resume", 10).nbytes + 10_000
+    manager = SessionManager(ttl_minutes=5, memory_budget_bytes=budget)
+    for sid in ("lru-a", "lru-b", "lru-c"):
+        manager.create_session(sid, "resume")
+
+    for sid in ("lru-a", "lru-b"):
+        session = manager.get_session(sid)
+        session.add_document(make_document("resume", 10))
+        manager.save_session(session)
+
+    # Touch lru-a so lru-b becomes the least recently used loaded session
+    manager.get_session("lru-a")
+    session = manager.get_session("lru-c")
+    session.add_document(make_document("resume", 10))
+    manager.save_session(session)
+
+    assert manager.get_session("lru-c") is not None
+    assert manager.get_session("lru-a") is not None
+    assert manager.get_session("lru-b") is None
+    assert manager.stats()["evictions"] >= 1
+    assert manager.stats()["memory_bytes"] <= budget
+
+
+def test_purge_expired_removes_due_sessions():
+    """Test purging drops sessions whose deadline has passed."""
+    manager = SessionManager(ttl_minutes=5)
+    manager.create_session("ttl-a", "resume")
+    manager.create_session("ttl-b", "resume")
+
+    assert manager.purge_expired() == 0
+    later = (datetime.now() + timedelta(minutes=6)).timestamp()
+    assert manager.purge_expired(now=later) == 2
+    assert manager.stats()["active_sessions"] == 0
+    assert manager.stats()["expirations"] == 2
+
+
+def test_sliding_ttl_extends_on_access():
+    """Test access pushes the deadline out."""
+    manager = SessionManager(ttl_minutes=5, sliding_ttl=True)
+    session = manager.create_session("ttl-slide", "resume")
+    session.expires_at = datetime.now() + timedelta(minutes=1)
+
+    refreshed = manager.get_session("ttl-slide")
+    assert refreshed.expires_at > datetime.now() + timedelta(minutes=4)
+
+
+def test_purge_keeps_sessions_whose_deadline_moved(session_manager):
+    """Test a stale heap entry is re-queued rather than expiring the session."""
+    session = session_manager.create_session("ttl-moved", "resume")
+    session.expires_at = datetime.now() + timedelta(minutes=30)
+
+    past_original = (datetime.now() + timedelta(minutes=6)).timestamp()
+    assert session_manager.purge_expired(now=past_original) == 0
+    assert session_manager.get_session("ttl-moved") is session
+
+    past_moved = (datetime.now() + timedelta(minutes=31)).timestamp()
+    assert session_manager.purge_expired(now=past_moved) == 1
+
+
+def test_fixed_ttl_does_not_extend_on_access(session_manager):
+    """Test access leaves the deadline alone without sliding TTL."""
+    session = session_manager.create_session("ttl-fixed", "resume")
+    expires_at = session.expires_at
+    session_manager.get_session("ttl-fixed")
+    assert session.expires_at == expires_at
@@ -0,0 +1,63 @@
+"""Unit tests for session snapshots."""
+from datetime import datetime, timedelta
+
+import pytest
+from cryptography.fernet import Fernet
+
+from app.core.session_manager import SessionManager
+from app.core.session_snapshot import read_snapshot, write_snapshot
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.session import SessionDocument
+
+
+def populate(manager: SessionManager) -> None:
+    session = manager.create_session("snap-live", "resume")
+    chunk = Chunk(id="c-0", text="Python, SQL", index=0, metadata=ChunkMetadata())
+    session.add_document(
+        SessionDocument(
+            name="resume", source_type="resume", chunks=[chunk], embeddings=[[1.0, 0.0]]
+        )
+    )
+    manager.save_session(session)
+
+
+def test_snapshot_restore_preserves_sessions_and_ttl(tmp_path):
+    """Test a restored session keeps its documents and original expiry."""
+    path = str(tmp_path / "sessions.snap")
+    source = SessionManager(ttl_minutes=5)
+    populate(source)
+    expires_at = source.get_session("snap-live").expires_at
+    assert source.snapshot(path) == 1
+
+    target = SessionManager(ttl_minutes=5)
+    assert target.restore(path) == 1
+    restored = target.get_session("snap-live")
+    assert restored.expires_at == expires_at
+    assert [c.text for c in restored.chunks] == ["Python, SQL"]
+
+
+def test_restore_skips_expired_sessions(tmp_path):
+    """Test sessions that expired while the service was down are dropped."""
+    path = str(tmp_path / "sessions.snap")
+    source = SessionManager(ttl_minutes=5)
+    populate(source)
+    session = source.get_session("snap-live")
+    session.expires_at = datetime.now() - timedelta(minutes=1)
+    write_snapshot([session], path)
+
+    assert SessionManager(ttl_minutes=5).restore(path) == 0
+
+
+def test_encrypted_snapshot_requires_key(tmp_path):
+    """Test encrypted snapshots round-trip with the key and fail without it."""
+    path = str(tmp_path / "sessions.snap")
+    key = Fernet.generate_key().decode()
+    source = SessionManager(ttl_minutes=5)
+    populate(source)
+    source.snapshot(path, key)
+
+    with open(path, "rb") as f:
+        assert b"Python, SQL" not in f.read()
+    assert [s.session_id for s in read_snapshot(path, key)] == ["snap-live"]
+    with pytest.raises(ValueError):
+        read_snapshot(path)
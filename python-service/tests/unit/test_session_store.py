@@ -0,0 +1,142 @@
+"""Unit tests for session storage backends and the session codec."""
+import time
+
+import pytest
+
+from app.core.exceptions import SessionConflictError
+from app.core.session_codec import decode_session, encode_session
+from app.core.session_manager import SessionManager
+from app.core.session_store import InMemorySessionBackend, SQLiteSessionBackend
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.session import SessionDocument
+
+
+def make_document(name: str) -> SessionDocument:
+    chunks = [
+        Chunk(
+            id=f"{name}-{i}",
+            text=f"{name} text {i}",
+            index=i,
+            metadata=ChunkMetadata(section="Skills", source_type="resume"),
+        )
+        for i in range(3)
+    ]
+    return SessionDocument(
+        name=name,
+        source_type="resume",
+        chunks=chunks,
+        embeddings=[[float(i), 1.0, 2.0] for i in range(3)],
+    )
+
+
+@pytest.fixture(params=["memory", "sqlite"])
+def backend(request, tmp_path):
+    """Each session backend implementation."""
+    if request.param == "memory":
+        yield InMemorySessionBackend()
+    else:
+        store = SQLiteSessionBackend(str(tmp_path / "sessions.db"))
+        yield store
+        store.close()
+
+
+def test_session_codec_round_trip():
+    """Test encoding and decoding preserves documents and embeddings."""
+    manager = SessionManager(ttl_minutes=5)
+    session = manager.create_session("codec-1", "resume")
+    session.add_document(make_document("resume"))
+
+    decoded = decode_session(encode_session(session))
+
+    assert decoded.session_id == session.session_id
+    assert decoded.expires_at == session.expires_at
+    assert decoded.chunks == session.chunks
+    assert (
+        decoded.documents["resume"].embeddings == session.documents["resume"].embeddings
+    ).all()
+    # The lexical index isn't stored; it is rebuilt from the chunks
+    assert "skills" not in decoded.documents["resume"].lexical_index.postings
+    assert "resume" in decoded.documents["resume"].lexical_index.postings
+
+
+def test_backend_contract(backend):
+    """Test every backend stores, updates and deletes sessions."""
+    manager = SessionManager(ttl_minutes=5, backend=backend)
+    session = manager.create_session("backend-1", "resume")
+    session.add_document(make_document("resume"))
+    manager.save_session(session)
+
+    loaded = manager.get_session("backend-1")
+    assert [c.id for c in loaded.chunks] == ["resume-0", "resume-1", "resume-2"]
+    assert manager.stats()["active_sessions"] == 1
+
+    assert manager.delete_session("backend-1") is True
+    assert manager.get_session("backend-1") is None
+
+
+def test_sqlite_backend_shares_sessions_between_managers(tmp_path):
+    """Test two managers (as two workers) see each other's sessions."""
+    path = str(tmp_path / "shared.db")
+    worker_a = SessionManager(ttl_minutes=5, backend=SQLiteSessionBackend(path))
+    worker_b = SessionManager(ttl_minutes=5, backend=SQLiteSessionBackend(path))
+
+    worker_a.create_session("shared-1", "resume")
+    session = worker_b.get_session("shared-1")
+    assert session is not None
+
+    session.add_document(make_document("jd"))
+    worker_b.save_session(session)
+    assert list(worker_a.get_session("shared-1").documents) == ["jd"]
+
+    worker_a.delete_session("shared-1")
+    assert worker_b.get_session("shared-1") is None
+
+
+def test_sqlite_concurrent_updates_from_two_workers_are_not_lost(tmp_path):
+    """Test a stale save is refused and update_session re-applies the change."""
+    path = str(tmp_path / "shared.db")
+    worker_a = SessionManager(ttl_minutes=5, backend=SQLiteSessionBackend(path))
+    worker_b = SessionManager(ttl_minutes=5, backend=SQLiteSessionBackend(path))
+    worker_a.create_session("race-1", "resume")
+
+    # Both workers load the same version before either writes
+    session_a = worker_a.get_session("race-1")
+    session_b = worker_b.get_session("race-1")
+    session_a.add_document(make_document("resume"))
+    worker_a.save_session(session_a)
+
+    session_b.add_document(make_document("jd"))
+    with pytest.raises(SessionConflictError):
+        worker_b.save_session(session_b)
+
+    worker_b.update_session(
+        "race-1", lambda current: current.add_document(make_document("jd"))
+    )
+    assert sorted(worker_a.get_session("race-1").documents) == ["jd", "resume"]
+    assert sorted(worker_b.get_session("race-1").documents) == ["jd", "resume"]
+
+
+def test_sqlite_workers_only_delete_sessions_confirmed_expired(tmp_path):
+    """Test eviction and stale expiry in one worker don't delete shared sessions."""
+    path = str(tmp_path / "shared.db")
+    worker_a = SessionManager(
+        ttl_minutes=1, memory_budget_bytes=1, backend=SQLiteSessionBackend(path)
+    )
+    worker_b = SessionManager(
+        ttl_minutes=10, sliding_ttl=True, backend=SQLiteSessionBackend(path)
+    )
+
+    # Worker A's tiny budget evicts its own copy of the older session
+    worker_a.create_session("evicted", "resume")
+    worker_a.create_session("newer", "resume")
+    assert worker_a.stats()["evictions"] == 1
+    assert worker_b.get_session("evicted") is not None
+
+    # Worker B slides the TTL, so worker A's copy is stale at its expiry
+    worker_b.get_session("newer")
+    assert worker_a.purge_expired(now=time.time() + 120) == 0
+    assert worker_b.get_session("newer", touch=False) is not None
+
+    # Past worker B's deadline: confirmed by the backend, so deleted
+    assert worker_a.purge_expired(now=time.time() + 700) == 2
+    assert worker_b.get_session("newer") is None
@@ -0,0 +1,122 @@
+"""Unit tests for single-flight request coalescing."""
+import asyncio
+import time
+
+import pytest
+
+from app.core.exceptions import DeadlineExceededError
+from app.core.request_scheduler import Priority, request_class
+from app.core.single_flight import SingleFlight
+
+
+class SlowCall:
+    """Counts invocations and finishes when released."""
+
+    def __init__(self, result="done", error: Exception | None = None):
+        self.calls = 0
+        self.release = asyncio.Event()
+        self.result = result
+        self.error = error
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        if self.error:
+            raise self.error
+        return self.result
+
+
+@pytest.mark.asyncio
+async def test_duplicate_calls_share_one_execution():
+    """Concurrent identical requests in a session run once."""
+    flight = SingleFlight()
+    call = SlowCall()
+
+    async def ask():
+        with request_class(Priority.INTERACTIVE, "s1"):
+            return await flight.do("generate", "same prompt", call)
+
+    tasks = [asyncio.create_task(ask()) for _ in range(3)]
+    await asyncio.sleep(0)
+    call.release.set()
+
+    assert await asyncio.gather(*tasks) == ["done", "done", "done"]
+    assert call.calls == 1
+    assert flight.stats() == {"generate": {"executed": 1, "coalesced": 2}}
+
+    # Once finished, the key is free again
+    assert await flight.do("generate", "same prompt", call, "s1") == "done"
+    assert call.calls == 2
+
+
+@pytest.mark.asyncio
+async def test_sessions_and_payloads_are_kept_apart():
+    """Different sessions or payloads never share a call."""
+    flight = SingleFlight()
+    call = SlowCall()
+    call.release.set()
+
+    await asyncio.gather(
+        flight.do("generate", "prompt", call, "s1"),
+        flight.do("generate", "prompt", call, "s2"),
+        flight.do("generate", "other", call, "s1"),
+    )
+
+    assert call.calls == 3
+
+
+@pytest.mark.asyncio
+async def test_errors_reach_all_waiters_and_cancellation_is_isolated():
+    """A failure is shared; one caller giving up doesn't cancel the others."""
+    flight = SingleFlight()
+    call = SlowCall(error=RuntimeError("quota"))
+
+    first = asyncio.create_task(flight.do("query_embedding", "q", call, "s1"))
+    second = asyncio.create_task(flight.do("query_embedding", "q", call, "s1"))
+    await asyncio.sleep(0)
+    first.cancel()
+    await asyncio.sleep(0)
+    call.release.set()
+
+    with pytest.raises(RuntimeError):
+        await second
+    assert first.cancelled()
+    assert call.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_each_caller_waits_only_until_its_own_deadline():
+    """A short deadline fails its caller without cutting off a longer one."""
+    flight = SingleFlight()
+    call = SlowCall()
+
+    short = asyncio.create_task(
+        flight.do("generate", "p", call, "s1", deadline=time.monotonic() + 0.01)
+    )
+    long = asyncio.create_task(
+        flight.do("generate", "p", call, "s1", deadline=time.monotonic() + 5)
+    )
+    with pytest.raises(DeadlineExceededError):
+        await short
+    call.release.set()
+
+    assert await long == "done"
+    assert call.calls == 1
+
+
+@pytest.mark.asyncio
+async def test_shared_call_is_cancelled_once_every_caller_gives_up():
+    """Work nobody is waiting for any more doesn't keep running."""
+    flight = SingleFlight()
+    call = SlowCall()
+
+    waiter = asyncio.create_task(flight.do("generate", "p", call, "s1"))
+    await asyncio.sleep(0)
+    (shared,) = flight._calls.values()
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    await asyncio.sleep(0)
+
+    assert shared.cancelled()
+    assert flight._calls == {}
@@ -0,0 +1,111 @@
+"""Unit tests for vector search."""
+from app.services.vector_search.bm25 import build_bm25_index, tokenize
+from app.services.vector_search.searcher import VectorSearchService
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.session import SessionDocument
+
+
+def make_document(name: str, vectors) -> SessionDocument:
+    chunks = [
+        Chunk(id=f"{name}-{i}", text=f"{name} {i}", index=i, metadata=ChunkMetadata())
+        for i in range(len(vectors))
+    ]
+    return SessionDocument(
+        name=name, source_type=name, chunks=chunks, embeddings=vectors
+    )
+
+
+def test_search_ranks_by_cosine_similarity():
+    """Test flat search returns the closest chunks first."""
+    document = make_document("resume", [[1.0, 0.0], [0.0, 1.0], [0.7, 0.7]])
+    results = VectorSearchService().search(
+        query_embedding=[1.0, 0.1],
+        document_embeddings=document.embeddings.tolist(),
+        chunks=document.chunks,
+        top_k=2,
+    )
+    assert [r.chunk_id for r in results] == ["resume-0", "resume-2"]
+
+
+def test_search_documents_merges_segments():
+    """Test search spans every selected document segment."""
+    resume = make_document("resume", [[1.0, 0.0], [0.0, 1.0]])
+    jd = make_document("jd", [[0.9, 0.1], [0.1, 0.9]])
+    results = VectorSearchService().search_documents(
+        query_embedding=[0.0, 1.0], documents=[resume, jd], top_k=2
+    )
+    assert [r.chunk_id for r in results] == ["resume-1", "jd-1"]
+    assert [r.document for r in results] == ["resume", "jd"]
+
+
+def test_search_documents_handles_empty_document():
+    """Test documents without chunks are skipped."""
+    empty = make_document("jd", [])
+    assert VectorSearchService().search_documents([1.0, 0.0], [empty]) == []
+
+
+def test_vector_codec_round_trip():
+    """Test base64 float32 encoding round-trips a vector."""
+    from app.utils.vector_codec import decode_vector, encode_vector
+
+    vector = [0.25, -1.5, 3.0]
+    assert decode_vector(encode_vector(vector)).tolist() == vector
+
+
+def make_lexical_document(name: str, texts, vectors) -> SessionDocument:
+    chunks = [
+        Chunk(id=f"{name}-{i}", text=text, index=i, metadata=ChunkMetadata())
+        for i, text in enumerate(texts)
+    ]
+    return SessionDocument(
+        name=name,
+        source_type=name,
+        chunks=chunks,
+        embeddings=vectors,
+        lexical_index=build_bm25_index(chunks),
+    )
+
+
+def test_tokenize_keeps_technology_names():
+    """Test tokens like C++ and Node.js survive tokenization."""
+    assert tokenize("Built APIs in C++, C# and Node.js.") == [
+        "built",
+        "apis",
+        "c++",
+        "c#",
+        "node.js",
+    ]
+
+
+def test_lexical_search_ranks_exact_keywords():
+    """Test BM25 finds the chunk naming a certification, without a vector."""
+    resume = make_lexical_document(
+        "resume",
+        [
+            "Led a team of engineers building web services",
+            "Certified Kubernetes Administrator (CKA), 2022",
+            "Hobbies include hiking and chess",
+        ],
+        [[1.0, 0.0], [0.0, 1.0], [0.5, 0.5]],
+    )
+    results = VectorSearchService().lexical_search("CKA certification", [resume], 3)
+    assert [r.chunk_id for r in results] == ["resume-1"]
+    assert results[0].score == 1.0
+
+
+def test_hybrid_search_fuses_vector_and_lexical_rankings():
+    """Test a chunk ranked well by both signals beats a vector-only match."""
+    resume = make_lexical_document(
+        "resume",
+        ["Team leadership", "Python and Django backend work", "Hobbies"],
+        [[0.8, 0.6], [0.6, 0.8], [0.0, 1.0]],
+    )
+    service = VectorSearchService()
+    query_vector = [1.0, 0.0]
+
+    vector_only = service.search_documents(query_vector, [resume], 3)
+    hybrid = service.hybrid_search(query_vector, "python django", [resume], 3)
+
+    assert [r.chunk_id for r in vector_only][:2] == ["resume-0", "resume-1"]
+    assert [r.chunk_id for r in hybrid][:2] == ["resume-1", "resume-0"]
+    assert all(0 < r.score <= 1 for r in hybrid)
@@ -0,0 +1,98 @@
+"""Unit tests for background answer precomputation."""
+import asyncio
+
+import pytest
+
+from app.api.models.rag import RAGRequest
+from app.core.config import settings
+from app.core.session_manager import session_manager
+from app.services.rag.pipeline import RAGPipeline, answer_cache_key
+from app.services.rag.warmup import WarmupService
+from app.types.chunk import Chunk, ChunkMetadata
+from app.types.rag import RAGResponse
+from app.types.session import SessionDocument
+
+
+class FakePipeline(RAGPipeline):
+    """Pipeline whose answer step is local and counted."""
+
+    def __init__(self, delay: float = 0.0):
+        self.calls = []
+        self.delay = delay
+
+    async def answer(
+        self, session, query, top_k=None, documents=None, retrieval_mode=None
+    ):
+        self.calls.append(query)
+        if self.delay:
+            await asyncio.sleep(self.delay)
+        return RAGResponse(answer=f"answer: {query}", sources=[], confidence=0.5)
+
+
+def make_session(session_id: str):
+    session = session_manager.create_session(session_id, "resume")
+    chunk = Chunk(id="c-0", text="Python developer", index=0, metadata=ChunkMetadata())
+    session.add_document(
+        SessionDocument(
+            name="resume", source_type="resume", chunks=[chunk], embeddings=[[1.0]]
+        )
+    )
+    return session
+
+
+@pytest.mark.asyncio
+async def test_warmup_precomputes_answers_for_the_pipeline():
+    """Test warm-up answers are cached and served on a matching question."""
+    session = make_session("warmup-done")
+    pipeline = FakePipeline()
+    service = WarmupService(
+        pipeline_factory=lambda: pipeline,
+        questions=["Summarize this document", "Top skills?"],
+        interval_seconds=0,
+    )
+
+    await service.schedule("warmup-done")
+
+    assert session.warmup.state == "done"
+    assert session.warmup.completed == 2
+    served = await RAGPipeline.answer(pipeline, session, "summarize this document!")
+    assert served.answer == "answer: Summarize this document"
+    # Requests with other options don't get answers computed for the defaults
+    other_mode = "lexical" if settings.retrieval_mode != "lexical" else "vector"
+    assert answer_cache_key("Top skills?", settings.default_top_k, other_mode) not in (
+        session.answer_cache
+    )
+    assert RAGRequest(session_id="warmup-done", query="Top skills?").top_k is None
+    session_manager.delete_session("warmup-done")
+
+
+@pytest.mark.asyncio
+async def test_warmup_cancelled_with_session():
+    """Test cancelling stops the job before it finishes."""
+    session = make_session("warmup-cancel")
+    service = WarmupService(
+        pipeline_factory=lambda: FakePipeline(delay=1),
+        questions=["Summarize this document"],
+        interval_seconds=0,
+    )
+
+    task = service.schedule("warmup-cancel")
+    await asyncio.sleep(0.01)
+    assert service.cancel("warmup-cancel") is True
+    with pytest.raises(asyncio.CancelledError):
+        await task
+
+    assert session.warmup.state == "cancelled"
+    assert session.answer_cache == {}
+    session_manager.delete_session("warmup-cancel")
+
+
+def test_ingestion_clears_answer_cache():
+    """Test adding a document invalidates precomputed answers."""
+    session = make_session("warmup-stale")
+    session.answer_cache = {"key": RAGResponse(answer="old", sources=[], confidence=1)}
+    session.add_document(
+        SessionDocument(name="jd", source_type="jd", chunks=[], embeddings=[])
+    )
+    assert session.answer_cache == {}
+    session_manager.delete_session("warmup-stale")